@@ -1,14 +1,22 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import random
+from cost_model import HOURS_PER_DAY, WORKING_DAYS_PER_YEAR, day_rates, location_rates
+from demand_forecast import demand_forecaster
+from figure_cache import cached_figure
 
-def show_advanced_analytics(df):
-    """Advanced Analytics Dashboard with predictive insights and Swiss banking focus"""
+def show_advanced_analytics(df, seed=None, version=None):
+    """Advanced Analytics Dashboard with predictive insights and Swiss banking focus.
+
+    `seed` (int or numpy Generator) drives the simulated demand history so
+    reruns are reproducible without touching the global NumPy random state.
+    When `version` identifies `df` and `seed`, fitted forecasts and charts are
+    served from their caches.
+    """
     
     st.markdown("## 📊 Advanced Analytics Dashboard")
     st.markdown("### Swiss Banking Intelligence & Predictive Insights")
@@ -22,137 +30,119 @@ def show_advanced_analytics(df):
     ])
     
     with tab1:
-        show_predictive_analytics(df)
+        show_predictive_analytics(df, seed, version)
     
     with tab2:
-        show_cost_optimization(df)
+        show_cost_optimization(df, version)
     
     with tab3:
-        show_compliance_metrics(df)
+        show_compliance_metrics(df, version)
     
     with tab4:
-        show_performance_insights(df)
+        show_performance_insights(df, version)
 
-def show_predictive_analytics(df):
-    """Predictive analytics for talent demand and market trends"""
+def show_predictive_analytics(df, seed=None, version=None):
+    """Talent demand forecast per project type (see demand_forecast)"""
     
     st.markdown("### 🎯 Predictive Analytics")
     
-    # Simulate predictive data
-    np.random.seed(42)
-    months = pd.date_range(start='2024-01-01', end='2025-12-31', freq='M')
-    
-    # UBS Integration demand prediction
-    ubs_demand = np.random.normal(150, 20, len(months)) + np.sin(np.arange(len(months)) * 0.3) * 30
-    ubs_demand = np.maximum(ubs_demand, 100)
-    
-    # CS Integration demand prediction
-    cs_demand = np.random.normal(120, 15, len(months)) + np.cos(np.arange(len(months)) * 0.2) * 25
-    cs_demand = np.maximum(cs_demand, 80)
-    
-    # Create prediction dataframe
-    prediction_df = pd.DataFrame({
-        'Month': months,
-        'UBS_Integration_Demand': ubs_demand,
-        'CS_Integration_Demand': cs_demand,
-        'Total_Demand': ubs_demand + cs_demand
-    })
-    
-    # Demand prediction chart
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=prediction_df['Month'], 
-        y=prediction_df['UBS_Integration_Demand'],
-        name='UBS Integration',
-        line=dict(color='#0072C6', width=3)
-    ))
-    fig.add_trace(go.Scatter(
-        x=prediction_df['Month'], 
-        y=prediction_df['CS_Integration_Demand'],
-        name='CS Integration',
-        line=dict(color='#00A651', width=3)
-    ))
-    fig.add_trace(go.Scatter(
-        x=prediction_df['Month'], 
-        y=prediction_df['Total_Demand'],
-        name='Total Demand',
-        line=dict(color='#FF6B35', width=4, dash='dash')
-    ))
-    
-    fig.update_layout(
-        title='📈 Swiss Banking Talent Demand Forecast (2024-2025)',
-        xaxis_title='Month',
-        yaxis_title='Demand (Associates)',
-        hovermode='x unified',
-        template='plotly_white'
-    )
+    # Holt models for every Project_Type x Skill series, fitted once per dataset version
+    forecaster = demand_forecaster(df, version, seed=42 if seed is None else seed)
+    history = forecaster.history_frame().groupby(level='Project_Type', observed=True).sum()
+    forecast = forecaster.forecast(12).groupby(level='Project_Type', observed=True).sum()
+    leaders = history.iloc[:, -1].nlargest(2).index.tolist()
+    total_history = history.sum()
+    total_forecast = forecast.sum()
+    
+    def build_demand_forecast():
+        # Observed demand (solid) continued by the forecast (dotted)
+        fig = go.Figure()
+        series = [(name, history.loc[name], forecast.loc[name], color, 3)
+                  for name, color in zip(leaders, ['#0072C6', '#00A651'])]
+        series.append(('Total Demand', total_history, total_forecast, '#FF6B35', 4))
+        for name, observed, predicted, color, width in series:
+            fig.add_trace(go.Scatter(
+                x=observed.index,
+                y=observed.values,
+                name=name,
+                legendgroup=name,
+                line=dict(color=color, width=width)
+            ))
+            fig.add_trace(go.Scatter(
+                x=[observed.index[-1], *predicted.index],
+                y=[observed.iloc[-1], *predicted.values],
+                name=f'{name} (forecast)',
+                legendgroup=name,
+                line=dict(color=color, width=width, dash='dot')
+            ))
+        
+        fig.update_layout(
+            title=f'📈 Swiss Banking Talent Demand Forecast ({history.columns[0].year}-{forecast.columns[-1].year})',
+            xaxis_title='Month',
+            yaxis_title='Demand (Associates)',
+            hovermode='x unified',
+            template='plotly_white'
+        )
+        return fig
+    
+    fig = cached_figure("analytics_demand_forecast", version, build_demand_forecast,
+                        start=history.columns[0], end=forecast.columns[-1])
     
     st.plotly_chart(fig, use_container_width=True)
     
     # Key insights
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "Peak UBS Demand", 
-            f"{int(prediction_df['UBS_Integration_Demand'].max())}",
-            f"+{int(prediction_df['UBS_Integration_Demand'].max() - prediction_df['UBS_Integration_Demand'].min())} from baseline"
-        )
+    columns = st.columns(3)
     
-    with col2:
-        st.metric(
-            "Peak CS Demand", 
-            f"{int(prediction_df['CS_Integration_Demand'].max())}",
-            f"+{int(prediction_df['CS_Integration_Demand'].max() - prediction_df['CS_Integration_Demand'].min())} from baseline"
-        )
+    for column, name in zip(columns, leaders):
+        with column:
+            st.metric(
+                f"Peak {name} Demand",
+                f"{int(forecast.loc[name].max())}",
+                f"{int(forecast.loc[name].max() - history.loc[name].iloc[-1]):+d} vs current"
+            )
     
-    with col3:
+    with columns[2]:
         st.metric(
             "Total Peak Demand", 
-            f"{int(prediction_df['Total_Demand'].max())}",
-            f"Combined Swiss banking expertise"
+            f"{int(total_forecast.max())}",
+            f"Next {len(total_forecast)} months, {len(forecaster.series)} demand series"
         )
 
-def show_cost_optimization(df):
-    """Cost optimization insights and recommendations"""
+def show_cost_optimization(df, version=None):
+    """Cost optimization insights and recommendations (rates from cost_model)"""
     
     st.markdown("### 💰 Cost Optimization Insights")
     
-    # Calculate cost optimization metrics based on experience years and location
-    # Simulate rates based on experience and location
-    df['simulated_rate'] = df['Experience_Years'] * 50 + np.random.normal(0, 20, len(df))
-    df.loc[df['Location'] == 'Zurich', 'simulated_rate'] *= 1.8  # Zurich premium
-    df.loc[df['Location'] == 'Pune', 'simulated_rate'] *= 0.6    # Pune discount
-    
-    current_avg_rate = df['simulated_rate'].mean()
-    zurich_avg_rate = df[df['Location'] == 'Zurich']['simulated_rate'].mean()
-    pune_avg_rate = df[df['Location'] == 'Pune']['simulated_rate'].mean()
+    # Headcount-weighted rates per location, derived from the role rate card
+    rates = location_rates(df)
+    hourly = rates['Hourly_Rate']
+    zurich_avg_rate = hourly.get('Zurich', np.nan)
+    pune_avg_rate = hourly.get('Pune', np.nan)
     
     # Cost savings potential
     savings_per_hour = zurich_avg_rate - pune_avg_rate
-    annual_savings = savings_per_hour * 8 * 220  # 8 hours/day, 220 working days
-    
-    # Create cost comparison chart
-    locations = ['Zurich', 'Pune', 'Bangalore', 'Chennai']
-    avg_rates = [
-        df[df['Location'] == loc]['simulated_rate'].mean() 
-        for loc in locations if len(df[df['Location'] == loc]) > 0
-    ]
-    locations = [loc for loc in locations if len(df[df['Location'] == loc]) > 0]
-    
-    fig = px.bar(
-        x=locations,
-        y=avg_rates,
-        title='💵 Average Hourly Rates by Location',
-        color=avg_rates,
-        color_continuous_scale='RdYlGn_r'
-    )
-    
-    fig.update_layout(
-        xaxis_title='Location',
-        yaxis_title='Average Rate (CHF/hour)',
-        template='plotly_white'
-    )
+    annual_savings = savings_per_hour * HOURS_PER_DAY * WORKING_DAYS_PER_YEAR
+    
+    def build_location_rates():
+        # Create cost comparison chart
+        by_rate = hourly.sort_values(ascending=False)
+        
+        fig = px.bar(
+            x=by_rate.index,
+            y=by_rate.values,
+            title='💵 Average Hourly Rates by Location',
+            color=by_rate.values,
+            color_continuous_scale='RdYlGn_r'
+        )
+        
+        fig.update_layout(
+            xaxis_title='Location',
+            yaxis_title='Average Rate (CHF/hour)',
+            template='plotly_white'
+        )
+        return fig
+    
+    fig = cached_figure("analytics_location_rates", version, build_location_rates)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -179,22 +169,27 @@ def show_cost_optimization(df):
     with col2:
         st.markdown("#### 📊 Cost Breakdown")
         
-        # Create pie chart for cost distribution
-        cost_data = {
-            'Zurich Associates': len(df[df['Location'] == 'Zurich']) * zurich_avg_rate * 8 * 220,
-            'Pune Associates': len(df[df['Location'] == 'Pune']) * pune_avg_rate * 8 * 220,
-            'Other Locations': len(df[~df['Location'].isin(['Zurich', 'Pune'])]) * current_avg_rate * 8 * 220
-        }
+        def build_cost_distribution():
+            # Create pie chart for cost distribution
+            annual_cost = rates['Annual_Cost']
+            cost_data = {
+                'Zurich Associates': annual_cost.get('Zurich', 0),
+                'Pune Associates': annual_cost.get('Pune', 0),
+                'Other Locations': annual_cost.drop(['Zurich', 'Pune'], errors='ignore').sum()
+            }
+            
+            fig = px.pie(
+                values=list(cost_data.values()),
+                names=list(cost_data.keys()),
+                title='Annual Cost Distribution'
+            )
+            return fig
         
-        fig = px.pie(
-            values=list(cost_data.values()),
-            names=list(cost_data.keys()),
-            title='Annual Cost Distribution'
-        )
+        fig = cached_figure("analytics_cost_distribution", version, build_cost_distribution)
         
         st.plotly_chart(fig, use_container_width=True)
 
-def show_compliance_metrics(df):
+def show_compliance_metrics(df, version=None):
     """Swiss banking compliance metrics and regulatory insights"""
     
     st.markdown("### 🏦 Swiss Banking Compliance Metrics")
@@ -209,26 +204,30 @@ def show_compliance_metrics(df):
         'Risk Management': 96.3
     }
     
-    # Compliance radar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=list(compliance_data.values()),
-        theta=list(compliance_data.keys()),
-        fill='toself',
-        name='Compliance Score',
-        line_color='#0072C6'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[90, 100]
-            )),
-        showlegend=False,
-        title='🏦 Swiss Banking Compliance Metrics'
-    )
+    def build_compliance_radar():
+        # Compliance radar chart
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatterpolar(
+            r=list(compliance_data.values()),
+            theta=list(compliance_data.keys()),
+            fill='toself',
+            name='Compliance Score',
+            line_color='#0072C6'
+        ))
+        
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[90, 100]
+                )),
+            showlegend=False,
+            title='🏦 Swiss Banking Compliance Metrics'
+        )
+        return fig
+    
+    fig = cached_figure("analytics_compliance_radar", version, build_compliance_radar)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -254,42 +253,46 @@ def show_compliance_metrics(df):
     with col2:
         st.markdown("#### 🔍 Regulatory Insights")
         
-        # Experience distribution (using Experience_Years instead of certifications)
-        exp_data = df['Experience_Years'].value_counts().sort_index()
+        def build_experience_bars():
+            # Experience distribution (using Experience_Years instead of certifications)
+            exp_data = df['Experience_Years'].value_counts().sort_index()
+            
+            fig = px.bar(
+                x=exp_data.index,
+                y=exp_data.values,
+                title='Experience Years Distribution',
+                labels={'x': 'Years of Experience', 'y': 'Number of Associates'}
+            )
+            return fig
         
-        fig = px.bar(
-            x=exp_data.index,
-            y=exp_data.values,
-            title='Experience Years Distribution',
-            labels={'x': 'Years of Experience', 'y': 'Number of Associates'}
-        )
+        fig = cached_figure("analytics_experience_bars", version, build_experience_bars)
         
         st.plotly_chart(fig, use_container_width=True)
 
-def show_performance_insights(df):
+def show_performance_insights(df, version=None):
     """Performance analytics and team insights"""
     
     st.markdown("### 📈 Performance Insights")
     
-    # Performance metrics by location
-    performance_metrics = df.groupby('Location').agg({
-        'Experience_Years': 'mean',
-        'simulated_rate': 'mean',
-        'Count': 'sum'
-    }).round(2)
-    
-    # Performance heatmap
-    fig = px.imshow(
-        performance_metrics.T,
-        title='🏆 Performance Metrics by Location',
-        aspect='auto',
-        color_continuous_scale='RdYlGn'
-    )
-    
-    fig.update_layout(
-        xaxis_title='Location',
-        yaxis_title='Metrics'
-    )
+    def build_location_performance():
+        # Performance metrics by location
+        performance_metrics = location_rates(df)[['Experience_Years', 'Day_Rate', 'Headcount']].round(2)
+        
+        # Performance heatmap
+        fig = px.imshow(
+            performance_metrics.T,
+            title='🏆 Performance Metrics by Location',
+            aspect='auto',
+            color_continuous_scale='RdYlGn'
+        )
+        
+        fig.update_layout(
+            xaxis_title='Location',
+            yaxis_title='Metrics'
+        )
+        return fig
+    
+    fig = cached_figure("analytics_location_performance", version, build_location_performance)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -299,32 +302,40 @@ def show_performance_insights(df):
     with col1:
         st.markdown("#### 🎯 Top Performers")
         
-        # Top 5 by experience and count
-        top_performers = df.nlargest(5, ['Experience_Years', 'Count'])
+        def build_top_performers():
+            # Top 5 by experience and count
+            top_performers = df.nlargest(5, ['Experience_Years', 'Count'])
+            
+            fig = px.scatter(
+                top_performers,
+                x='Experience_Years',
+                y='Count',
+                size=day_rates(top_performers),
+                color='Location',
+                hover_data=['Role'],
+                title='Top Performers by Experience & Team Size'
+            )
+            return fig
         
-        fig = px.scatter(
-            top_performers,
-            x='Experience_Years',
-            y='Count',
-            size='simulated_rate',
-            color='Location',
-            hover_data=['Role'],
-            title='Top Performers by Experience & Team Size'
-        )
+        fig = cached_figure("analytics_top_performers", version, build_top_performers)
         
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### 📊 Skill Distribution")
         
-        # Skill distribution
-        skill_dist = df['Skill'].value_counts()
+        def build_skill_distribution():
+            # Skill distribution
+            skill_dist = df['Skill'].value_counts()
+            
+            fig = px.pie(
+                values=skill_dist.values,
+                names=skill_dist.index,
+                title='Skills Distribution'
+            )
+            return fig
         
-        fig = px.pie(
-            values=skill_dist.values,
-            names=skill_dist.index,
-            title='Skills Distribution'
-        )
+        fig = cached_figure("analytics_skill_distribution", version, build_skill_distribution)
         
         st.plotly_chart(fig, use_container_width=True)
     
@@ -1,19 +1,12 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
-import base64
-from io import BytesIO
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 import time
-from advanced_analytics import show_advanced_analytics
-import qrcode
-from PIL import Image as PILImage
+from latency import LATENCY, SHOW_TIMINGS, simulate_latency
+from static_assets import APP_URL, qr_png, theme_html
+
+# Wall-clock start of this rerun, recorded per page at the end of the script
+RUN_STARTED = time.perf_counter()
 
 # Page configuration
 st.set_page_config(
@@ -23,1162 +16,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# DROPDOWN VISIBILITY FIX - Apply immediately after page config
-dropdown_style_fix = """
-<style>
-    /* Force all selectbox text to be visible with maximum specificity */
-    
-    /* Main container fix */
-    .stSelectbox > div > div {
-        background-color: #f8f9fa !important;
-    }
-    
-    /* The input field that shows selected value */
-    .stSelectbox [data-baseweb="select"] [data-baseweb="input"] {
-        color: black !important;
-        -webkit-text-fill-color: black !important;
-        opacity: 1 !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Alternative selector for the displayed value */
-    .stSelectbox [data-baseweb="select"] > div > div > div:first-child {
-        color: black !important;
-        -webkit-text-fill-color: black !important;
-        opacity: 1 !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* The actual value container */
-    div[data-baseweb="select"] [class*="valueContainer"] {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Single value display */
-    div[data-baseweb="select"] [class*="singleValue"] {
-        color: black !important;
-        opacity: 1 !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* For the placeholder text */
-    div[data-baseweb="select"] [class*="placeholder"] {
-        color: #666666 !important;
-        opacity: 1 !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Target the specific baseweb classes */
-    [class*="css"][class*="singleValue"] {
-        color: black !important;
-        -webkit-text-fill-color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Override any inherited styles */
-    .stSelectbox * {
-        color: inherit !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    .stSelectbox [data-baseweb="select"] * {
-        -webkit-text-fill-color: initial !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Ensure text is visible in all states */
-    .stSelectbox [data-baseweb="select"]:not([data-baseweb="popover"]) {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Target the input specifically */
-    .stSelectbox input[aria-autocomplete="list"] {
-        color: black !important;
-        -webkit-text-fill-color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* For any div containing the selected text */
-    .stSelectbox [data-baseweb="select"] > div:first-child > div:first-child {
-        color: black !important;
-        -webkit-text-fill-color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Additional fix for nested divs */
-    .stSelectbox [data-baseweb="select"] div[style*="color"] {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Override inline styles */
-    .stSelectbox [style*="color: rgb(255, 255, 255)"] {
-        color: black !important;
-    }
-    
-    /* Dropdown menu items (these should remain visible) */
-    div[data-baseweb="popover"] li {
-        color: black !important;
-        background-color: white !important;
-    }
-    
-    div[data-baseweb="popover"] li:hover {
-        background-color: #f0f7ff !important;
-        color: #0072C6 !important;
-    }
-    
-    /* Enhanced fixes for Safari and Chrome */
-    .stSelectbox [data-baseweb="select"] div[role="combobox"] {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    .stSelectbox [data-baseweb="select"] div[aria-expanded] {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Fix for radio buttons in sidebar */
-    .stSidebar .stRadio > label {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    .stSidebar .stRadio > div[role="radiogroup"] > label {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Fix for multiselect */
-    .stMultiSelect [data-baseweb="select"] {
-        color: black !important;
-        background-color: #f8f9fa !important;
-    }
-    
-    /* Force all text in selectboxes to be black */
-    .stSelectbox * {
-        color: black !important;
-    }
-    
-    /* Override any white text */
-    .stSelectbox [style*="color: white"],
-    .stSelectbox [style*="color: rgb(255, 255, 255)"],
-    .stSelectbox [style*="color: #ffffff"] {
-        color: black !important;
-    }
-    
-    /* SIDEBAR NAVIGATION FIXES - Ensure sidebar text is readable */
-    /* Target all possible sidebar selectors */
-    .css-1d391kg, .css-1lcbmhc, .css-1wivap2,
-    [data-testid="stSidebar"],
-    [data-testid="stSidebarNav"],
-    .stSidebar,
-    .css-1d391kg *,
-    [data-testid="stSidebar"] *,
-    [data-testid="stSidebarNav"] *,
-    .stSidebar * {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* Force all text in sidebar to be white */
-    .css-1d391kg p,
-    .css-1d391kg span,
-    .css-1d391kg div,
-    .css-1d391kg label,
-    .css-1d391kg a,
-    [data-testid="stSidebar"] p,
-    [data-testid="stSidebar"] span,
-    [data-testid="stSidebar"] div,
-    [data-testid="stSidebar"] label,
-    [data-testid="stSidebar"] a,
-    [data-testid="stSidebarNav"] p,
-    [data-testid="stSidebarNav"] span,
-    [data-testid="stSidebarNav"] div,
-    [data-testid="stSidebarNav"] label,
-    [data-testid="stSidebarNav"] a,
-    .stSidebar p,
-    .stSidebar span,
-    .stSidebar div,
-    .stSidebar label,
-    .stSidebar a {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* Navigation links specifically */
-    .css-1d391kg a,
-    [data-testid="stSidebar"] a,
-    [data-testid="stSidebarNav"] a,
-    .stSidebar a {
-        color: white !important;
-        background-color: transparent !important;
-        text-decoration: none !important;
-    }
-    
-    /* Navigation items on hover */
-    .css-1d391kg *:hover,
-    [data-testid="stSidebar"] *:hover,
-    [data-testid="stSidebarNav"] *:hover,
-    .stSidebar *:hover {
-        color: #f0f0f0 !important;
-        background-color: rgba(255, 255, 255, 0.1) !important;
-    }
-    
-    /* Active navigation item */
-    .css-1d391kg [aria-selected="true"],
-    [data-testid="stSidebar"] [aria-selected="true"],
-    [data-testid="stSidebarNav"] [aria-selected="true"],
-    .stSidebar [aria-selected="true"] {
-        color: white !important;
-        background-color: rgba(255, 255, 255, 0.2) !important;
-    }
-    
-    /* Ensure sidebar icons are visible */
-    .css-1d391kg svg,
-    [data-testid="stSidebar"] svg,
-    [data-testid="stSidebarNav"] svg,
-    .stSidebar svg {
-        color: white !important;
-        fill: white !important;
-    }
-    
-    /* Sidebar section headers */
-    .css-1d391kg h1,
-    .css-1d391kg h2,
-    .css-1d391kg h3,
-    .css-1d391kg h4,
-    .css-1d391kg h5,
-    .css-1d391kg h6,
-    [data-testid="stSidebar"] h1,
-    [data-testid="stSidebar"] h2,
-    [data-testid="stSidebar"] h3,
-    [data-testid="stSidebar"] h4,
-    [data-testid="stSidebar"] h5,
-    [data-testid="stSidebar"] h6,
-    [data-testid="stSidebarNav"] h1,
-    [data-testid="stSidebarNav"] h2,
-    [data-testid="stSidebarNav"] h3,
-    [data-testid="stSidebarNav"] h4,
-    [data-testid="stSidebarNav"] h5,
-    [data-testid="stSidebarNav"] h6,
-    .stSidebar h1,
-    .stSidebar h2,
-    .stSidebar h3,
-    .stSidebar h4,
-    .stSidebar h5,
-    .stSidebar h6 {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* Override any inline styles that might be causing issues */
-    [style*="color: black"],
-    [style*="color: rgb(0, 0, 0)"],
-    [style*="color: #000000"] {
-        color: white !important;
-    }
-    
-    /* Force all text in sidebar to be white regardless of any other styles */
-    .css-1d391kg *,
-    [data-testid="stSidebar"] *,
-    [data-testid="stSidebarNav"] *,
-    .stSidebar * {
-        color: white !important;
-    }
-    
-    /* COMPLETE SIDEBAR OVERRIDE - Force dark theme with white text */
-    section[data-testid="stSidebar"] {
-        background-color: #262730 !important;
-        color: white !important;
-    }
-    
-    section[data-testid="stSidebar"] * {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* Navigation menu items */
-    nav[data-testid="stSidebarNav"] {
-        background-color: #262730 !important;
-        color: white !important;
-    }
-    
-    nav[data-testid="stSidebarNav"] * {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* All text elements in sidebar */
-    section[data-testid="stSidebar"] p,
-    section[data-testid="stSidebar"] span,
-    section[data-testid="stSidebar"] div,
-    section[data-testid="stSidebar"] a,
-    section[data-testid="stSidebar"] label,
-    nav[data-testid="stSidebarNav"] p,
-    nav[data-testid="stSidebarNav"] span,
-    nav[data-testid="stSidebarNav"] div,
-    nav[data-testid="stSidebarNav"] a,
-    nav[data-testid="stSidebarNav"] label {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* Override any Streamlit default styles */
-    .css-1d391kg,
-    .css-1lcbmhc,
-    .css-1wivap2,
-    .css-1d391kg *,
-    .css-1lcbmhc *,
-    .css-1wivap2 * {
-        color: white !important;
-        background-color: transparent !important;
-    }
-    
-    /* Force sidebar background */
-    .css-1d391kg {
-        background-color: #262730 !important;
-    }
-    
-    /* All possible sidebar selectors */
-    [class*="css"][class*="sidebar"],
-    [class*="css"][class*="nav"],
-    [class*="css"][class*="menu"] {
-        color: white !important;
-        background-color: #262730 !important;
-    }
-    
-    [class*="css"][class*="sidebar"] *,
-    [class*="css"][class*="nav"] *,
-    [class*="css"][class*="menu"] * {
-        color: white !important;
-        background-color: transparent !important;
-    }
-</style>
-"""
-
-# JavaScript backup fix for dynamic elements
-js_fix = """
-<script>
-    // Force dropdown text to be visible
-    function fixDropdownVisibility() {
-        // Find all selectbox inputs
-        const selectInputs = document.querySelectorAll('[data-baseweb="select"] input');
-        selectInputs.forEach(input => {
-            input.style.color = 'black';
-            input.style.webkitTextFillColor = 'black';
-            input.style.backgroundColor = '#f8f9fa';
-        });
-        
-        // Find all value containers
-        const valueContainers = document.querySelectorAll('[data-baseweb="select"] [class*="valueContainer"]');
-        valueContainers.forEach(container => {
-            container.style.color = 'black';
-            container.style.webkitTextFillColor = 'black';
-            container.style.backgroundColor = '#f8f9fa';
-        });
-        
-        // Find any element that might contain the selected value
-        const selectDivs = document.querySelectorAll('.stSelectbox [data-baseweb="select"] > div > div');
-        selectDivs.forEach(div => {
-            if (div.textContent && !div.querySelector('input')) {
-                div.style.color = 'black';
-                div.style.webkitTextFillColor = 'black';
-                div.style.backgroundColor = '#f8f9fa';
-            }
-        });
-        
-        // Enhanced fix for all dropdown elements
-        const allDropdownElements = document.querySelectorAll('.stSelectbox [data-baseweb="select"] *');
-        allDropdownElements.forEach(element => {
-            if (element.textContent && element.textContent.trim() !== '') {
-                element.style.color = 'black';
-                element.style.webkitTextFillColor = 'black';
-                element.style.backgroundColor = '#f8f9fa';
-            }
-        });
-        
-        // Fix for radio buttons in sidebar
-        const radioLabels = document.querySelectorAll('.stSidebar .stRadio label');
-        radioLabels.forEach(label => {
-            label.style.color = 'black';
-        });
-        
-        // Fix for multiselect elements
-        const multiSelectElements = document.querySelectorAll('.stMultiSelect [data-baseweb="select"] *');
-        multiSelectElements.forEach(element => {
-            if (element.textContent && element.textContent.trim() !== '') {
-                element.style.color = 'black';
-                element.style.webkitTextFillColor = 'black';
-                element.style.backgroundColor = '#f8f9fa';
-            }
-        });
-    }
-    
-    // Run the fix initially
-    setTimeout(fixDropdownVisibility, 100);
-    
-    // Run the fix whenever the DOM changes
-    const observer = new MutationObserver(fixDropdownVisibility);
-    observer.observe(document.body, { 
-        childList: true, 
-        subtree: true,
-        attributes: true,
-        attributeFilter: ['style', 'class']
-    });
-    
-    // Also run on click events
-    document.addEventListener('click', () => {
-        setTimeout(fixDropdownVisibility, 50);
-    });
-    
-    // Run on focus events
-    document.addEventListener('focusin', () => {
-        setTimeout(fixDropdownVisibility, 25);
-    });
-    
-    // Run periodically to catch any missed elements
-    setInterval(fixDropdownVisibility, 2000);
-    
-    // Fix sidebar navigation visibility
-    function fixSidebarNavigation() {
-        // Target all possible sidebar selectors
-        const sidebarSelectors = [
-            '.css-1d391kg',
-            '[data-testid="stSidebar"]',
-            '[data-testid="stSidebarNav"]',
-            '.stSidebar'
-        ];
-        
-        sidebarSelectors.forEach(selector => {
-            const sidebarElements = document.querySelectorAll(selector + ' *');
-            sidebarElements.forEach(element => {
-                if (element.textContent && element.textContent.trim() !== '') {
-                    element.style.color = 'white';
-                    element.style.backgroundColor = 'transparent';
-                    element.style.webkitTextFillColor = 'white';
-                }
-            });
-        });
-        
-        // Fix all text elements in sidebar
-        const textElements = document.querySelectorAll('[data-testid="stSidebar"] *, [data-testid="stSidebarNav"] *, .css-1d391kg *, .stSidebar *');
-        textElements.forEach(element => {
-            if (element.textContent && element.textContent.trim() !== '') {
-                element.style.color = 'white';
-                element.style.backgroundColor = 'transparent';
-                element.style.webkitTextFillColor = 'white';
-            }
-        });
-        
-        // Fix sidebar navigation links
-        const sidebarLinks = document.querySelectorAll('[data-testid="stSidebar"] a, [data-testid="stSidebarNav"] a, .css-1d391kg a, .stSidebar a');
-        sidebarLinks.forEach(link => {
-            link.style.color = 'white';
-            link.style.backgroundColor = 'transparent';
-            link.style.webkitTextFillColor = 'white';
-        });
-        
-        // Fix sidebar icons
-        const sidebarIcons = document.querySelectorAll('[data-testid="stSidebar"] svg, [data-testid="stSidebarNav"] svg, .css-1d391kg svg, .stSidebar svg');
-        sidebarIcons.forEach(icon => {
-            icon.style.color = 'white';
-            icon.style.fill = 'white';
-        });
-        
-        // Force override any black text
-        const blackTextElements = document.querySelectorAll('[style*="color: black"], [style*="color: rgb(0, 0, 0)"], [style*="color: #000000"]');
-        blackTextElements.forEach(element => {
-            element.style.color = 'white';
-            element.style.webkitTextFillColor = 'white';
-        });
-        
-        // Override any inline styles that might be causing issues
-        const allSidebarElements = document.querySelectorAll('[data-testid="stSidebar"] *, [data-testid="stSidebarNav"] *, .css-1d391kg *, .stSidebar *');
-        allSidebarElements.forEach(element => {
-            if (element.textContent && element.textContent.trim() !== '') {
-                element.style.setProperty('color', 'white', 'important');
-                element.style.setProperty('webkit-text-fill-color', 'white', 'important');
-                element.style.setProperty('background-color', 'transparent', 'important');
-            }
-        });
-    }
-    
-    // Run sidebar fix initially
-    setTimeout(fixSidebarNavigation, 50);
-    
-    // Run sidebar fix more frequently
-    setInterval(fixSidebarNavigation, 500);
-    
-    // Also run on any DOM changes
-    const sidebarObserver = new MutationObserver(fixSidebarNavigation);
-    sidebarObserver.observe(document.body, { 
-        childList: true, 
-        subtree: true,
-        attributes: true,
-        attributeFilter: ['style', 'class']
-    });
-    
-    // AGGRESSIVE SIDEBAR FIX - Force all sidebar elements to be white
-    function forceSidebarWhite() {
-        // Find all elements in the sidebar
-        const sidebar = document.querySelector('section[data-testid="stSidebar"]');
-        const sidebarNav = document.querySelector('nav[data-testid="stSidebarNav"]');
-        
-        if (sidebar) {
-            // Force sidebar background
-            sidebar.style.backgroundColor = '#262730';
-            sidebar.style.color = 'white';
-            
-            // Force all child elements to be white
-            const allElements = sidebar.querySelectorAll('*');
-            allElements.forEach(element => {
-                if (element.textContent && element.textContent.trim() !== '') {
-                    element.style.color = 'white';
-                    element.style.backgroundColor = 'transparent';
-                    element.style.webkitTextFillColor = 'white';
-                }
-            });
-        }
-        
-        if (sidebarNav) {
-            // Force navigation background
-            sidebarNav.style.backgroundColor = '#262730';
-            sidebarNav.style.color = 'white';
-            
-            // Force all navigation elements to be white
-            const navElements = sidebarNav.querySelectorAll('*');
-            navElements.forEach(element => {
-                if (element.textContent && element.textContent.trim() !== '') {
-                    element.style.color = 'white';
-                    element.style.backgroundColor = 'transparent';
-                    element.style.webkitTextFillColor = 'white';
-                }
-            });
-        }
-        
-        // Override any black text anywhere in the sidebar
-        const blackTextElements = document.querySelectorAll('section[data-testid="stSidebar"] [style*="color: black"], section[data-testid="stSidebar"] [style*="color: rgb(0, 0, 0)"], nav[data-testid="stSidebarNav"] [style*="color: black"], nav[data-testid="stSidebarNav"] [style*="color: rgb(0, 0, 0)"]');
-        blackTextElements.forEach(element => {
-            element.style.color = 'white';
-            element.style.webkitTextFillColor = 'white';
-        });
-    }
-    
-    // Run aggressive fix
-    setTimeout(forceSidebarWhite, 100);
-    setInterval(forceSidebarWhite, 1000);
-    
-    // Also run on page load and DOM changes
-    document.addEventListener('DOMContentLoaded', forceSidebarWhite);
-    window.addEventListener('load', forceSidebarWhite);
-</script>
-"""
-
-# Apply both fixes immediately
-st.markdown(dropdown_style_fix, unsafe_allow_html=True)
-st.markdown(js_fix, unsafe_allow_html=True)
-
-# Enhanced CSS with animations and professional styling
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global styles */
-    .stApp {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Animated header */
-    .main-header {
-        background: linear-gradient(90deg, #0072C6 0%, #005a9e 100%);
-        color: white;
-        font-size: 3rem;
-        font-weight: 700;
-        text-align: center;
-        padding: 2rem;
-        margin: -1rem -5rem 2rem -5rem;
-        box-shadow: 0 4px 20px rgba(0, 114, 198, 0.3);
-        position: relative;
-        overflow: hidden;
-        animation: slideDown 0.8s ease-out;
-    }
-    
-    .main-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        animation: shine 3s infinite;
-    }
-    
-    @keyframes shine {
-        0% { left: -100%; }
-        100% { left: 100%; }
-    }
-    
-    @keyframes slideDown {
-        from { transform: translateY(-100%); opacity: 0; }
-        to { transform: translateY(0); opacity: 1; }
-    }
-    
-    .sub-header {
-        color: white;
-        font-size: 1.3rem;
-        font-weight: 300;
-        text-align: center;
-        margin-top: -1rem;
-        opacity: 0.9;
-    }
-    
-    /* Card styling with hover effects */
-    div[data-testid="metric-container"] {
-        background: white;
-        border: none;
-        padding: 1.5rem;
-        border-radius: 16px;
-        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    div[data-testid="metric-container"]:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(0, 114, 198, 0.2);
-    }
-    
-    div[data-testid="metric-container"]::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #0072C6, #D40511);
-        transform: scaleX(0);
-        transition: transform 0.3s;
-    }
-    
-    div[data-testid="metric-container"]:hover::before {
-        transform: scaleX(1);
-    }
-    
-    /* Enhanced buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, #0072C6 0%, #005a9e 100%);
-        color: white;
-        border: none;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        border-radius: 30px;
-        box-shadow: 0 4px 15px rgba(0, 114, 198, 0.3);
-        transition: all 0.3s;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 25px rgba(0, 114, 198, 0.4);
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        border-radius: 50%;
-        background: rgba(255, 255, 255, 0.3);
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .stButton > button:active::before {
-        width: 300px;
-        height: 300px;
-    }
-    
-    /* UBS accent button */
-    .accent-button > button {
-        background: linear-gradient(135deg, #D40511 0%, #b00410 100%);
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0% { box-shadow: 0 4px 15px rgba(212, 5, 17, 0.3); }
-        50% { box-shadow: 0 4px 25px rgba(212, 5, 17, 0.5); }
-        100% { box-shadow: 0 4px 15px rgba(212, 5, 17, 0.3); }
-    }
-    
-    /* Success messages with animation */
-    .success-msg {
-        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-        color: white;
-        padding: 1rem 2rem;
-        border-radius: 50px;
-        font-weight: 600;
-        display: inline-block;
-        animation: slideIn 0.5s ease-out;
-        box-shadow: 0 4px 15px rgba(76, 175, 80, 0.3);
-    }
-    
-    @keyframes slideIn {
-        from { transform: translateX(-100%); opacity: 0; }
-        to { transform: translateX(0); opacity: 1; }
-    }
-    
-    /* Enhanced sidebar */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1a1a2e 0%, #16213e 100%);
-        box-shadow: 4px 0 10px rgba(0, 0, 0, 0.1);
-    }
-    
-    section[data-testid="stSidebar"] .block-container {
-        padding-top: 2rem;
-    }
-    
-    section[data-testid="stSidebar"] h1, 
-    section[data-testid="stSidebar"] h3,
-    section[data-testid="stSidebar"] label {
-        color: white !important;
-    }
-    
-    /* Fix radio button text visibility in sidebar */
-    section[data-testid="stSidebar"] .stRadio > label {
-        color: white !important;
-        font-weight: 500;
-    }
-    
-    section[data-testid="stSidebar"] [data-baseweb="radio"] > div {
-        color: white !important;
-    }
-    
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] label {
-        color: white !important;
-        font-size: 1.1rem;
-        padding: 0.5rem 0;
-        transition: all 0.3s;
-        background: transparent !important; /* avoid white blocks over dark sidebar */
-        border-radius: 8px;
-    }
-    
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] label:hover {
-        color: #4CAF50 !important;
-        transform: translateX(5px);
-        background: rgba(255, 255, 255, 0.10) !important;
-    }
-    
-    /* Absolute override to guarantee sidebar text/icon visibility */
-    section[data-testid="stSidebar"] *,
-    nav[data-testid="stSidebarNav"] *,
-    .stSidebar * {
-        color: rgba(255, 255, 255, 0.98) !important;
-        -webkit-text-fill-color: rgba(255, 255, 255, 0.98) !important;
-        opacity: 1 !important;
-    }
-
-    /* Links in sidebar */
-    section[data-testid="stSidebar"] a,
-    nav[data-testid="stSidebarNav"] a,
-    .stSidebar a {
-        color: #e6e6e6 !important;
-        text-decoration: none !important;
-    }
-
-    section[data-testid="stSidebar"] a:hover,
-    nav[data-testid="stSidebarNav"] a:hover,
-    .stSidebar a:hover {
-        color: #4CAF50 !important;
-    }
-
-    /* Ensure icons adopt visible color */
-    section[data-testid="stSidebar"] svg,
-    nav[data-testid="stSidebarNav"] svg,
-    .stSidebar svg {
-        color: rgba(255, 255, 255, 0.98) !important;
-        fill: currentColor !important;
-        stroke: currentColor !important;
-    }
-
-    /* Extra safety for radio labels */
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] *,
-    .stSidebar .stRadio [role="radiogroup"] * {
-        color: rgba(255, 255, 255, 0.98) !important;
-        -webkit-text-fill-color: rgba(255, 255, 255, 0.98) !important;
-        opacity: 1 !important;
-    }
-
-    /* Ensure radio containers do not force white backgrounds */
-    section[data-testid="stSidebar"] [data-baseweb="radio"] > div,
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] div[role="radio"],
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] label > div:first-child {
-        background: transparent !important;
-    }
-
-    /* Selected radio visual */
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] div[aria-checked="true"],
-    section[data-testid="stSidebar"] .stRadio [role="radiogroup"] label[aria-checked="true"] {
-        background: rgba(255, 255, 255, 0.15) !important;
-        border-radius: 8px;
-    }
-
-    /* Input fields */
-    .stSelectbox > div > div,
-    .stTextInput > div > div > input {
-        background: white;
-        border: 2px solid #e0e0e0;
-        border-radius: 10px;
-        padding: 0.5rem;
-        transition: all 0.3s;
-    }
-    
-    .stTextInput > div > div > input {
-        color: #1a1a1a !important;
-    }
-    
-    /* Focus states */
-    .stSelectbox > div > div:focus-within,
-    .stTextInput > div > div > input:focus {
-        border-color: #0072C6;
-        box-shadow: 0 0 0 3px rgba(0, 114, 198, 0.1);
-    }
-    
-    /* Data tables */
-    .dataframe {
-        background: white;
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.08);
-    }
-    
-    .dataframe thead th {
-        background: linear-gradient(135deg, #0072C6 0%, #005a9e 100%);
-        color: white !important;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        padding: 1rem !important;
-    }
-    
-    .dataframe tbody tr:hover {
-        background: rgba(0, 114, 198, 0.05);
-        transition: background 0.3s;
-    }
-    
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        background: rgba(255, 255, 255, 0.8);
-        border-radius: 50px;
-        padding: 0.5rem;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 30px;
-        color: #666;
-        font-weight: 600;
-        transition: all 0.3s;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #0072C6 0%, #005a9e 100%);
-        color: white;
-        box-shadow: 0 4px 15px rgba(0, 114, 198, 0.3);
-    }
-    
-    /* Info boxes */
-    .info-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 16px;
-        margin: 1rem 0;
-        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .info-box::before {
-        content: '💡';
-        position: absolute;
-        top: -20px;
-        right: -20px;
-        font-size: 100px;
-        opacity: 0.1;
-    }
-    
-    /* Loading animation */
-    .loading {
-        display: inline-block;
-        width: 20px;
-        height: 20px;
-        border: 3px solid rgba(0, 114, 198, 0.3);
-        border-radius: 50%;
-        border-top-color: #0072C6;
-        animation: spin 1s ease-in-out infinite;
-    }
-    
-    @keyframes spin {
-        to { transform: rotate(360deg); }
-    }
-    
-    /* Floating badges */
-    .badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        border-radius: 20px;
-        font-size: 0.85rem;
-        font-weight: 600;
-        margin-left: 0.5rem;
-        animation: float 3s ease-in-out infinite;
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translateY(0); }
-        50% { transform: translateY(-10px); }
-    }
-    
-    /* Executive summary box */
-    .executive-summary {
-        background: white;
-        border-left: 5px solid #0072C6;
-        padding: 2rem;
-        border-radius: 12px;
-        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
-        margin: 2rem 0;
-        position: relative;
-    }
-    
-    .executive-summary h3 {
-        color: #0072C6;
-        margin-bottom: 1rem;
-        font-weight: 700;
-    }
-    
-    .executive-summary::before {
-        content: '📊';
-        position: absolute;
-        top: 1rem;
-        right: 1rem;
-        font-size: 2rem;
-        opacity: 0.5;
-    }
-    
-    /* Stat cards */
-    .stat-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 16px;
-        text-align: center;
-        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
-        transition: all 0.3s;
-        cursor: pointer;
-    }
-    
-    .stat-card:hover {
-        transform: scale(1.05);
-        box-shadow: 0 15px 40px rgba(0, 114, 198, 0.2);
-    }
-    
-    .stat-number {
-        font-size: 3rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #0072C6 0%, #D40511 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin: 0.5rem 0;
-    }
-    
-    .stat-label {
-        color: #666;
-        font-size: 1rem;
-        font-weight: 500;
-    }
-    
-    /* Progress bars */
-    .progress-bar {
-        width: 100%;
-        height: 20px;
-        background: #f0f0f0;
-        border-radius: 10px;
-        overflow: hidden;
-        margin: 0.5rem 0;
-    }
-    
-    .progress-fill {
-        height: 100%;
-        background: linear-gradient(90deg, #0072C6 0%, #D40511 100%);
-        border-radius: 10px;
-        animation: fillProgress 1.5s ease-out;
-    }
-    
-    @keyframes fillProgress {
-        from { width: 0; }
-    }
-    
-    /* Mobile responsive design */
-    @media (max-width: 768px) {
-        /* Adjust main container */
-        .main .block-container {
-            padding: 1rem 0.5rem;
-        }
-        
-        /* Responsive columns */
-        .stColumns > div {
-            margin-bottom: 1rem;
-        }
-        
-        /* Adjust metric cards */
-        .metric-container {
-            padding: 0.5rem;
-            margin: 0.25rem 0;
-        }
-        
-        /* Responsive text */
-        h1 {
-            font-size: 1.8rem !important;
-        }
-        
-        h2 {
-            font-size: 1.4rem !important;
-        }
-        
-        h3 {
-            font-size: 1.2rem !important;
-        }
-        
-        /* Mobile-friendly buttons */
-        .stButton > button {
-            width: 100%;
-            margin: 0.25rem 0;
-            padding: 0.75rem;
-            font-size: 1rem;
-        }
-        
-        /* Responsive tables */
-        .stDataFrame {
-            font-size: 0.8rem;
-        }
-        
-        /* Mobile sidebar */
-        .css-1d391kg {
-            width: 100% !important;
-        }
-        
-        /* Touch-friendly inputs */
-        .stSelectbox, .stTextInput, .stNumberInput {
-            margin: 0.5rem 0;
-        }
-        
-        /* Mobile charts */
-        .js-plotly-plot {
-            height: 300px !important;
-        }
-        
-        /* Responsive cards */
-        .stat-card {
-            padding: 0.75rem;
-            margin: 0.5rem 0;
-        }
-        
-        /* Mobile navigation */
-        .stRadio > label {
-            padding: 0.5rem;
-            margin: 0.25rem 0;
-        }
-        
-        /* Touch targets */
-        .stButton, .stSelectbox, .stTextInput {
-            min-height: 44px;
-        }
-        
-        /* Mobile tabs */
-        .stTabs [data-baseweb="tab-list"] {
-            flex-wrap: wrap;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            min-width: 120px;
-            padding: 0.5rem;
-        }
-    }
-    
-    /* Tablet optimization */
-    @media (min-width: 769px) and (max-width: 1024px) {
-        .main .block-container {
-            padding: 1.5rem;
-        }
-        
-        h1 {
-            font-size: 2.2rem !important;
-        }
-        
-        .stColumns > div {
-            margin-bottom: 1rem;
-        }
-    }
-    
-    /* High DPI displays */
-    @media (-webkit-min-device-pixel-ratio: 2), (min-resolution: 192dpi) {
-        .stButton > button {
-            border-radius: 8px;
-        }
-        
-        .stat-card {
-            border-radius: 12px;
-        }
-    }
-    
-    /* Dark mode support */
-    @media (prefers-color-scheme: dark) {
-        .stat-card {
-            background: #2d3748;
-            color: white;
-        }
-        
-        .info-box {
-            background: #2d3748;
-            color: white;
-        }
-    }
-    
-    /* Accessibility improvements */
-    .stButton > button:focus,
-    .stSelectbox > div:focus,
-    .stTextInput > div:focus {
-        outline: 2px solid #0072C6;
-        outline-offset: 2px;
-    }
-    
-    /* Loading states */
-    .stSpinner {
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        padding: 2rem;
-    }
-    
-    /* Success/error messages */
-    .stAlert {
-        border-radius: 8px;
-        margin: 0.5rem 0;
-    }
-</style>
-
-""", unsafe_allow_html=True)
+# Theme: static/theme.css + static/theme.js, minified once per process and injected
+# as one message. Streamlit sends repeated messages over 10KB as a hash reference,
+# so the browser receives the full theme once per session.
+st.markdown(theme_html(), unsafe_allow_html=True)
 
 # Initialize session state
 if 'query_results' not in st.session_state:
@@ -1188,150 +29,84 @@ if 'loading' not in st.session_state:
 
 # Import enhanced data structure
 from enhanced_data_structure import (
-    create_streamlit_dataset, 
     enhanced_nlp_response,
+    DEFAULT_SEED,
     TEAM_TEMPLATES,
     COST_MODELS,
+    LOCATIONS,
     PROJECT_TYPES
 )
+from dataset_provider import DatasetProvider
+from talent_index import TalentIndex
+from talent_cube import TalentCube
+from query_compiler import run_query
+from bounded_cache import BoundedCache
+from figure_cache import cached_figure
+
+@st.cache_resource
+def get_dataset_provider():
+    """Process-wide source of every talent frame (memory-mapped snapshots when TALENT_SNAPSHOT_DIR is set)"""
+    return DatasetProvider()
 
 # Enhanced mock data with comprehensive Swiss banking structure
-@st.cache_data
-def create_mock_data():
-    """Create comprehensive Swiss banking talent data"""
-    return create_streamlit_dataset()
+def create_mock_data(seed=DEFAULT_SEED):
+    """Shared Swiss banking talent dataset, built once by the provider (read-only)"""
+    return get_dataset_provider().get("streamlit_dataset", seed=seed)
+
+@st.cache_resource(max_entries=4)
+def build_talent_index(version):
+    """Inverted indexes over the talent dataset, built once per dataset version"""
+    return TalentIndex(create_mock_data(version.seed))
+
+@st.cache_resource(max_entries=4)
+def build_talent_cube(version):
+    """Materialized Count/availability roll-ups, built once per dataset version"""
+    return TalentCube(create_mock_data(version.seed))
+
+def get_talent_index(seed=DEFAULT_SEED):
+    """Talent index for the current version of the dataset"""
+    return build_talent_index(get_dataset_provider().version("streamlit_dataset", seed=seed))
+
+def get_talent_cube(seed=DEFAULT_SEED):
+    """Talent cube for the current version of the dataset"""
+    return build_talent_cube(get_dataset_provider().version("streamlit_dataset", seed=seed))
+
+@st.cache_resource(max_entries=2)
+def build_team_pool(version):
+    """Per-role candidate indexes over the associate pool, built once per dataset version"""
+    from team_optimizer import TeamPool
+    return TeamPool(get_dataset_provider().get("associates", seed=version.seed))
+
+def get_team_pool(seed=DEFAULT_SEED):
+    """Team assembly index for the current version of the associate pool"""
+    return build_team_pool(get_dataset_provider().version("associates", seed=seed))
+
+def dataset_version(seed=DEFAULT_SEED):
+    """Identifies the talent dataset in cache keys: provider version plus cube updates"""
+    return (get_dataset_provider().version("streamlit_dataset", seed=seed), get_talent_cube(seed).revision)
 
 # Enhanced NLP response function
 def mock_nlp_response(query):
     with st.spinner('🤖 AI analyzing your query...'):
-        time.sleep(1)  # Simulate processing
-    
-    df = create_mock_data()
-    return enhanced_nlp_response(query, df)
+        simulate_latency(1)  # Demo delay, off unless TALENT_SIMULATED_LATENCY is set
+        with LATENCY.measure("NLP response"):
+            return enhanced_nlp_response(query, create_mock_data(), cube=get_talent_cube())
 
-# PDF Export Function with enhanced styling
-def generate_pdf_report(data, query_params):
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-    elements = []
-    
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        textColor=colors.HexColor('#0072C6'),
-        spaceAfter=30,
-        alignment=1,
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'Subtitle',
-        parent=styles['Normal'],
-        fontSize=14,
-        textColor=colors.HexColor('#666666'),
-        spaceAfter=30,
-        alignment=1
-    )
-    
-    # Title
-    elements.append(Paragraph("COGNIZANT TALENT REPORT", title_style))
-    elements.append(Paragraph("Executive Summary for UBS Engagement", subtitle_style))
-    elements.append(Spacer(1, 30))
-    
-    # Executive Summary Box
-    summary_data = [
-        ['EXECUTIVE SUMMARY', ''],
-        ['Total Associates Found:', f"{data['Count'].sum()}"],
-        ['Immediate Availability:', f"{data['Available_Now'].sum()} ({round(data['Available_Now'].sum()/data['Count'].sum()*100)}%)"],
-        ['Average Experience:', f"{data['Experience_Years'].mean():.1f} years"],
-        ['Deployment Readiness:', 'HIGH - Teams ready within 24-48 hours']
-    ]
-    
-    summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0072C6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e0e0e0')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 11),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-    ]))
-    elements.append(summary_table)
-    elements.append(Spacer(1, 30))
-    
-    # Query Parameters
-    elements.append(Paragraph("<b>SEARCH CRITERIA</b>", styles['Heading2']))
-    param_data = [
-        ['Parameter', 'Value'],
-        ['Date:', datetime.now().strftime('%Y-%m-%d %H:%M')],
-        ['Project Type:', query_params.get('project_type', 'All')],
-        ['Skill:', query_params.get('skill', 'All')],
-        ['Location:', query_params.get('location', 'All')],
-        ['Role:', query_params.get('role', 'All')]
-    ]
-    
-    param_table = Table(param_data, colWidths=[2*inch, 4*inch])
-    param_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#666666')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e0e0e0'))
-    ]))
-    elements.append(param_table)
-    elements.append(Spacer(1, 30))
-    
-    # Detailed Results
-    elements.append(Paragraph("<b>DETAILED TALENT BREAKDOWN</b>", styles['Heading2']))
-    if not data.empty:
-        table_data = [['Project', 'Location', 'Skill', 'Role', 'Total', 'Available Now', '1 Month', 'Avg Exp']]
-        for _, row in data.iterrows():
-            table_data.append([
-                row['Project_Type'], row['Location'], row['Skill'], row['Role'],
-                str(row['Count']), str(row['Available_Now']), str(row['Available_1_Month']),
-                f"{row['Experience_Years']}y"
-            ])
-        
-        detail_table = Table(table_data)
-        detail_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0072C6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e0e0e0')),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-        ]))
-        elements.append(detail_table)
-    
-    # Footer
-    elements.append(Spacer(1, 50))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#666666'),
-        alignment=1
-    )
-    elements.append(Paragraph("© 2025 Cognizant Technology Solutions. Confidential and Proprietary.", footer_style))
-    
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer
+def run_talent_query(query):
+    """Compile a natural language query into a filter and run it on the talent index"""
+    with LATENCY.measure("NL talent query"):
+        return run_query(query, get_talent_index())
+
+@st.cache_resource
+def get_report_cache():
+    """Process-wide LRU of rendered PDF reports (bounded by count and bytes)"""
+    return BoundedCache(max_entries=32, max_bytes=32 * 1024 * 1024)
+
+def cached_pdf_report(data, query_params, seed=DEFAULT_SEED):
+    """PDF bytes for (dataset version, query_params), rendered at most once"""
+    from pdf_report import generate_pdf_report
+    key = (dataset_version(seed), tuple(sorted(query_params.items())))
+    return get_report_cache().get_or_build(key, lambda: generate_pdf_report(data, query_params).getvalue())
 
 # Header with animation
 st.markdown("""
@@ -1362,9 +137,9 @@ with st.sidebar:
     # Add some stats in sidebar
     st.markdown("---")
     st.markdown("### 📈 Quick Stats")
-    df_temp = create_mock_data()
-    total_associates = df_temp['Count'].sum()
-    total_available = df_temp['Available_Now'].sum()
+    sidebar_totals = get_talent_cube().totals()
+    total_associates = sidebar_totals['Count']
+    total_available = sidebar_totals['Available_Now']
     
     st.markdown(f"""
     <div class='stat-card' style='margin: 1rem 0;'>
@@ -1376,6 +151,14 @@ with st.sidebar:
         <div class='stat-label'>Available Now</div>
     </div>
     """, unsafe_allow_html=True)
+    
+    # Compute time per interaction (previous reruns), enabled with TALENT_SHOW_TIMINGS=1
+    if SHOW_TIMINGS:
+        st.markdown("---")
+        st.markdown("### ⏱️ Interaction Latency")
+        st.dataframe(LATENCY.summary(), hide_index=True, use_container_width=True)
+        st.markdown("### 🗄️ Datasets")
+        st.dataframe(get_dataset_provider().stats(), hide_index=True, use_container_width=True)
 
 # Load data
 df = create_mock_data()
@@ -1560,32 +343,12 @@ def show_introduction_page():
         """)
     
     with col2:
-        # Generate QR Code
-        def generate_qr_code(url):
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(url)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            return img
-        
         # Use Streamlit Cloud URL for universal mobile access
         # This ensures the QR code works for anyone who scans it
-        current_url = "https://talent-edge-crm-toolkit-eruzl4qtztizpskyggz3tv.streamlit.app"
-        qr_img = generate_qr_code(current_url)
-        
-        # Convert PIL image to bytes
-        img_buffer = BytesIO()
-        qr_img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
+        current_url = APP_URL
         
-        # Display QR code
-        st.image(img_buffer, caption="Scan to access on mobile", width=200)
+        # Display QR code (prebuilt PNG, or rendered once per process)
+        st.image(qr_png(current_url), caption="Scan to access on mobile", width=200)
         
         # Show the actual URL for manual access
         st.info(f"📱 **Universal Mobile Access URL:** `{current_url}`")
@@ -1660,6 +423,7 @@ def show_talent_search():
 
 def show_team_builder():
     """Display team builder functionality"""
+    from team_optimizer import AVAILABILITY_HORIZONS, EXPERIENCE_LEVELS, assemble_team, scale_composition
     
     st.markdown("## 👥 Smart Team Builder")
     
@@ -1667,40 +431,54 @@ def show_team_builder():
     col1, col2 = st.columns(2)
     
     with col1:
-        project_type = st.selectbox("Project Type", ["Core Banking", "Wealth Management", "Risk Management", "Digital Banking"])
+        template_key = st.selectbox("Project Type", list(TEAM_TEMPLATES.keys()), format_func=lambda x: TEAM_TEMPLATES[x]["name"])
         team_size = st.slider("Team Size", 5, 50, 15)
-        budget = st.number_input("Budget (CHF)", min_value=100000, max_value=5000000, value=500000, step=50000)
+        budget = st.number_input("Budget (CHF/month)", min_value=100000, max_value=5000000, value=500000, step=50000)
+        delivery_model = st.selectbox(
+            "Delivery Model",
+            list(COST_MODELS["delivery_models"].keys()),
+            index=1,
+            format_func=lambda x: COST_MODELS["delivery_models"][x]["description"]
+        )
     
     with col2:
         timeline = st.selectbox("Timeline", ["3 months", "6 months", "12 months", "18 months"])
-        expertise_level = st.selectbox("Expertise Level", ["Junior", "Mid-level", "Senior", "Mixed"])
-        location_preference = st.multiselect("Location Preference", ["Zurich", "Pune", "Bangalore", "Mumbai"])
+        availability = st.selectbox("Available Within", list(AVAILABILITY_HORIZONS.keys()), index=2)
+        expertise_level = st.selectbox("Expertise Level", list(EXPERIENCE_LEVELS.keys()))
+        location_preference = st.multiselect("Location Preference", list(LOCATIONS.keys()))
     
     # Build team button
     if st.button("👥 Build Optimal Team", type="primary", key="build_team"):
-        st.success("✅ Team composition optimized!")
+        with LATENCY.measure("Team assembly"):
+            solution = assemble_team(
+                get_team_pool(),
+                scale_composition(TEAM_TEMPLATES[template_key]["composition"], team_size),
+                budget=budget,
+                horizon=availability,
+                locations=location_preference,
+                min_experience=EXPERIENCE_LEVELS[expertise_level],
+                delivery_model=delivery_model
+            )
+        
+        if solution.feasible:
+            st.success(f"✅ Team composition optimized! ({solution.solve_ms:.1f} ms)")
+        else:
+            st.warning("⚠️ Closest team found; some constraints could not be met:\n\n" +
+                       "\n".join(f"- {issue}" for issue in solution.issues))
         
         # Display team composition
         st.markdown("### 🎯 Recommended Team Composition")
         
-        team_data = {
-            "Role": ["Project Manager", "Tech Lead", "Senior Developer", "Developer", "QA Engineer", "DevOps Engineer"],
-            "Count": [1, 2, 3, 5, 2, 2],
-            "Experience": ["10+ years", "8+ years", "6+ years", "3+ years", "4+ years", "5+ years"],
-            "Location": ["Zurich", "Zurich", "Pune", "Pune", "Bangalore", "Pune"],
-            "Cost/Month": ["CHF 25,000", "CHF 18,000", "CHF 12,000", "CHF 8,000", "CHF 7,000", "CHF 9,000"]
-        }
-        
-        team_df = pd.DataFrame(team_data)
-        st.dataframe(team_df, use_container_width=True)
+        st.dataframe(solution.members, use_container_width=True)
         
         # Cost breakdown
         st.markdown("### 💰 Cost Breakdown")
-        total_cost = 25 + 36 + 36 + 40 + 14 + 18  # in thousands
-        st.metric("Total Monthly Cost", f"CHF {total_cost},000", f"Budget: CHF {budget//1000},000")
+        months = int(timeline.split()[0])
+        st.metric("Total Monthly Cost", f"CHF {solution.monthly_cost:,.0f}", f"Budget: CHF {budget:,}", delta_color="off")
+        st.caption(f"CHF {solution.monthly_cost * months:,.0f} over {timeline}")
         
         # Progress bar
-        progress = (total_cost * 1000) / budget * 100
+        progress = solution.monthly_cost / budget * 100
         st.progress(min(progress, 100) / 100)
 
 def show_project_query():
@@ -1728,30 +506,35 @@ def show_project_query():
         if nl_query:
             # Simulate AI processing
             with st.spinner("🤖 AI analyzing your query..."):
-                time.sleep(2)
+                simulate_latency(2)
             
-            st.success("✅ Query executed successfully!")
+            result = run_talent_query(nl_query)
+            st.success(f"✅ Query executed: {result.filter.describe()}")
+            if result.note:
+                st.info(result.note)
             
             # Display results
             st.markdown("### 📊 Query Results")
             
-            # Mock results based on query
-            results = [
-                {"Name": "Dr. Anna Schmidt", "Skills": "Data Science, ML", "Experience": "8 years", "Location": "Zurich", "Availability": "Immediate"},
-                {"Name": "Prof. Raj Kumar", "Skills": "AI/ML, Analytics", "Experience": "12 years", "Location": "Pune", "Availability": "2 weeks"},
-                {"Name": "Elena Petrova", "Skills": "Data Engineering", "Experience": "6 years", "Location": "Zurich", "Availability": "Immediate"}
-            ]
+            col_r1, col_r2, col_r3 = st.columns(3)
+            col_r1.metric("Matching Associates", f"{result.total:,}")
+            col_r2.metric("Available", f"{result.available:,}")
+            col_r3.metric("Talent Pools", f"{len(result.rows)}")
             
-            for result in results:
+            if result.rows.empty:
+                st.warning("No matching talent found. Try fewer constraints.")
+            
+            for _, row in result.rows.head(5).iterrows():
                 st.markdown(f"""
                 <div style="padding: 1rem; margin: 0.5rem 0; background: #f8f9fa; border-radius: 8px; border-left: 4px solid #28a745;">
-                    <strong>{result['Name']}</strong> - {result['Skills']}<br>
-                    Experience: {result['Experience']} | Location: {result['Location']} | Available: {result['Availability']}
+                    <strong>{row['Skill']} · {row['Role']}</strong> - {row['Project_Type']}<br>
+                    Experience: {row['Experience_Years']} years | Location: {row['Location']} | Available: {row[result.measure]} of {row['Count']}
                 </div>
                 """, unsafe_allow_html=True)
 
 def show_ai_ml_features():
     """Display AI and Machine Learning features"""
+    import plotly.graph_objects as go
     
     st.markdown("## 🤖 AI & Machine Learning")
     
@@ -1978,19 +761,24 @@ def show_ai_ml_features():
         if st.button("🔍 Process Query", key="process_nlp_query"):
             if user_query:
                 with st.spinner("🤖 AI processing your query..."):
-                    time.sleep(2)
+                    simulate_latency(2)
                 
+                result = run_talent_query(user_query)
                 st.success("✅ Query processed successfully!")
+                if result.note:
+                    st.info(result.note)
+                
+                matches = "\n".join(
+                    f"                - {row['Skill']} {row['Role']}s, {row['Location']} ({row['Project_Type']}, {row['Experience_Years']} years): {row[result.measure]} of {row['Count']} available"
+                    for _, row in result.rows.head(3).iterrows()
+                ) or "                - No matching talent pools"
                 
-                # Mock AI response
                 st.markdown("**🤖 AI Response:**")
-                st.markdown("""
-                Based on your query, I found:
+                st.markdown(f"""
+                Based on your query (**{result.filter.describe()}**), I found {result.total:,} associates, {result.available:,} available:
                 
-                **👥 Matching Candidates:**
-                - Dr. Anna Schmidt (8 years, Data Science, Zurich, Immediate)
-                - Prof. Raj Kumar (12 years, AI/ML, Pune, 2 weeks)
-                - Elena Petrova (6 years, Data Engineering, Zurich, Immediate)
+                **👥 Matching Talent Pools:**
+{matches}
                 
                 **💰 Cost Analysis:**
                 - Swiss-based team: CHF 2.4M
@@ -2518,6 +1306,7 @@ def show_integration_features():
 
 def show_crm_tools():
     """Display CRM-specific tools and features"""
+    import plotly.graph_objects as go
     
     st.markdown("## 💼 CRM Tools & Client Management")
     
@@ -3168,6 +1957,9 @@ def show_crm_tools():
 if page == "🏠 Introduction":
     show_introduction_page()
 elif page == "📊 Dashboard":
+    import plotly.graph_objects as go
+    cube = get_talent_cube()
+    
     # Executive Summary at the top
     st.markdown("""
     <div class="executive-summary">
@@ -3181,8 +1973,9 @@ elif page == "📊 Dashboard":
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        zurich_total = df[df['Location'] == 'Zurich']['Count'].sum()
-        zurich_available = df[df['Location'] == 'Zurich']['Available_Now'].sum()
+        zurich_totals = cube.totals(Location='Zurich')
+        zurich_total = zurich_totals['Count']
+        zurich_available = zurich_totals['Available_Now']
         zurich_percent = round(zurich_available/zurich_total*100) if zurich_total > 0 else 0
         st.metric("🏢 Zurich Hub", f"{zurich_total}", f"↑ {zurich_percent}% Available")
         st.markdown(f"""
@@ -3192,8 +1985,9 @@ elif page == "📊 Dashboard":
         """, unsafe_allow_html=True)
     
     with col2:
-        pune_total = df[df['Location'] == 'Pune']['Count'].sum()
-        pune_available = df[df['Location'] == 'Pune']['Available_Now'].sum()
+        pune_totals = cube.totals(Location='Pune')
+        pune_total = pune_totals['Count']
+        pune_available = pune_totals['Available_Now']
         pune_percent = round(pune_available/pune_total*100) if pune_total > 0 else 0
         st.metric("🌏 Pune Center", f"{pune_total}", f"↑ {pune_percent}% Available")
         st.markdown(f"""
@@ -3203,8 +1997,9 @@ elif page == "📊 Dashboard":
         """, unsafe_allow_html=True)
     
     with col3:
-        ai_total = df[df['Skill'] == 'Data Analytics']['Count'].sum()
-        ai_available = df[df['Skill'] == 'Data Analytics']['Available_Now'].sum()
+        ai_totals = cube.totals(Skill='Data Analytics')
+        ai_total = ai_totals['Count']
+        ai_available = ai_totals['Available_Now']
         ai_percent = round(ai_available/ai_total*100) if ai_total > 0 else 0
         st.metric("🤖 AI Specialists", f"{ai_total}", f"↑ {ai_percent}% Available")
         st.markdown(f"""
@@ -3214,8 +2009,9 @@ elif page == "📊 Dashboard":
         """, unsafe_allow_html=True)
     
     with col4:
-        ubs_projects = df[df['Project_Type'].isin(['CS Integration', 'Core Banking'])]['Count'].sum()
-        ubs_available = df[df['Project_Type'].isin(['CS Integration', 'Core Banking'])]['Available_Now'].sum()
+        ubs_totals = cube.totals(Project_Type=['CS Integration', 'Core Banking'])
+        ubs_projects = ubs_totals['Count']
+        ubs_available = ubs_totals['Available_Now']
         ubs_percent = round(ubs_available/ubs_projects*100) if ubs_projects > 0 else 0
         st.metric("🏦 UBS Ready", f"{ubs_projects}", f"↑ {ubs_percent}% Available")
         st.markdown(f"""
@@ -3230,30 +2026,33 @@ elif page == "📊 Dashboard":
     with col_left:
         # Enhanced skill distribution chart
         st.markdown("### 🎯 Skill Distribution Analysis")
-        skill_dist = df.groupby('Skill')['Count'].sum().reset_index()
-        
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=skill_dist['Skill'],
-            values=skill_dist['Count'],
-            hole=0.4,
-            marker=dict(
-                colors=['#0072C6', '#D40511', '#4CAF50', '#FF9800', '#9C27B0'],
-                line=dict(color='white', width=2)
-            ),
-            textposition='inside',
-            textinfo='label+percent',
-            hovertemplate='<b>%{label}</b><br>Associates: %{value}<br>Percentage: %{percent}<extra></extra>'
-        )])
-        
-        fig_pie.update_layout(
-            showlegend=True,
-            height=400,
-            font=dict(size=14, family="Inter"),
-            annotations=[dict(text='Skills', x=0.5, y=0.5, font_size=20, showarrow=False)],
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
-        )
+        def build_skill_pie():
+            skill_dist = cube.frame(['Skill'])
+            
+            fig_pie = go.Figure(data=[go.Pie(
+                labels=skill_dist['Skill'],
+                values=skill_dist['Count'],
+                hole=0.4,
+                marker=dict(
+                    colors=['#0072C6', '#D40511', '#4CAF50', '#FF9800', '#9C27B0'],
+                    line=dict(color='white', width=2)
+                ),
+                textposition='inside',
+                textinfo='label+percent',
+                hovertemplate='<b>%{label}</b><br>Associates: %{value}<br>Percentage: %{percent}<extra></extra>'
+            )])
+            
+            fig_pie.update_layout(
+                showlegend=True,
+                height=400,
+                font=dict(size=14, family="Inter"),
+                annotations=[dict(text='Skills', x=0.5, y=0.5, font_size=20, showarrow=False)],
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)'
+            )
+            return fig_pie
         
+        fig_pie = cached_figure("dashboard_skill_pie", dataset_version(), build_skill_pie)
         st.plotly_chart(fig_pie, use_container_width=True)
     
     with col_right:
@@ -3421,19 +2220,13 @@ elif page == "🔍 Project Query":
     
     if search_clicked:
         with st.spinner('🔄 Analyzing talent database...'):
-            time.sleep(0.5)  # Simulate search
-        
-        # Filter data
-        filtered_df = df.copy()
+            simulate_latency(0.5)  # Demo delay, off unless TALENT_SIMULATED_LATENCY is set
         
-        if project_type != "All":
-            filtered_df = filtered_df[filtered_df['Project_Type'] == project_type]
-        if skill != "All":
-            filtered_df = filtered_df[filtered_df['Skill'] == skill]
-        if role != "All":
-            filtered_df = filtered_df[filtered_df['Role'] == role]
-        if location != "All":
-            filtered_df = filtered_df[filtered_df['Location'] == location]
+        # Filter data ("All" selections are skipped by the index)
+        with LATENCY.measure("Project Query search"):
+            filtered_df = get_talent_index().query(
+                Project_Type=project_type, Skill=skill, Role=role, Location=location
+            )
         
         if not filtered_df.empty:
             st.session_state.query_results = filtered_df
@@ -3495,18 +2288,36 @@ elif page == "🔍 Project Query":
                     'location': location
                 }
                 
-                pdf_buffer = generate_pdf_report(filtered_df, query_params)
+                # Rendered only when the download is requested, then served from the report cache
                 st.download_button(
                     label="📄 Download PDF Report",
-                    data=pdf_buffer,
+                    data=lambda: cached_pdf_report(filtered_df, query_params),
                     file_name=f"talent_report_ubs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                     mime="application/pdf",
+                    on_click="ignore",
                     use_container_width=True
                 )
             
             with col_excel:
-                if st.button("📊 Export to Excel", use_container_width=True):
-                    st.info("Excel export ready for download")
+                # Streamed to a temp file in row chunks when the download is requested
+                from talent_export import EXPORT_FORMATS, export_bytes
+                export_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                st.download_button(
+                    label="📊 Export to Excel",
+                    data=lambda: export_bytes(filtered_df, "xlsx"),
+                    file_name=f"talent_results_{export_stamp}.xlsx",
+                    mime=EXPORT_FORMATS["xlsx"][0],
+                    on_click="ignore",
+                    use_container_width=True
+                )
+                st.download_button(
+                    label="🧾 Export to CSV",
+                    data=lambda: export_bytes(filtered_df, "csv"),
+                    file_name=f"talent_results_{export_stamp}.csv",
+                    mime=EXPORT_FORMATS["csv"][0],
+                    on_click="ignore",
+                    use_container_width=True
+                )
             
             with col_schedule:
                 if st.button("📅 Schedule Discussion", use_container_width=True):
@@ -3568,20 +2379,39 @@ elif page == "🔍 Project Query":
             for skill in template['key_skills_required']:
                 st.markdown(f"- {skill}")
             
-            if st.button("🚀 Build This Team", type="primary", use_container_width=True):
-                st.markdown("""
-                <div class="success-msg">
-                    ✅ Team configuration saved! Resource allocation initiated for immediate deployment.
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.info(f"""
-                **Next Steps:**
-                1. Team matching algorithm activated
-                2. Swiss visa status verification in progress
-                3. FINMA compliance check scheduled
-                4. Client onboarding timeline: 5-7 business days
-                """)
+            build_team = st.button("🚀 Build This Team", type="primary", use_container_width=True)
+    
+    if selected_template and build_team:
+        from team_optimizer import assemble_team
+        template = TEAM_TEMPLATES[selected_template]
+        with LATENCY.measure("Team assembly"):
+            solution = assemble_team(
+                get_team_pool(),
+                template['composition'],
+                budget=template['estimated_monthly_cost_chf'],
+                horizon="1 Month",
+                delivery_model="Hybrid_70_30"
+            )
+        
+        if solution.feasible:
+            st.markdown(f"""
+            <div class="success-msg">
+                ✅ {len(solution.members)} associates matched at CHF {solution.monthly_cost:,.0f}/month (Hybrid 70/30, available within a month), CHF {template['estimated_monthly_cost_chf'] - solution.monthly_cost:,.0f} under the template estimate.
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.warning("⚠️ Closest team found; some constraints could not be met:\n\n" +
+                       "\n".join(f"- {issue}" for issue in solution.issues))
+        
+        st.dataframe(solution.members, use_container_width=True)
+        
+        st.info(f"""
+        **Next Steps:**
+        1. Confirm the {len(solution.members)} matched associates with resource managers
+        2. Swiss visa status verification in progress
+        3. FINMA compliance check scheduled
+        4. Client onboarding timeline: 5-7 business days
+        """)
     
     # Cost Calculator
     st.markdown("---")
@@ -3603,35 +2433,69 @@ elif page == "🔍 Project Query":
         team_size = st.slider("👥 Team Size", 5, 50, 20)
     
     if st.button("🧮 Calculate Costs", use_container_width=True):
+        import plotly.graph_objects as go
+        from cost_scenarios import cheapest_frontier, scenario_cost, scenario_grid
         model = COST_MODELS["delivery_models"][delivery_model]
         
-        # Base cost calculation (simplified)
-        base_monthly_cost = team_size * 22 * 1200  # Avg daily rate * working days
-        adjusted_cost = int(base_monthly_cost * model["cost_index"])
-        total_project_cost = adjusted_cost * project_duration
+        # Every model x team size x duration, priced with the selected template's role mix
+        with LATENCY.measure("Cost scenario sweep"):
+            grid = scenario_grid(TEAM_TEMPLATES[selected_template]['composition'])
+            frontier = cheapest_frontier(grid, team_size * project_duration)
+        adjusted_cost, total_project_cost = scenario_cost(grid, delivery_model, team_size, project_duration)
+        onsite_cost, _ = scenario_cost(grid, "Onsite_Only", team_size, project_duration)
         
         st.markdown(f"""
         <div class="executive-summary">
             <h3>💼 Cost Projection: {model['description']}</h3>
             <div style="display: flex; justify-content: space-around; margin-top: 1rem;">
                 <div>
-                    <div class="stat-number">CHF {adjusted_cost:,}</div>
+                    <div class="stat-number">CHF {adjusted_cost:,.0f}</div>
                     <div class="stat-label">Monthly Cost</div>
                 </div>
                 <div>
-                    <div class="stat-number">CHF {total_project_cost:,}</div>
+                    <div class="stat-number">CHF {total_project_cost:,.0f}</div>
                     <div class="stat-label">Total Project Cost</div>
                 </div>
                 <div>
-                    <div class="stat-number">{int((1-model['cost_index'])*100)}%</div>
+                    <div class="stat-number">{int(round((1 - adjusted_cost / onsite_cost) * 100))}%</div>
                     <div class="stat-label">Savings vs Pure Onsite</div>
                 </div>
             </div>
             <p style="margin-top: 1rem;"><strong>Model Benefits:</strong> {', '.join(model['advantages'])}</p>
         </div>
         """, unsafe_allow_html=True)
+        
+        # Cheapest team per model and duration for the same scope (team size x months)
+        fig = go.Figure()
+        for name, points in frontier.groupby("Model", sort=False):
+            fig.add_trace(go.Scatter(
+                x=points["Duration"],
+                y=points["Total_Cost"],
+                customdata=points["Team_Size"],
+                name=COST_MODELS["delivery_models"][name]["description"],
+                mode="lines",
+                line=dict(width=4 if name == delivery_model else 2),
+                hovertemplate="%{x} months, %{customdata} people: CHF %{y:,.0f}<extra></extra>"
+            ))
+        fig.add_trace(go.Scatter(
+            x=[project_duration],
+            y=[total_project_cost],
+            name="Selected scenario",
+            mode="markers",
+            marker=dict(size=14, symbol="star", color="#FF6B35")
+        ))
+        fig.update_layout(
+            title=f"📉 Cheapest Frontier for {team_size * project_duration:,} Person-Months ({TEAM_TEMPLATES[selected_template]['name']} role mix)",
+            xaxis_title="Duration (months)",
+            yaxis_title="Total Project Cost (CHF)",
+            template="plotly_white",
+            height=420
+        )
+        st.plotly_chart(fig, use_container_width=True)
 
 elif page == "📊 Visualizations":
+    import plotly.express as px
+    import plotly.graph_objects as go
     st.markdown("### 📊 Executive Analytics Dashboard")
     
     # Tabs for different visualizations
@@ -3641,55 +2505,56 @@ elif page == "📊 Visualizations":
         # Geographic visualization
         st.markdown("#### Associate Distribution by Location")
         
-        location_summary = df.groupby('Location').agg({
-            'Count': 'sum',
-            'Available_Now': 'sum'
-        }).reset_index()
-        
-        fig_geo = go.Figure()
-        
-        # Add bars for total count
-        fig_geo.add_trace(go.Bar(
-            name='Total Associates',
-            x=location_summary['Location'],
-            y=location_summary['Count'],
-            marker_color='#0072C6',
-            text=location_summary['Count'],
-            textposition='outside'
-        ))
-        
-        # Add bars for available now
-        fig_geo.add_trace(go.Bar(
-            name='Available Now',
-            x=location_summary['Location'],
-            y=location_summary['Available_Now'],
-            marker_color='#4CAF50',
-            text=location_summary['Available_Now'],
-            textposition='outside'
-        ))
+        def build_location_bars():
+            location_summary = get_talent_cube().frame(['Location'])
+            
+            fig_geo = go.Figure()
+            
+            # Add bars for total count
+            fig_geo.add_trace(go.Bar(
+                name='Total Associates',
+                x=location_summary['Location'],
+                y=location_summary['Count'],
+                marker_color='#0072C6',
+                text=location_summary['Count'],
+                textposition='outside'
+            ))
+            
+            # Add bars for available now
+            fig_geo.add_trace(go.Bar(
+                name='Available Now',
+                x=location_summary['Location'],
+                y=location_summary['Available_Now'],
+                marker_color='#4CAF50',
+                text=location_summary['Available_Now'],
+                textposition='outside'
+            ))
+            
+            fig_geo.update_layout(
+                barmode='group',
+                height=500,
+                title={
+                    'text': 'Talent Distribution Across Delivery Centers',
+                    'font': {'size': 20, 'family': 'Inter'}
+                },
+                xaxis_title="Location",
+                yaxis_title="Number of Associates",
+                font=dict(family="Inter", size=12),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                ),
+                hovermode='x unified'
+            )
+            return fig_geo
         
-        fig_geo.update_layout(
-            barmode='group',
-            height=500,
-            title={
-                'text': 'Talent Distribution Across Delivery Centers',
-                'font': {'size': 20, 'family': 'Inter'}
-            },
-            xaxis_title="Location",
-            yaxis_title="Number of Associates",
-            font=dict(family="Inter", size=12),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            ),
-            hovermode='x unified'
-        )
+        fig_geo = cached_figure("viz_location_bars", dataset_version(), build_location_bars)
         
         st.plotly_chart(fig_geo, use_container_width=True)
         
@@ -3723,45 +2588,43 @@ elif page == "📊 Visualizations":
         # Project-wise analysis
         st.markdown("#### Project Type Analysis")
         
-        # Stacked bar chart for project types
-        project_pivot = df.pivot_table(
-            values='Count',
-            index='Project_Type',
-            columns='Skill',
-            aggfunc='sum',
-            fill_value=0
-        )
-        
-        fig_project = go.Figure()
-        
-        colors = ['#0072C6', '#D40511', '#4CAF50', '#FF9800', '#9C27B0']
-        
-        for i, skill in enumerate(project_pivot.columns):
-            fig_project.add_trace(go.Bar(
-                name=skill,
-                x=project_pivot.index,
-                y=project_pivot[skill],
-                marker_color=colors[i % len(colors)],
-                text=project_pivot[skill],
-                textposition='inside',
-                textfont=dict(color='white', size=12, family='Inter')
-            ))
+        def build_project_stack():
+            # Stacked bar chart for project types
+            project_pivot = get_talent_cube().pivot('Project_Type', 'Skill', 'Count')
+            
+            fig_project = go.Figure()
+            
+            colors = ['#0072C6', '#D40511', '#4CAF50', '#FF9800', '#9C27B0']
+            
+            for i, skill in enumerate(project_pivot.columns):
+                fig_project.add_trace(go.Bar(
+                    name=skill,
+                    x=project_pivot.index,
+                    y=project_pivot[skill],
+                    marker_color=colors[i % len(colors)],
+                    text=project_pivot[skill],
+                    textposition='inside',
+                    textfont=dict(color='white', size=12, family='Inter')
+                ))
+            
+            fig_project.update_layout(
+                barmode='stack',
+                height=500,
+                title={
+                    'text': 'Skill Distribution Across UBS Project Types',
+                    'font': {'size': 20, 'family': 'Inter'}
+                },
+                xaxis_title="Project Type",
+                yaxis_title="Number of Associates",
+                font=dict(family="Inter", size=12),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                showlegend=True,
+                hovermode='x unified'
+            )
+            return fig_project
         
-        fig_project.update_layout(
-            barmode='stack',
-            height=500,
-            title={
-                'text': 'Skill Distribution Across UBS Project Types',
-                'font': {'size': 20, 'family': 'Inter'}
-            },
-            xaxis_title="Project Type",
-            yaxis_title="Number of Associates",
-            font=dict(family="Inter", size=12),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            showlegend=True,
-            hovermode='x unified'
-        )
+        fig_project = cached_figure("viz_project_stack", dataset_version(), build_project_stack)
         
         st.plotly_chart(fig_project, use_container_width=True)
         
@@ -3790,40 +2653,44 @@ elif page == "📊 Visualizations":
         # Trend Analysis
         st.markdown("#### 📈 Talent Growth Trends")
         
-        # Mock trend data
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-        trends = {
-            'AI': [420, 445, 470, 495, 520, 550],
-            'Python': [380, 390, 410, 425, 440, 460],
-            'Cloud': [340, 355, 370, 385, 400, 420]
-        }
-        
-        fig_trend = go.Figure()
-        
-        for skill, values in trends.items():
-            fig_trend.add_trace(go.Scatter(
-                x=months,
-                y=values,
-                mode='lines+markers',
-                name=skill,
-                line=dict(width=3),
-                marker=dict(size=8)
-            ))
+        def build_trend_lines():
+            # Mock trend data
+            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
+            trends = {
+                'AI': [420, 445, 470, 495, 520, 550],
+                'Python': [380, 390, 410, 425, 440, 460],
+                'Cloud': [340, 355, 370, 385, 400, 420]
+            }
+            
+            fig_trend = go.Figure()
+            
+            for skill, values in trends.items():
+                fig_trend.add_trace(go.Scatter(
+                    x=months,
+                    y=values,
+                    mode='lines+markers',
+                    name=skill,
+                    line=dict(width=3),
+                    marker=dict(size=8)
+                ))
+            
+            fig_trend.update_layout(
+                height=400,
+                title={
+                    'text': '6-Month Talent Growth Trajectory',
+                    'font': {'size': 20, 'family': 'Inter'}
+                },
+                xaxis_title="Month (2025)",
+                yaxis_title="Number of Associates",
+                font=dict(family="Inter", size=12),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                hovermode='x unified',
+                showlegend=True
+            )
+            return fig_trend
         
-        fig_trend.update_layout(
-            height=400,
-            title={
-                'text': '6-Month Talent Growth Trajectory',
-                'font': {'size': 20, 'family': 'Inter'}
-            },
-            xaxis_title="Month (2025)",
-            yaxis_title="Number of Associates",
-            font=dict(family="Inter", size=12),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            hovermode='x unified',
-            showlegend=True
-        )
+        fig_trend = cached_figure("viz_trend_lines", dataset_version(), build_trend_lines)
         
         st.plotly_chart(fig_trend, use_container_width=True)
         
@@ -3840,40 +2707,32 @@ elif page == "📊 Visualizations":
         # Skill Matrix Heatmap
         st.markdown("#### 🎯 Skill Availability Matrix")
         
-        # Create availability heatmap
-        pivot_avail = df.pivot_table(
-            values='Available_Now',
-            index='Project_Type',
-            columns='Skill',
-            aggfunc='sum',
-            fill_value=0
-        )
-        
-        fig_heatmap = px.imshow(
-            pivot_avail,
-            labels=dict(x="Skill", y="Project Type", color="Available Associates"),
-            color_continuous_scale='Blues',
-            aspect='auto',
-            title='Real-Time Availability Heatmap'
-        )
-        
-        fig_heatmap.update_layout(
-            height=400,
-            font=dict(family="Inter", size=12),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+        def build_availability_heatmap():
+            # Create availability heatmap
+            pivot_avail = get_talent_cube().pivot('Project_Type', 'Skill', 'Available_Now')
+            
+            # Cell values are drawn by the heatmap trace itself (texttemplate) rather
+            # than one annotation per cell; plotly.js picks black or white text per
+            # cell for contrast.
+            fig_heatmap = px.imshow(
+                pivot_avail,
+                labels=dict(x="Skill", y="Project Type", color="Available Associates"),
+                color_continuous_scale='Blues',
+                aspect='auto',
+                title='Real-Time Availability Heatmap',
+                text_auto=True
+            )
+            
+            fig_heatmap.update_traces(textfont=dict(size=12))
+            fig_heatmap.update_layout(
+                height=400,
+                font=dict(family="Inter", size=12),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)'
+            )
+            return fig_heatmap
         
-        # Add text annotations
-        for i in range(len(pivot_avail.index)):
-            for j in range(len(pivot_avail.columns)):
-                fig_heatmap.add_annotation(
-                    text=str(pivot_avail.iloc[i, j]),
-                    x=j,
-                    y=i,
-                    showarrow=False,
-                    font=dict(color='white' if pivot_avail.iloc[i, j] > 50 else 'black', size=12)
-                )
+        fig_heatmap = cached_figure("viz_availability_heatmap", dataset_version(), build_availability_heatmap)
         
         st.plotly_chart(fig_heatmap, use_container_width=True)
 
@@ -3911,20 +2770,17 @@ elif page == "📅 Availability":
         )
     
     # Apply filters
-    availability_df = df.copy()
-    
-    if project_filter != "All":
-        availability_df = availability_df[availability_df['Project_Type'] == project_filter]
-    if location_filter != "All":
-        availability_df = availability_df[availability_df['Location'] == location_filter]
+    talent_index = get_talent_index()
+    availability_rows = talent_index.lookup(Project_Type=project_filter, Location=location_filter)
+    availability_df = talent_index.rows(availability_rows)
     
     # Availability metrics
     st.markdown("---")
     col_m1, col_m2, col_m3, col_m4 = st.columns(4)
     
-    total_available_now = availability_df['Available_Now'].sum()
-    total_available_month = availability_df['Available_1_Month'].sum()
-    total_count = availability_df['Count'].sum()
+    total_available_now = talent_index.sum('Available_Now', availability_rows)
+    total_available_month = talent_index.sum('Available_1_Month', availability_rows)
+    total_count = talent_index.sum('Count', availability_rows)
     
     with col_m1:
         st.markdown(f"""
@@ -3989,7 +2845,7 @@ elif page == "📅 Availability":
     with col_cal1:
         if st.button("🚀 Generate Deployment Plan", type="primary", use_container_width=True):
             with st.spinner("🤖 AI optimizing deployment schedule..."):
-                time.sleep(1.5)
+                simulate_latency(1.5)
             
             st.markdown("""
             <div class="success-msg">
@@ -4045,10 +2901,10 @@ elif page == "👥 Team Builder":
 elif page == "📈 Project Query":
     show_project_query()
 elif page == "📊 Advanced Analytics":
-    # Import and use the advanced analytics module
-    from enhanced_data_structure import create_streamlit_dataset
-    advanced_df = create_streamlit_dataset()
-    show_advanced_analytics(advanced_df)
+    # Import and use the advanced analytics module (pulls in plotly on first visit)
+    from advanced_analytics import show_advanced_analytics
+    advanced_df = create_mock_data()
+    show_advanced_analytics(advanced_df, seed=DEFAULT_SEED, version=dataset_version())
 elif page == "🤖 AI & ML":
     show_ai_ml_features()
 elif page == "🔗 Integrations":
@@ -4203,4 +3059,7 @@ with footer_cols[3]:
     <div style="text-align: center;">
         <span style="color: #666;">Pune: 19:02</span>
     </div>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    """, unsafe_allow_html=True)
+
+# Record this rerun's compute time against the page it rendered
+LATENCY.record(f"Render {page}", time.perf_counter() - RUN_STARTED)
@@ -0,0 +1,91 @@
+# Nightly batch of talent reports, one per staffed Project_Type x Location
+# Report builds fan out over a process pool; each worker regenerates the
+# seeded dataset once in its initializer, so only (project, location) pairs
+# cross the process boundary
+#
+# Usage: python batch_reports.py --out reports/ [--seed 42] [--workers 8] [--summary-only]
+
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset
+from pdf_report import generate_pdf_report
+from talent_index import TalentIndex
+from talent_snapshot import load_or_build
+
+# Per-process state set by _init_worker
+_WORKER = {}
+
+def _init_worker(seed, out_dir, include_details):
+    """Build the dataset and its index once per worker process"""
+    df = load_or_build("streamlit_dataset", create_streamlit_dataset, seed=seed)
+    _WORKER.update(index=TalentIndex(df), out_dir=Path(out_dir), include_details=include_details)
+
+def _slug(value):
+    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+
+def report_path(out_dir, project_type, location):
+    """Output file for one (project type, location) report"""
+    return Path(out_dir) / f"talent_report_{_slug(project_type)}_{_slug(location)}.pdf"
+
+def _build_report(project_type, location):
+    """Render one report in a worker; returns (path, rows, seconds, bytes)"""
+    start = time.perf_counter()
+    index = _WORKER["index"]
+    data = index.query(Project_Type=project_type, Location=location)
+    query_params = {'project_type': project_type, 'skill': 'All', 'role': 'All', 'location': location}
+    path = report_path(_WORKER["out_dir"], project_type, location)
+    with open(path, "wb") as output:
+        generate_pdf_report(data, query_params, output=output, include_details=_WORKER["include_details"])
+    return str(path), len(data), time.perf_counter() - start, path.stat().st_size
+
+def staffed_pairs(df):
+    """(Project_Type, Location) pairs with at least one row in `df`"""
+    pairs = df.groupby(["Project_Type", "Location"], observed=True).size()
+    return list(pairs[pairs > 0].index)
+
+def run_batch(out_dir, seed=DEFAULT_SEED, workers=None, include_details=True, jobs=None):
+    """Build every report in `jobs` (default: the Project_Type x Location pairs with rows).
+
+    Returns a list of (path, rows, seconds, bytes) tuples and the wall time.
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if jobs is None:
+        jobs = staffed_pairs(load_or_build("streamlit_dataset", create_streamlit_dataset, seed=seed))
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(seed, str(out_dir), include_details)) as pool:
+        futures = [pool.submit(_build_report, project, location) for project, location in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Build one talent report per staffed Project_Type x Location")
+    parser.add_argument("--out", default="reports", help="Output directory for the PDFs")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--summary-only", action="store_true", help="Skip the detailed breakdown tables")
+    parser.add_argument("--verbose", action="store_true", help="Print every report's timing")
+    args = parser.parse_args()
+
+    results, elapsed = run_batch(args.out, seed=args.seed, workers=args.workers,
+                                 include_details=not args.summary_only)
+    timings = np.array([seconds for _, _, seconds, _ in results]) * 1000
+    if args.verbose:
+        for path, rows, seconds, size in sorted(results):
+            print(f"{path}: {rows} rows, {seconds * 1000:.1f} ms, {size / 1e3:.1f} KB")
+    print(f"{len(results)} reports in {elapsed:.2f}s with {args.workers} workers "
+          f"({len(results) / elapsed:.1f} reports/s) -> {args.out}")
+    print(f"per report: p50 {np.percentile(timings, 50):.1f} ms, p95 {np.percentile(timings, 95):.1f} ms, "
+          f"max {timings.max():.1f} ms, total {sum(size for *_, size in results) / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
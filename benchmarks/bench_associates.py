@@ -0,0 +1,29 @@
+# Throughput benchmark for the column-at-a-time associate generator
+#
+# Usage: python benchmarks/bench_associates.py [num_associates ...]
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from enhanced_data_structure import generate_associates_data
+
+DEFAULT_SIZES = [2_000, 100_000, 1_000_000]
+
+def bench(num_associates, repeats=3):
+    """Return the best wall time in seconds over `repeats` generations"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        generate_associates_data(num_associates, seed=0)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'associates':>12} {'seconds':>10} {'rows/sec':>12}")
+    for size in sizes:
+        seconds = bench(size, repeats=3 if size <= 100_000 else 1)
+        print(f"{size:>12,} {seconds:>10.3f} {size / seconds:>12,.0f}")
@@ -0,0 +1,54 @@
+# Cost model vs the simulated per-location rate scans
+# Times the old show_cost_optimization rate logic (copy, noisy rate column,
+# one boolean scan per location) against cost_model.location_rates on the
+# app dataset resampled to larger row counts
+#
+# Usage: python benchmarks/bench_cost_model.py [rows ...]
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cost_model import location_rates
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset
+
+LOCATIONS = ['Zurich', 'Pune', 'Bangalore', 'Chennai']
+
+def simulated_rates(df, rng):
+    """The previous logic: mutate a copy, then scan it once per location"""
+    df = df.copy()
+    df['simulated_rate'] = df['Experience_Years'] * 50 + rng.normal(0, 20, len(df))
+    df.loc[df['Location'] == 'Zurich', 'simulated_rate'] *= 1.8
+    df.loc[df['Location'] == 'Pune', 'simulated_rate'] *= 0.6
+    df[df['Location'] == 'Zurich']['simulated_rate'].mean()
+    df[df['Location'] == 'Pune']['simulated_rate'].mean()
+    [df[df['Location'] == loc]['simulated_rate'].mean() for loc in LOCATIONS if len(df[df['Location'] == loc]) > 0]
+    [loc for loc in LOCATIONS if len(df[df['Location'] == loc]) > 0]
+    df.groupby('Location', observed=True).agg({'Experience_Years': 'mean', 'simulated_rate': 'mean', 'Count': 'sum'})
+
+def cost_model_rates(df):
+    """Cost and performance tabs each read one location_rates summary"""
+    location_rates(df)
+    location_rates(df)
+
+def best_ms(func, *args, number=5):
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=3)) / number * 1000
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 10_000, 100_000]
+    base = create_streamlit_dataset(DEFAULT_SEED)
+    print(f"{'Rows':>8} {'Simulated':>12} {'Cost model':>12}")
+    for rows in sizes:
+        df = base if rows == len(base) else base.sample(rows, replace=True, random_state=0).reset_index(drop=True)
+        columns = list(df.columns)
+        old = best_ms(simulated_rates, df, np.random.default_rng(0))
+        new = best_ms(cost_model_rates, df)
+        assert list(df.columns) == columns
+        print(f"{rows:>8,} {old:>10.2f}ms {new:>10.2f}ms")
+
+if __name__ == "__main__":
+    main()
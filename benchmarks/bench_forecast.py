@@ -0,0 +1,67 @@
+# Demand forecaster throughput
+# Fits Holt models for every Project_Type x Skill series of synthetic talent
+# snapshots (extra project types and skills widen the series count), then
+# times the incremental update and the forecast
+#
+# Usage: python benchmarks/bench_forecast.py [series ...]
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from demand_forecast import DemandForecaster
+
+PERIODS = 24
+ROWS_PER_SERIES = 4
+SKILLS = 25
+
+def snapshots(project_types, skills, periods, rng):
+    """Monthly talent frames with a trend and annual cycle per series"""
+    n_series = len(project_types) * len(skills)
+    series = np.repeat(np.arange(n_series), ROWS_PER_SERIES)
+    base = pd.DataFrame({
+        "Project_Type": pd.Categorical.from_codes(series // len(skills), project_types),
+        "Skill": pd.Categorical.from_codes(series % len(skills), skills)
+    })
+    level = rng.uniform(10, 80, n_series)[series]
+    growth = rng.normal(0.2, 0.5, n_series)[series]
+    phase = rng.uniform(0, 2 * np.pi, n_series)[series]
+    for month, date in enumerate(pd.date_range("2023-01-01", periods=periods, freq="MS")):
+        count = level + growth * month + 5 * np.sin(2 * np.pi * month / 12 + phase) + rng.normal(0, 2, len(series))
+        yield date, base.assign(Count=np.maximum(count, 0).round())
+
+def best_ms(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 500, 1000, 5000]
+    rng = np.random.default_rng(0)
+    print(f"{'Series':>7} {'Fit':>10} {'Update':>10} {'Forecast':>10}")
+    for size in sizes:
+        skills = [f"Skill {i}" for i in range(SKILLS)]
+        project_types = [f"Project {i}" for i in range(max(size // SKILLS, 1))]
+        history = list(snapshots(project_types, skills, PERIODS + 1, rng))
+        *fitting, (period, latest) = history
+
+        def make():
+            return DemandForecaster(categories=(project_types, skills), refit_every=float("inf")).extend(fitting)
+
+        fit = best_ms(make)
+        fitted = iter([make() for _ in range(5)])
+        update = best_ms(lambda: next(fitted).add_snapshot(latest, period))
+        forecaster = make()
+        forecast = best_ms(lambda: forecaster.forecast(12))
+        print(f"{len(forecaster.series):>7,} {fit:>8.1f}ms {update:>8.2f}ms {forecast:>8.2f}ms")
+
+if __name__ == "__main__":
+    main()
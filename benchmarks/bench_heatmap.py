@@ -0,0 +1,64 @@
+# Heatmap cell labels: one layout annotation per cell (the old Skill Matrix
+# loop) vs. the heatmap trace's own texttemplate (px.imshow text_auto=True)
+#
+# Usage: python benchmarks/bench_heatmap.py [max_annotated_cells]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+SIZES = [(10, 5), (10, 20), (20, 25), (100, 100), (100, 500)]
+
+def random_pivot(rows, columns, rng):
+    """Project_Type x Skill shaped matrix of availability counts"""
+    return pd.DataFrame(
+        rng.integers(0, 100, (rows, columns)),
+        index=[f"Project {i}" for i in range(rows)],
+        columns=[f"Skill {j}" for j in range(columns)]
+    )
+
+def annotated_heatmap(pivot):
+    fig = px.imshow(pivot, color_continuous_scale='Blues', aspect='auto')
+    for i in range(len(pivot.index)):
+        for j in range(len(pivot.columns)):
+            fig.add_annotation(
+                text=str(pivot.iloc[i, j]),
+                x=j,
+                y=i,
+                showarrow=False,
+                font=dict(color='white' if pivot.iloc[i, j] > 50 else 'black', size=12)
+            )
+    return fig
+
+def texttemplate_heatmap(pivot):
+    fig = px.imshow(pivot, color_continuous_scale='Blues', aspect='auto', text_auto=True)
+    fig.update_traces(textfont=dict(size=12))
+    return fig
+
+def measure(build, pivot):
+    """(ms to build and serialize, serialized KB)"""
+    start = time.perf_counter()
+    spec = build(pivot).to_json()
+    return (time.perf_counter() - start) * 1e3, len(spec) / 1024
+
+def main():
+    max_annotated = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = np.random.default_rng(0)
+    texttemplate_heatmap(random_pivot(2, 2, rng)).to_json()  # warm up plotly validators
+
+    print(f"{'Cells':>12} {'annotations':>20} {'texttemplate':>20}")
+    for rows, columns in SIZES:
+        pivot = random_pivot(rows, columns, rng)
+        new_ms, new_kb = measure(texttemplate_heatmap, pivot)
+        if rows * columns <= max_annotated:
+            old_ms, old_kb = measure(annotated_heatmap, pivot)
+            old = f"{old_ms:9.0f}ms {old_kb:6.0f}KB"
+        else:
+            old = f"{'skipped':>17}"
+        print(f"{rows:>5}x{columns:<6} {old:>20} {new_ms:9.0f}ms {new_kb:6.0f}KB")
+
+if __name__ == "__main__":
+    main()
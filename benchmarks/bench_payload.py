@@ -0,0 +1,75 @@
+# Websocket payload per rerun of the Streamlit app
+# Replays a short browser session (first load, rerun, page switches) and sums
+# the serialized ForwardMsgs the server would send, honouring Streamlit's
+# message cache: deltas the browser already holds go out as hash references
+#
+# Usage: python benchmarks/bench_payload.py [path/to/app.py]
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+from streamlit.testing.v1 import AppTest
+
+SESSION = [None, None, "❓ Help", "📊 Dashboard", "📊 Dashboard"]
+
+class PayloadMeter:
+    """Counts bytes enqueued per script run, emulating the browser's message cache"""
+
+    def __init__(self):
+        self.browser_cache = set()
+        self.sent = 0
+        self.full = 0
+        self.references = 0
+
+    def install(self):
+        original = ScriptRunContext.enqueue
+        meter = self
+
+        def enqueue(ctx, msg):
+            populate_hash_if_needed(msg)
+            size = msg.ByteSize()
+            if msg.metadata.cacheable and msg.hash in meter.browser_cache:
+                reference = ForwardMsg()
+                reference.ref_hash = msg.hash
+                meter.sent += reference.ByteSize()
+                meter.references += 1
+            else:
+                meter.sent += size
+                meter.full += 1
+                if msg.metadata.cacheable:
+                    meter.browser_cache.add(msg.hash)
+            return original(ctx, msg)
+
+        ScriptRunContext.enqueue = enqueue
+
+    def take(self):
+        """(bytes, full messages, references) since the last call"""
+        result = (self.sent, self.full, self.references)
+        self.sent = self.full = self.references = 0
+        return result
+
+def main():
+    app = sys.argv[1] if len(sys.argv) > 1 else str(Path(__file__).resolve().parent.parent / "app.py")
+    meter = PayloadMeter()
+    meter.install()
+
+    at = AppTest.from_file(app, default_timeout=120)
+    print(f"{'Run':<24} {'Sent':>10} {'Full msgs':>10} {'Refs':>6}")
+    for step, page in enumerate(SESSION):
+        if page is None:
+            at.run()
+            label = "first load" if step == 0 else "rerun"
+        else:
+            at.sidebar.radio[0].set_value(page).run()
+            label = page
+        assert not at.exception, at.exception
+        sent, full, references = meter.take()
+        print(f"{label:<24} {sent / 1024:8.1f}KB {full:10d} {references:6d}")
+
+if __name__ == "__main__":
+    main()
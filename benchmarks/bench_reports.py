@@ -0,0 +1,44 @@
+# PDF report throughput: summary-only vs. full-detail reports, with the shared
+# prebuilt theme vs. rebuilding every style per report (the old behaviour)
+#
+# Usage: python benchmarks/bench_reports.py [detail_rows] [seconds_per_case]
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from enhanced_data_structure import create_streamlit_dataset
+from pdf_report import REPORT_THEMES, build_report_theme, generate_pdf_report
+
+QUERY_PARAMS = {'project_type': 'All', 'skill': 'All', 'role': 'All', 'location': 'All'}
+
+def reports_per_second(render, seconds):
+    """Render repeatedly for about `seconds` and return (reports/sec, ms/report)"""
+    render()  # warm up fonts and imports
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        render()
+        count += 1
+    elapsed = time.perf_counter() - start
+    return count / elapsed, elapsed / count * 1000
+
+def rebuilt_theme_render(data, include_details):
+    """Emulate the old per-call style construction"""
+    REPORT_THEMES["bench-rebuilt"] = build_report_theme()
+    return generate_pdf_report(data, QUERY_PARAMS, include_details=include_details, theme="bench-rebuilt")
+
+if __name__ == "__main__":
+    detail_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    dataset = create_streamlit_dataset(seed=0)
+    data = dataset.sample(detail_rows, replace=detail_rows > len(dataset), random_state=0)
+
+    print(f"Report data: {len(data):,} rows")
+    for include_details, label in [(False, "summary-only"), (True, "full-detail")]:
+        shared = reports_per_second(
+            lambda: generate_pdf_report(data, QUERY_PARAMS, include_details=include_details), seconds)
+        rebuilt = reports_per_second(lambda: rebuilt_theme_render(data, include_details), seconds)
+        print(f"  {label:<13} shared theme: {shared[0]:7.1f} reports/s ({shared[1]:6.1f} ms) | "
+              f"rebuilt per report: {rebuilt[0]:7.1f} reports/s ({rebuilt[1]:6.1f} ms)")
@@ -0,0 +1,45 @@
+# Memory and filter latency of the categorical schema vs. plain string columns
+#
+# Usage: python benchmarks/bench_schema.py [num_associates]
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from enhanced_data_structure import create_streamlit_dataset, generate_associates_data
+from talent_schema import ASSOCIATE_SCHEMA, DATASET_SCHEMA
+
+# (frame, column, value) filters mirroring the app's df[df[column] == value] lookups
+FILTERS = {
+    "dataset": [("Location", "Zurich"), ("Skill", "Avaloq"), ("Project_Type", "CS Integration")],
+    "associates": [("Location", "Zurich"), ("Role", "Software_Engineer"), ("Visa_Status", "Swiss Permit B")]
+}
+
+def memory_kb(df, columns):
+    """Deep memory usage of `columns` in KB"""
+    return df[columns].memory_usage(deep=True, index=False).sum() / 1e3
+
+def best_us(statement, number=20):
+    """Best per-call latency of `statement` in microseconds"""
+    return min(timeit.Timer(statement).repeat(repeat=5, number=number)) / number * 1e6
+
+def report(name, typed, schema):
+    """Print memory and filter latency before (strings) and after (categoricals)"""
+    columns = list(schema)
+    plain = typed.astype({column: str for column in columns})
+    print(f"\n{name}: {len(typed):,} rows")
+    print(f"  memory of {', '.join(columns)}: "
+          f"{memory_kb(plain, columns):,.1f} KB -> {memory_kb(typed, columns):,.1f} KB")
+    for column, value in FILTERS[name]:
+        for label, statement in [("mask  ", lambda df: df[column] == value),
+                                 ("filter", lambda df: df[df[column] == value])]:
+            before = best_us(lambda: statement(plain))
+            after = best_us(lambda: statement(typed))
+            print(f"  {label} {column} == '{value}': {before:,.0f}us -> {after:,.0f}us ({before / after:.1f}x)")
+
+if __name__ == "__main__":
+    num_associates = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    report("dataset", create_streamlit_dataset(seed=0), DATASET_SCHEMA)
+    report("associates", generate_associates_data(num_associates, seed=0), ASSOCIATE_SCHEMA)
@@ -0,0 +1,89 @@
+# Cold-start cost of the Streamlit app and its heavy dependencies
+# Part 1 measures the marginal `python -X importtime` cost of each optional
+# dependency on top of streamlit + pandas; part 2 runs app.py in a fresh
+# process per page and reports the first-run time and which heavy modules
+# that page pulled in
+#
+# Usage: python benchmarks/bench_startup.py [repeats]
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Loaded by every run of the script
+BASELINE_MODULES = ["streamlit", "pandas"]
+
+HEAVY_MODULES = [
+    "plotly.express",
+    "plotly.graph_objects",
+    "reportlab.platypus",
+    "qrcode",
+    "PIL.Image",
+    "openpyxl",
+    "advanced_analytics",
+    "pdf_report",
+    "talent_export"
+]
+
+PAGES = ["🏠 Introduction", "❓ Help", "📊 Dashboard", "📊 Advanced Analytics"]
+
+PAGE_PROBE = """
+import sys, time
+from streamlit.testing.v1 import AppTest
+heavy = {heavy!r}
+at = AppTest.from_file({app!r}, default_timeout=120)
+start = time.perf_counter()
+at.run()
+if {page!r} != at.sidebar.radio[0].value:
+    at.sidebar.radio[0].set_value({page!r}).run()
+elapsed = time.perf_counter() - start
+assert not at.exception, at.exception
+print(elapsed, ",".join(name for name in heavy if name in sys.modules))
+"""
+
+def marginal_import_ms(module):
+    """Cumulative import time (ms) of `module` after the baseline modules are loaded"""
+    command = [sys.executable, "-X", "importtime", "-c",
+               f"import {', '.join(BASELINE_MODULES)}; import {module}"]
+    stderr = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True).stderr
+    total, counting = 0, False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: <self> | <cumulative> | <name indented by nesting depth>"
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            continue  # nested import, already part of its parent's cumulative time
+        if counting:
+            total += int(cumulative)
+        elif name.strip() == BASELINE_MODULES[-1]:
+            counting = True
+    return total / 1000
+
+def page_cold_start(page):
+    """(seconds, heavy modules loaded) for a fresh process rendering `page`"""
+    probe = PAGE_PROBE.format(heavy=HEAVY_MODULES, app=str(ROOT / "app.py"), page=page)
+    result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    elapsed, _, loaded = result.stdout.strip().splitlines()[-1].partition(" ")
+    return float(elapsed), loaded.split(",") if loaded else []
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f"Marginal import cost over {' + '.join(BASELINE_MODULES)} (best of {repeats})")
+    for module in HEAVY_MODULES:
+        best = min(marginal_import_ms(module) for _ in range(repeats))
+        print(f"  {module:<22} {best:8.1f} ms")
+
+    print("\nFresh-process first render per page")
+    for page in PAGES:
+        start = time.perf_counter()
+        elapsed, loaded = page_cold_start(page)
+        print(f"  {page:<24} {elapsed:6.2f}s render, {time.perf_counter() - start:6.2f}s process; "
+              f"heavy: {', '.join(loaded) or 'none'}")
+
+if __name__ == "__main__":
+    main()
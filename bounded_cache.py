@@ -0,0 +1,108 @@
+# Bounded LRU cache for expensive rendered artifacts (PDF reports, figures)
+# Evicts least recently used entries when either the entry count or the total
+# payload size exceeds its limit; safe to share across sessions and threads
+
+import threading
+from collections import OrderedDict
+
+def payload_size(value):
+    """Approximate size in bytes of a cached value"""
+    if hasattr(value, "getbuffer"):
+        return value.getbuffer().nbytes
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+class BoundedCache:
+    """LRU cache limited by entry count and total bytes, with hit/miss stats"""
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 * 1024, sizeof=payload_size):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._building = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Cached value for `key` (marking it most recently used) or `default`"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store `value`, evicting old entries to stay within both limits.
+
+        A value larger than max_bytes is returned but not stored.
+        """
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    def get_or_build(self, key, builder):
+        """Cached value for `key`, calling `builder()` on a miss.
+
+        Concurrent requests for the same key wait for a single build;
+        builds for different keys run in parallel.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            key_lock = self._building.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key][0]
+                self.misses += 1
+            try:
+                return self.put(key, builder())
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """Hit/miss/eviction counters and current usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,106 @@
+# Talent cost model
+# Day rates come from the ROLES_HIERARCHY rate card, scaled by a per-location
+# factor (offshore locations bill at OFFSHORE_RATE_FACTOR) and, onshore, by the
+# same experience premium the associate generator applies. Every function reads
+# the frame it is given and returns new objects, so the shared dataset can be
+# passed in directly
+
+import numpy as np
+import pandas as pd
+
+from enhanced_data_structure import (
+    COST_MODELS, OFFSHORE_LOCATIONS, OFFSHORE_RATE_FACTOR, ROLE_LABELS, ROLES_HIERARCHY, SWISS_LOCATIONS
+)
+
+HOURS_PER_DAY = 8
+WORKING_DAYS_PER_YEAR = 220
+EXPERIENCE_RATE_STEP = 0.02  # onshore premium per year above the role's minimum
+
+def _rate_card():
+    """Day rate and minimum experience per role, under hierarchy and dataset labels"""
+    card = {}
+    for roles in ROLES_HIERARCHY.values():
+        for role, info in roles.items():
+            card[role.replace("_", " ")] = (info["day_rate_chf"], info["min_exp"])
+    for role, label in ROLE_LABELS.items():
+        card[label] = card[role.replace("_", " ")]
+    return card
+
+RATE_CARD = _rate_card()
+ROLE_DAY_RATES = {role: rate for role, (rate, _) in RATE_CARD.items()}
+ROLE_MIN_EXPERIENCE = {role: min_exp for role, (_, min_exp) in RATE_CARD.items()}
+
+# Swiss (onshore) share of the team in each COST_MODELS delivery model
+DELIVERY_ONSHORE_SHARE = {
+    "Onsite_Only": 1.0,
+    "Hybrid_70_30": 0.7,
+    "Hybrid_50_50": 0.5,
+    "Offshore_Led": 0.3
+}
+
+def _delivery_offshore_rate_factors():
+    """Offshore rate factor per delivery model, calibrated so that a team at
+    exactly the model's onshore share costs its COST_MODELS cost_index"""
+    factors = {}
+    for model, share in DELIVERY_ONSHORE_SHARE.items():
+        cost_index = COST_MODELS["delivery_models"][model]["cost_index"]
+        factors[model] = (cost_index - share) / (1 - share) if share < 1 else OFFSHORE_RATE_FACTOR
+    return factors
+
+DELIVERY_OFFSHORE_RATE_FACTORS = _delivery_offshore_rate_factors()
+
+LOCATION_RATE_FACTORS = {
+    **{location: 1.0 for location in SWISS_LOCATIONS},
+    **{location: OFFSHORE_RATE_FACTOR for location in OFFSHORE_LOCATIONS}
+}
+
+def _lookup(column, table):
+    """Map a label column through `table` as a float array (NaN when missing).
+
+    Categoricals are mapped once per category and expanded through their codes.
+    """
+    column = pd.Series(column, copy=False)
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        values = np.append([table.get(label, np.nan) for label in column.cat.categories], np.nan)
+        return values.astype(float)[column.cat.codes.to_numpy()]
+    return column.map(table).to_numpy(dtype=float, na_value=np.nan)
+
+def day_rates(df):
+    """CHF day rate per row of `df` (Role and Location, optionally Experience_Years).
+
+    Roles or locations missing from the rate card yield NaN.
+    """
+    factors = _lookup(df["Location"], LOCATION_RATE_FACTORS)
+    rates = _lookup(df["Role"], ROLE_DAY_RATES) * factors
+    if "Experience_Years" in df:
+        extra_years = df["Experience_Years"].to_numpy(dtype=float) - _lookup(df["Role"], ROLE_MIN_EXPERIENCE)
+        onshore = factors == 1.0
+        rates = rates * np.where(onshore, 1 + np.clip(extra_years, 0, None) * EXPERIENCE_RATE_STEP, 1.0)
+    return pd.Series(rates, index=df.index).round(0)
+
+def location_rates(df):
+    """Headcount-weighted rates per location, from one grouped pass.
+
+    Returns a frame indexed by Location with Headcount, Day_Rate,
+    Hourly_Rate, Experience_Years (weighted mean) and Annual_Cost.
+    """
+    codes, locations = pd.factorize(df["Location"], sort=True)
+    counts = np.where(codes >= 0, df["Count"].to_numpy(dtype=float), 0)
+    codes = np.maximum(codes, 0)  # rows without a location carry no headcount
+    headcount, day_cost, experience = (
+        np.bincount(codes, weights=weights, minlength=len(locations))
+        for weights in (counts, np.nan_to_num(day_rates(df).to_numpy()) * counts, df["Experience_Years"].to_numpy(dtype=float) * counts)
+    )
+    staffed = headcount > 0
+    headcount, day_cost, experience = headcount[staffed], day_cost[staffed], experience[staffed]
+    return pd.DataFrame({
+        "Headcount": headcount.astype(int),
+        "Day_Rate": day_cost / headcount,
+        "Hourly_Rate": day_cost / headcount / HOURS_PER_DAY,
+        "Experience_Years": experience / headcount,
+        "Annual_Cost": day_cost * WORKING_DAYS_PER_YEAR
+    }, index=pd.Index(np.asarray(locations)[staffed], name="Location"))
+
+def monthly_cost(df):
+    """CHF cost per month of each row of a team frame (Role, Location, Count)"""
+    return day_rates(df) * df["Count"].to_numpy() * WORKING_DAYS_PER_YEAR / 12
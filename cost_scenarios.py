@@ -0,0 +1,110 @@
+# Delivery cost scenario sweep
+# Prices every COST_MODELS delivery model x team size x duration combination
+# in one NumPy broadcast. Team sizes get a role mix from a TEAM_TEMPLATES
+# composition (rounded per size), priced with the ROLES_HIERARCHY day rates;
+# each model's onshore share sets how many members bill at offshore rates, and
+# its offshore rate factor is calibrated to the COST_MODELS cost_index
+#
+# Usage: python cost_scenarios.py [--template KEY] [--person-months N]
+
+import argparse
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from cost_model import DELIVERY_OFFSHORE_RATE_FACTORS, DELIVERY_ONSHORE_SHARE, ROLE_DAY_RATES, WORKING_DAYS_PER_YEAR
+from enhanced_data_structure import COST_MODELS, TEAM_TEMPLATES
+
+SCENARIO_TEAM_SIZES = np.arange(5, 51)
+SCENARIO_DURATIONS = np.arange(6, 37)
+
+ScenarioGrid = namedtuple("ScenarioGrid", ["models", "sizes", "durations", "headcount", "monthly", "total"])
+
+def blended_composition():
+    """Role counts summed over every TEAM_TEMPLATES composition"""
+    composition = {}
+    for template in TEAM_TEMPLATES.values():
+        for role, count in template["composition"].items():
+            composition[role] = composition.get(role, 0) + count
+    return composition
+
+def role_mix_counts(composition, sizes):
+    """Role counts per team size (sizes x roles), largest remainder rounding"""
+    counts = np.asarray(list(composition.values()), dtype=float)
+    quotas = np.asarray(sizes, dtype=float)[:, None] * counts / counts.sum()
+    whole = np.floor(quotas).astype(int)
+    missing = np.asarray(sizes) - whole.sum(axis=1)
+    # Rank each row's remainders (largest first) and top up the first `missing` roles
+    ranks = np.argsort(np.argsort(-(quotas - whole), axis=1, kind="stable"), axis=1)
+    return whole + (ranks < missing[:, None])
+
+def scenario_grid(composition=None, models=None, sizes=SCENARIO_TEAM_SIZES, durations=SCENARIO_DURATIONS):
+    """Monthly and total CHF cost for every (model, team size, duration).
+
+    `monthly` is models x sizes; `total` is models x sizes x durations.
+    Onshore headcount per model and size is ceil(share * size); offshore
+    members bill at DELIVERY_OFFSHORE_RATE_FACTORS, so a size matching the
+    share exactly costs the model's cost_index times the onsite cost.
+    """
+    composition = composition or blended_composition()
+    models = list(models or COST_MODELS["delivery_models"])
+    sizes = np.asarray(sizes)
+    durations = np.asarray(durations)
+    rates = np.asarray([ROLE_DAY_RATES[role.replace("_", " ")] for role in composition], dtype=float)
+
+    counts = role_mix_counts(composition, sizes)                                   # sizes x roles
+    onsite_day_cost = counts @ rates                                               # sizes
+    shares = np.asarray([DELIVERY_ONSHORE_SHARE[model] for model in models])[:, None]
+    factors = np.asarray([DELIVERY_OFFSHORE_RATE_FACTORS[model] for model in models])[:, None]
+    onshore = np.minimum(np.ceil(shares * sizes - 1e-9), sizes)                    # models x sizes
+    blend = (onshore + (sizes - onshore) * factors) / sizes
+    monthly = onsite_day_cost * blend * WORKING_DAYS_PER_YEAR / 12                 # models x sizes
+    total = monthly[:, :, None] * durations                                        # models x sizes x durations
+    return ScenarioGrid(models, sizes, durations, onshore.astype(int), monthly, total)
+
+def cheapest_frontier(grid, person_months):
+    """Cheapest team per (model, duration) delivering at least `person_months`.
+
+    Returns a long frame with Model, Duration, Team_Size, Monthly_Cost and
+    Total_Cost; durations no grid team size can cover are left out.
+    """
+    enough = grid.sizes[:, None] * grid.durations >= person_months               # sizes x durations
+    total = np.where(enough, grid.total, np.inf)
+    best = total.argmin(axis=1)                                                     # models x durations
+    cost = np.take_along_axis(total, best[:, None, :], axis=1)[:, 0, :]
+    model_idx, duration_idx = np.nonzero(np.isfinite(cost))
+    sizes = grid.sizes[best[model_idx, duration_idx]]
+    return pd.DataFrame({
+        "Model": np.asarray(grid.models, dtype=object)[model_idx],
+        "Duration": grid.durations[duration_idx],
+        "Team_Size": sizes,
+        "Monthly_Cost": grid.monthly[model_idx, best[model_idx, duration_idx]],
+        "Total_Cost": cost[model_idx, duration_idx]
+    })
+
+def scenario_cost(grid, model, team_size, duration):
+    """(monthly, total) CHF cost of one scenario of the grid"""
+    m = grid.models.index(model)
+    s = int(np.searchsorted(grid.sizes, team_size))
+    d = int(np.searchsorted(grid.durations, duration))
+    return float(grid.monthly[m, s]), float(grid.total[m, s, d])
+
+def main():
+    """Time a sweep and print the cheapest frontier for a scope of work"""
+    parser = argparse.ArgumentParser(description="Sweep delivery model x team size x duration costs")
+    parser.add_argument("--template", choices=list(TEAM_TEMPLATES), help="role mix (default: all templates blended)")
+    parser.add_argument("--person-months", type=int, default=360, help="scope the frontier must deliver")
+    args = parser.parse_args()
+
+    composition = TEAM_TEMPLATES[args.template]["composition"] if args.template else None
+    start = time.perf_counter()
+    grid = scenario_grid(composition)
+    frontier = cheapest_frontier(grid, args.person_months)
+    elapsed = time.perf_counter() - start
+    print(f"{grid.total.size:,} scenarios swept and frontier built in {elapsed * 1000:.2f}ms")
+    print(frontier[frontier["Duration"] % 6 == 0].to_string(index=False, float_format=lambda value: f"{value:,.0f}"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Central talent dataset provider
+# Every page reads its frames through one provider: each (name, seed, params)
+# dataset is built, or loaded from its snapshot, once per process and shared.
+# Datasets carry an explicit version (bumped by invalidate) for cache keys, and
+# hits, misses and regeneration cost are tracked per dataset
+
+import threading
+import time
+from collections import namedtuple
+
+import pandas as pd
+
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset, generate_associates_data
+from talent_snapshot import load_or_build
+
+DATASET_BUILDERS = {
+    "streamlit_dataset": create_streamlit_dataset,
+    "associates": generate_associates_data
+}
+
+DatasetVersion = namedtuple("DatasetVersion", ["name", "seed", "params", "revision"])
+
+class DatasetProvider:
+    """Builds each dataset once and serves the shared frame.
+
+    Frames are shared by every page and session: read them, or take a
+    .copy() before adding columns.
+    """
+
+    def __init__(self, builders=None, snapshot_dir=None):
+        self.builders = dict(builders or DATASET_BUILDERS)
+        self.snapshot_dir = snapshot_dir
+        self._frames = {}
+        self._revisions = {}
+        self._stats = {}
+        self._lock = threading.RLock()
+        self._building = {}
+
+    @staticmethod
+    def _key(name, seed, params):
+        return (name, seed, tuple(sorted(params.items())))
+
+    def _record(self, name, hit, seconds=0.0):
+        stats = self._stats.setdefault(name, {"hits": 0, "misses": 0, "build_seconds": 0.0, "last_build_seconds": 0.0})
+        if hit:
+            stats["hits"] += 1
+        else:
+            stats["misses"] += 1
+            stats["build_seconds"] += seconds
+            stats["last_build_seconds"] = seconds
+
+    def get(self, name="streamlit_dataset", seed=DEFAULT_SEED, **params):
+        """Frame for (name, seed, params), built or loaded on first use.
+
+        Concurrent first requests for the same dataset wait for one build.
+        """
+        key = self._key(name, seed, params)
+        with self._lock:
+            if key in self._frames:
+                self._record(name, hit=True)
+                return self._frames[key]
+            key_lock = self._building.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._frames:
+                    self._record(name, hit=True)
+                    return self._frames[key]
+            try:
+                start = time.perf_counter()
+                frame = load_or_build(name, self.builders[name], seed=seed, directory=self.snapshot_dir, **params)
+                with self._lock:
+                    self._frames[key] = frame
+                    self._revisions.setdefault(key, 0)
+                    self._record(name, hit=False, seconds=time.perf_counter() - start)
+                return frame
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+    def version(self, name="streamlit_dataset", seed=DEFAULT_SEED, **params):
+        """DatasetVersion identifying the current frame, for use in cache keys"""
+        key = self._key(name, seed, params)
+        with self._lock:
+            return DatasetVersion(name, seed, key[2], self._revisions.get(key, 0))
+
+    def invalidate(self, name="streamlit_dataset", seed=DEFAULT_SEED, **params):
+        """Drop a dataset so the next get() regenerates it under a new version"""
+        key = self._key(name, seed, params)
+        with self._lock:
+            self._frames.pop(key, None)
+            self._revisions[key] = self._revisions.get(key, 0) + 1
+
+    def stats(self):
+        """Per-dataset hits, misses and regeneration cost"""
+        with self._lock:
+            rows = [
+                {
+                    "Dataset": name,
+                    "Hits": stats["hits"],
+                    "Misses": stats["misses"],
+                    "Build (ms)": round(stats["build_seconds"] * 1000, 1),
+                    "Last Build (ms)": round(stats["last_build_seconds"] * 1000, 1)
+                }
+                for name, stats in self._stats.items()
+            ]
+        return pd.DataFrame(rows, columns=["Dataset", "Hits", "Misses", "Build (ms)", "Last Build (ms)"])
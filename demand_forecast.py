@@ -0,0 +1,236 @@
+# Talent demand forecasting
+# Holt (level + trend) exponential smoothing for every (Project_Type, Skill)
+# demand series at once: snapshots of the talent frame are reduced to one
+# headcount vector each, smoothing parameters are chosen per series by a grid
+# search evaluated for all series and grid points in one array pass, and new
+# snapshots refresh the fitted state with a single smoothing step
+#
+# Usage: python demand_forecast.py [--periods N] [--horizon N]
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from bounded_cache import BoundedCache
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset, make_rng
+from talent_schema import PROJECT_TYPE_CATEGORIES, SKILL_CATEGORIES
+
+SERIES_DIMENSIONS = ("Project_Type", "Skill")
+SERIES_CATEGORIES = (PROJECT_TYPE_CATEGORIES, SKILL_CATEGORIES)
+ALPHA_GRID = np.linspace(0.05, 0.95, 19)
+BETA_GRID = np.linspace(0.0, 0.5, 11)
+REFIT_EVERY = 6  # snapshots between full grid-search refits
+
+def _series_codes(df, dimensions, categories):
+    """Flat series id per row (row-major over the category product), -1 if unknown"""
+    codes = np.zeros(len(df), dtype=np.int64)
+    known = np.ones(len(df), dtype=bool)
+    for dimension, values in zip(dimensions, categories):
+        column = pd.Categorical(df[dimension], categories=values).codes.astype(np.int64)
+        known &= column >= 0
+        codes = codes * len(values) + column
+    return np.where(known, codes, -1)
+
+class DemandForecaster:
+    """Per-series Holt models over periodic snapshots of a talent frame.
+
+    Each snapshot contributes the summed `measure` of every series (one
+    column of `history`). `fit` picks alpha/beta per series from the grid by
+    one-step-ahead squared error; `add_snapshot` then advances the fitted
+    level and trend by one step, re-running the grid search every
+    `refit_every` snapshots.
+    """
+
+    def __init__(self, dimensions=SERIES_DIMENSIONS, categories=SERIES_CATEGORIES, measure="Count",
+                 freq="MS", alphas=ALPHA_GRID, betas=BETA_GRID, refit_every=REFIT_EVERY):
+        self.dimensions = tuple(dimensions)
+        self.categories = tuple(list(values) for values in categories)
+        self.measure = measure
+        self.freq = freq
+        self.refit_every = refit_every
+        self.series = pd.MultiIndex.from_product(self.categories, names=self.dimensions)
+        alpha_grid, beta_grid = np.meshgrid(alphas, betas, indexing="ij")
+        self._grid = (alpha_grid.reshape(-1, 1), beta_grid.reshape(-1, 1))
+        self.periods = []
+        self._columns = []
+        self.alpha = self.beta = self.level = self.trend = self.sse = None
+        self.fits = 0
+        self.steps = 0
+        self._since_fit = 0
+
+    @property
+    def history(self):
+        """Observed demand, series x periods"""
+        if not self._columns:
+            return np.empty((len(self.series), 0))
+        return np.column_stack(self._columns)
+
+    @property
+    def fitted(self):
+        return self.level is not None
+
+    def observe(self, df):
+        """Summed measure per series for one snapshot (rows outside the categories are ignored)"""
+        codes = _series_codes(df, self.dimensions, self.categories)
+        known = codes >= 0
+        weights = df[self.measure].to_numpy(dtype=float)[known]
+        return np.bincount(codes[known], weights=weights, minlength=len(self.series))
+
+    def _append(self, df, period):
+        period = pd.Timestamp(period)
+        if self.periods and period <= self.periods[-1]:
+            raise ValueError(f"Snapshot {period:%Y-%m-%d} is not after {self.periods[-1]:%Y-%m-%d}")
+        values = self.observe(df)
+        self.periods.append(period)
+        self._columns.append(values)
+        return values
+
+    def add_snapshot(self, df, period):
+        """Record the snapshot of `period` and refresh the fitted models"""
+        values = self._append(df, period)
+        if self.fitted and self._since_fit + 1 < self.refit_every:
+            self._step(values)
+        elif len(self.periods) >= 2:
+            self.fit()
+        return self
+
+    def extend(self, snapshots):
+        """Record (period, frame) pairs in order, then refit once"""
+        for period, df in snapshots:
+            self._append(df, period)
+        if len(self.periods) >= 2:
+            self.fit()
+        return self
+
+    def _step(self, values):
+        """One smoothing step of every series with its fitted parameters"""
+        error = values - (self.level + self.trend)
+        self.sse += error ** 2
+        self.level = self.level + self.trend + self.alpha * error
+        self.trend = self.trend + self.alpha * self.beta * error
+        self._since_fit += 1
+        self.steps += 1
+
+    def fit(self):
+        """Grid-search alpha/beta for every series at once (grid x series arrays)"""
+        history = self.history
+        if history.shape[1] < 2:
+            raise ValueError("At least two snapshots are needed to fit a trend")
+        alpha, beta = self._grid
+        level = np.broadcast_to(history[:, 0], (len(alpha), len(self.series))).copy()
+        trend = np.broadcast_to(history[:, 1] - history[:, 0], level.shape).copy()
+        sse = np.zeros_like(level)
+        for t in range(1, history.shape[1]):
+            error = history[:, t] - (level + trend)
+            sse += error ** 2
+            level += trend + alpha * error
+            trend += alpha * beta * error
+
+        best = sse.argmin(axis=0)
+        series = np.arange(len(self.series))
+        self.alpha = alpha[best, 0]
+        self.beta = beta[best, 0]
+        self.level = level[best, series]
+        self.trend = trend[best, series]
+        self.sse = sse[best, series]
+        self._since_fit = 0
+        self.fits += 1
+        return self
+
+    def forecast(self, horizon=12):
+        """Forecast demand per series for the next `horizon` periods (never negative)"""
+        if not self.fitted:
+            raise ValueError("Forecaster has not been fitted")
+        steps = np.arange(1, horizon + 1)
+        values = np.maximum(self.level[:, None] + self.trend[:, None] * steps, 0)
+        periods = pd.date_range(self.periods[-1], periods=horizon + 1, freq=self.freq)[1:]
+        return pd.DataFrame(values, index=self.series, columns=periods)
+
+    def history_frame(self):
+        """Observed demand per series, one column per snapshot period"""
+        return pd.DataFrame(self.history, index=self.series, columns=pd.DatetimeIndex(self.periods))
+
+    def parameters(self):
+        """Fitted alpha, beta, level, trend and in-sample RMSE per series"""
+        if not self.fitted:
+            raise ValueError("Forecaster has not been fitted")
+        return pd.DataFrame({
+            "alpha": self.alpha,
+            "beta": self.beta,
+            "level": self.level,
+            "trend": self.trend,
+            "rmse": np.sqrt(self.sse / max(len(self.periods) - 1, 1))
+        }, index=self.series)
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self._columns) + 5 * len(self.series) * 8
+
+def simulated_snapshots(df, periods=24, end=None, seed=None, freq="MS"):
+    """Demo history: (period, frame) pairs ending at `df` itself.
+
+    The toolkit keeps no real snapshot archive, so earlier snapshots scale
+    each row's measures by a per-series growth trend, an annual cycle and
+    noise. Every yielded frame is a new object; `df` is not modified.
+    """
+    rng = make_rng(seed)
+    end = pd.Timestamp(end if end is not None else pd.Timestamp.now()).to_period("M").to_timestamp()
+    dates = pd.date_range(end=end, periods=periods, freq=freq)
+    n_series = len(PROJECT_TYPE_CATEGORIES) * len(SKILL_CATEGORIES)
+    series = np.maximum(_series_codes(df, SERIES_DIMENSIONS, SERIES_CATEGORIES), 0)
+    growth = rng.normal(0.015, 0.02, n_series)[series]
+    phase = rng.uniform(0, 2 * np.pi, n_series)[series]
+    amplitude = rng.uniform(0.02, 0.12, n_series)[series]
+    noise = rng.normal(0, 0.04, (periods, len(df)))
+    noise[-1] = 0
+
+    # Scale factors (periods x rows), exactly 1 for the final (current) snapshot
+    month = np.arange(periods)[:, None]
+    seasonal = 1 + amplitude * np.sin(2 * np.pi * month / 12 + phase)
+    scale = (1 + growth) ** (month - (periods - 1)) * seasonal / seasonal[-1] * np.exp(noise)
+    measures = ["Count", "Available_Now", "Available_1_Month"]
+    measures = [measure for measure in measures if measure in df.columns]
+    for date, factor in zip(dates, scale):
+        yield date, df.assign(**{
+            measure: np.rint(df[measure].to_numpy(dtype=float) * factor).astype(int)
+            for measure in measures
+        })
+
+# Fitted forecasters per (dataset version, seed, periods, end month)
+FORECASTERS = BoundedCache(max_entries=16, max_bytes=16 * 1024 * 1024, sizeof=lambda forecaster: forecaster.nbytes)
+
+def demand_forecaster(df, version=None, seed=DEFAULT_SEED, periods=24, end=None):
+    """Forecaster fitted on the simulated history of `df`.
+
+    With a `version` identifying `df` (and an int seed), the fitted model is
+    cached; callers can keep feeding it snapshots with add_snapshot.
+    """
+    end = pd.Timestamp(end if end is not None else pd.Timestamp.now()).to_period("M").to_timestamp()
+
+    def build():
+        return DemandForecaster().extend(simulated_snapshots(df, periods, end, seed))
+
+    if version is None or not isinstance(seed, int):
+        return build()
+    return FORECASTERS.get_or_build((version, seed, periods, end), build)
+
+def main():
+    """Time a fit and forecast over the app dataset's simulated history"""
+    parser = argparse.ArgumentParser(description="Fit demand models for every Project_Type x Skill series")
+    parser.add_argument("--periods", type=int, default=24, help="monthly snapshots of history")
+    parser.add_argument("--horizon", type=int, default=12, help="months to forecast")
+    args = parser.parse_args()
+
+    df = create_streamlit_dataset(DEFAULT_SEED)
+    snapshots = list(simulated_snapshots(df, args.periods, seed=DEFAULT_SEED))
+    start = time.perf_counter()
+    forecaster = DemandForecaster().extend(snapshots)
+    forecast = forecaster.forecast(args.horizon)
+    elapsed = time.perf_counter() - start
+    print(f"{len(forecaster.series)} series x {args.periods} snapshots fitted and forecast in {elapsed * 1000:.1f}ms")
+    print(forecast.groupby(level="Project_Type", observed=True).sum().round(0).iloc[:, [0, -1]])
+
+if __name__ == "__main__":
+    main()
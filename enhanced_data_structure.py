@@ -8,6 +8,7 @@ import random
 
 # Configuration for realistic data generation
 TOTAL_ASSOCIATES = 2150  # Cognizant Switzerland + Support from India
+DEFAULT_SEED = 42  # Seed used by the app so every worker sees the same talent pool
 
 # 1. COMPREHENSIVE SKILLS TAXONOMY
 SKILLS_TAXONOMY = {
@@ -322,241 +323,314 @@ COST_MODELS = {
 }
 
 # 9. GENERATE REALISTIC ASSOCIATE DATA
-def generate_associates_data(num_associates=TOTAL_ASSOCIATES):
-    """Generate realistic associate data for Swiss banking context"""
-    associates = []
+# Distribution logic shared by the column generators below
+LOCATION_DISTRIBUTION = {
+    "Zurich": 0.25,
+    "Geneva": 0.08,
+    "Basel": 0.05,
+    "Pune": 0.35,
+    "Bangalore": 0.17,
+    "Chennai": 0.10
+}
+
+ROLE_CATEGORY_DISTRIBUTION = {
+    "Engineering": 0.40,
+    "Quality": 0.20,
+    "Leadership": 0.08,
+    "Specialized": 0.12,
+    "Analysis": 0.10,
+    "Project": 0.08,
+    "Compliance": 0.02
+}
+
+SWISS_LOCATIONS = ["Zurich", "Geneva", "Basel"]
+OFFSHORE_LOCATIONS = ["Pune", "Bangalore", "Chennai"]
+OFFSHORE_RATE_FACTOR = 0.4
+
+BANKING_DOMAINS = ["Retail Banking", "Investment Banking", "Private Banking", "Corporate Banking",
+                   "Digital Banking", "Risk Management", "Compliance", "Payments"]
+
+CLIENT_POOL = ["UBS", "Credit Suisse", "Julius Baer", "Pictet", "Lombard Odier",
+               "Swiss Re", "Zurich Insurance", "PostFinance", "Raiffeisen", "ZKB"]
+
+VISA_DISTRIBUTION = {
+    "Swiss Citizen": 0.15,
+    "EU/EFTA Permit": 0.25,
+    "Swiss Permit B": 0.30,
+    "Swiss Permit C": 0.20,
+    "Requires Sponsorship": 0.10
+}
+
+# Role keywords -> taxonomy group and (min, max) number of distinct skills picked from it
+SKILL_RULES = [
+    (("Engineer", "Developer"), ("Programming_Languages", "Core_Banking"), 2, 3),
+    (("Engineer", "Developer"), ("Programming_Languages", "Modern_Stack"), 1, 2),
+    (("Architect",), ("Banking_Platforms", "Core_Banking"), 1, 2),
+    (("Architect",), ("Cloud_Platforms", "Public_Cloud"), 1, 1),
+    (("Test",), ("Testing_Tools", "Automation"), 2, 2),
+    (("DevOps",), ("DevOps_Tools", "CI_CD"), 1, 1),
+    (("DevOps",), ("DevOps_Tools", "Containerization"), 1, 1)
+]
+
+def make_rng(seed=None):
+    """Return a numpy Generator for `seed`.
+
+    `seed` may be None (fresh OS entropy), an int, or an existing Generator,
+    which is returned unchanged so one stream can be threaded through
+    several generators.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+def _draw(rng, values, probabilities, size):
+    """Draw `size` entries of `values` with the given probabilities in one call"""
+    values = np.asarray(values, dtype=object)
+    return values[rng.choice(len(values), size=size, p=probabilities)]
+
+def _sample_without_replacement(rng, num_rows, pool_size, sizes):
+    """Pick sizes[i] distinct pool positions for every row i.
+
+    Returns the (num_rows, pool_size) matrix of pool positions in random order
+    together with a boolean mask marking the positions picked for each row.
+    """
+    order = np.argsort(rng.random((num_rows, pool_size)), axis=1)
+    picked = np.arange(pool_size) < np.asarray(sizes)[:, None]
+    return order, picked
+
+def _rows_to_lists(vocabulary, groups):
+    """Collect the picked vocabulary entries of every row into Python lists.
+
+    `groups` is a sequence of (positions, picked) pairs as returned by
+    `_sample_without_replacement`, with positions already offset into
+    `vocabulary`. Entries keep the group order, then the drawn order.
+    """
+    positions = np.concatenate([group[0] for group in groups], axis=1)
+    picked = np.concatenate([group[1] for group in groups], axis=1)
+    vocabulary = np.asarray(vocabulary, dtype=object)
+    sizes = picked.sum(axis=1)
+    lists = np.empty(len(sizes), dtype=object)
+    # Rows sharing a list length are reshaped and converted in a single call
+    for size in np.unique(sizes).tolist():
+        rows = np.flatnonzero(sizes == size)
+        values = vocabulary[positions[rows][picked[rows]]].reshape(len(rows), size)
+        lists[rows] = np.fromiter(values.tolist(), dtype=object, count=len(rows))
+    return lists
+
+def _role_tables():
+    """Flatten ROLES_HIERARCHY into per-role arrays indexed by a global role id"""
+    categories = list(ROLE_CATEGORY_DISTRIBUTION.keys())
+    roles, min_exp, day_rates, offsets, counts = [], [], [], [], []
+    for category in categories:
+        offsets.append(len(roles))
+        counts.append(len(ROLES_HIERARCHY[category]))
+        for role, info in ROLES_HIERARCHY[category].items():
+            roles.append(role)
+            min_exp.append(info["min_exp"])
+            day_rates.append(info["day_rate_chf"])
+    return (categories, np.asarray(roles, dtype=object), np.asarray(min_exp),
+            np.asarray(day_rates), np.asarray(offsets), np.asarray(counts))
+
+def generate_associates_data(num_associates=TOTAL_ASSOCIATES, seed=None):
+    """Generate realistic associate data for Swiss banking context.
+
+    Every attribute is drawn column-at-a-time for all associates with batched
+    NumPy calls; only the list and dict valued columns are assembled per row.
+    The same `seed` always yields the same associates (apart from
+    `Last_Updated`, which is relative to the current time). Label columns
+    come back as categoricals (see talent_schema).
+    """
+    from talent_schema import ASSOCIATE_SCHEMA, apply_schema
     
-    # Distribution logic
-    location_distribution = {
-        "Zurich": 0.25,
-        "Geneva": 0.08,
-        "Basel": 0.05,
-        "Pune": 0.35,
-        "Bangalore": 0.17,
-        "Chennai": 0.10
-    }
+    rng = make_rng(seed)
+    n = num_associates
     
-    for i in range(num_associates):
-        # Basic attributes
-        associate_id = f"COG{str(i+1).zfill(6)}"
-        
-        # Location assignment
-        location = np.random.choice(
-            list(location_distribution.keys()),
-            p=list(location_distribution.values())
-        )
-        
-        # Role assignment based on realistic distribution
-        role_category = np.random.choice(
-            ["Engineering", "Quality", "Leadership", "Specialized", "Analysis", "Project", "Compliance"],
-            p=[0.40, 0.20, 0.08, 0.12, 0.10, 0.08, 0.02]
-        )
-        role = np.random.choice(list(ROLES_HIERARCHY[role_category].keys()))
-        role_info = ROLES_HIERARCHY[role_category][role]
-        
-        # Experience calculation
-        base_exp = role_info["min_exp"]
-        experience_years = base_exp + np.random.randint(0, 8)
-        
-        # Skills assignment (realistic combinations)
-        primary_skills = []
-        if "Engineer" in role or "Developer" in role:
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["Programming_Languages"]["Core_Banking"], 
-                size=np.random.randint(2, 4), 
-                replace=False
-            ))
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["Programming_Languages"]["Modern_Stack"], 
-                size=np.random.randint(1, 3), 
-                replace=False
-            ))
-        
-        if "Architect" in role:
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["Banking_Platforms"]["Core_Banking"], 
-                size=np.random.randint(1, 3), 
-                replace=False
-            ))
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["Cloud_Platforms"]["Public_Cloud"], 
-                size=np.random.randint(1, 2), 
-                replace=False
-            ))
-        
-        if "Test" in role:
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["Testing_Tools"]["Automation"], 
-                size=np.random.randint(2, 3), 
-                replace=False
-            ))
-        
-        if "DevOps" in role:
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["DevOps_Tools"]["CI_CD"], 
-                size=np.random.randint(1, 2), 
-                replace=False
-            ))
-            primary_skills.extend(np.random.choice(
-                SKILLS_TAXONOMY["DevOps_Tools"]["Containerization"], 
-                size=np.random.randint(1, 2), 
-                replace=False
-            ))
-        
-        # Banking domain experience
-        banking_domains = np.random.choice(
-            ["Retail Banking", "Investment Banking", "Private Banking", "Corporate Banking", 
-             "Digital Banking", "Risk Management", "Compliance", "Payments"],
-            size=np.random.randint(1, 3),
-            replace=False
-        )
-        
-        # Language skills (Swiss locations get German/French priority)
-        language_skills = {}
-        if location in ["Zurich", "Basel"]:
-            language_skills["German"] = np.random.choice(["Fluent", "Business", "Native"], p=[0.5, 0.3, 0.2])
-            language_skills["English"] = np.random.choice(["Fluent", "Business"], p=[0.7, 0.3])
-        elif location == "Geneva":
-            language_skills["French"] = np.random.choice(["Fluent", "Business", "Native"], p=[0.5, 0.3, 0.2])
-            language_skills["English"] = np.random.choice(["Fluent", "Business"], p=[0.7, 0.3])
-        else:
-            language_skills["English"] = np.random.choice(["Fluent", "Business"], p=[0.8, 0.2])
-            if np.random.random() > 0.7:
-                language_skills["German"] = np.random.choice(["Basic", "Business"], p=[0.7, 0.3])
-        
-        # Certifications
-        certs = []
-        if experience_years > 5:
-            cert_categories = np.random.choice(
-                list(CERTIFICATIONS.keys()), 
-                size=np.random.randint(1, 3), 
-                replace=False
-            )
-            for cat in cert_categories:
-                certs.extend(np.random.choice(
-                    CERTIFICATIONS[cat], 
-                    size=1
-                ))
-        
-        # Project experience (UBS specific)
-        project_exp = np.random.choice(
-            list(PROJECT_TYPES.keys()), 
-            size=np.random.randint(1, 3), 
-            replace=False
-        ).tolist()
-        
-        # Availability calculation
-        if location in ["Zurich", "Geneva", "Basel"]:
-            # Swiss locations have higher immediate availability
-            available_now = np.random.choice([True, False], p=[0.65, 0.35])
-            available_1_week = np.random.choice([True, False], p=[0.80, 0.20])
-            available_1_month = True
-        else:
-            # Offshore locations have different availability patterns
-            available_now = np.random.choice([True, False], p=[0.45, 0.55])
-            available_1_week = np.random.choice([True, False], p=[0.70, 0.30])
-            available_1_month = np.random.choice([True, False], p=[0.90, 0.10])
-        
-        # Visa status (for Swiss locations)
-        if location in ["Zurich", "Geneva", "Basel"]:
-            visa_status = np.random.choice(
-                ["Swiss Citizen", "EU/EFTA Permit", "Swiss Permit B", "Swiss Permit C", "Requires Sponsorship"],
-                p=[0.15, 0.25, 0.30, 0.20, 0.10]
-            )
-        else:
-            visa_status = "Not Applicable"
-        
-        # Day rate calculation
-        base_rate = role_info["day_rate_chf"]
-        # Adjust for location
-        if location in ["Pune", "Bangalore", "Chennai"]:
-            day_rate = int(base_rate * 0.4)  # Offshore rates
-        else:
-            # Adjust for experience and certifications
-            exp_multiplier = 1 + (experience_years - role_info["min_exp"]) * 0.02
-            cert_multiplier = 1 + len(certs) * 0.05
-            day_rate = int(base_rate * exp_multiplier * cert_multiplier)
-        
-        # Previous client experience
-        prev_clients = []
-        if experience_years > 3:
-            client_pool = ["UBS", "Credit Suisse", "Julius Baer", "Pictet", "Lombard Odier", 
-                          "Swiss Re", "Zurich Insurance", "PostFinance", "Raiffeisen", "ZKB"]
-            prev_clients = np.random.choice(
-                client_pool, 
-                size=np.random.randint(1, min(4, experience_years // 2)), 
-                replace=False
-            ).tolist()
-        
-        # CS Integration specific experience
-        cs_integration_exp = False
-        if "Credit Suisse" in prev_clients or "UBS" in prev_clients:
-            cs_integration_exp = np.random.choice([True, False], p=[0.7, 0.3])
-        
-        # Utilization rate
-        if available_now:
-            utilization_current = 0
-        else:
-            utilization_current = np.random.choice([100, 80, 60, 40], p=[0.5, 0.3, 0.15, 0.05])
-        
-        # Build associate record
-        associate = {
-            "Associate_ID": associate_id,
-            "Location": location,
-            "Role": role,
-            "Role_Category": role_category,
-            "Experience_Years": experience_years,
-            "Primary_Skills": primary_skills,
-            "Banking_Domains": banking_domains.tolist(),
-            "Language_Skills": language_skills,
-            "Certifications": certs,
-            "Project_Experience": project_exp,
-            "Available_Now": available_now,
-            "Available_1_Week": available_1_week,
-            "Available_1_Month": available_1_month,
-            "Visa_Status": visa_status,
-            "Day_Rate_CHF": day_rate,
-            "Previous_Clients": prev_clients,
-            "CS_Integration_Experience": cs_integration_exp,
-            "Utilization_Current": utilization_current,
-            "Last_Updated": datetime.now() - timedelta(days=np.random.randint(0, 30))
-        }
-        
-        associates.append(associate)
+    # Location assignment
+    location = _draw(rng, list(LOCATION_DISTRIBUTION.keys()), list(LOCATION_DISTRIBUTION.values()), n)
+    swiss = np.isin(location, SWISS_LOCATIONS)
+    
+    # Role assignment based on realistic distribution
+    categories, roles, min_exps, day_rates, offsets, counts = _role_tables()
+    category_idx = rng.choice(len(categories), size=n, p=list(ROLE_CATEGORY_DISTRIBUTION.values()))
+    role_idx = offsets[category_idx] + (rng.random(n) * counts[category_idx]).astype(int)
+    role = roles[role_idx]
+    role_category = np.asarray(categories, dtype=object)[category_idx]
+    
+    # Experience calculation
+    min_exp = min_exps[role_idx]
+    experience_years = min_exp + rng.integers(0, 8, size=n)
+    
+    # Skills assignment (realistic combinations)
+    skill_vocabulary, skill_groups = [], []
+    for keywords, (area, group), low, high in SKILL_RULES:
+        pool = SKILLS_TAXONOMY[area][group]
+        applies = np.array([any(keyword in name for keyword in keywords) for name in roles])[role_idx]
+        order, picked = _sample_without_replacement(rng, n, len(pool), rng.integers(low, high + 1, size=n) * applies)
+        skill_groups.append((order + len(skill_vocabulary), picked))
+        skill_vocabulary.extend(pool)
+    primary_skills = _rows_to_lists(skill_vocabulary, skill_groups)
+    
+    # Banking domain experience
+    banking_domains = _rows_to_lists(BANKING_DOMAINS, [
+        _sample_without_replacement(rng, n, len(BANKING_DOMAINS), rng.integers(1, 3, size=n))
+    ])
+    
+    # Language skills (Swiss locations get German/French priority)
+    local_level = _draw(rng, ["Fluent", "Business", "Native"], [0.5, 0.3, 0.2], n)
+    english_level = np.where(rng.random(n) < np.where(swiss, 0.7, 0.8), "Fluent", "Business")
+    offshore_german = np.where(rng.random(n) < 0.7, "Basic", "Business")
+    speaks_german = rng.random(n) > 0.7
+    language_skills = [
+        {"German": local, "English": english} if loc in ("Zurich", "Basel") else
+        {"French": local, "English": english} if loc == "Geneva" else
+        {"English": english, "German": german} if has_german else
+        {"English": english}
+        for loc, local, english, german, has_german in zip(
+            location.tolist(), local_level.tolist(), english_level.tolist(),
+            offshore_german.tolist(), speaks_german.tolist())
+    ]
+    
+    # Certifications: one certificate from each of 1-2 distinct categories
+    cert_categories = list(CERTIFICATIONS.keys())
+    cert_sizes = np.array([len(CERTIFICATIONS[cat]) for cat in cert_categories])
+    cert_offsets = np.concatenate([[0], np.cumsum(cert_sizes)[:-1]])
+    num_certs = rng.integers(1, 3, size=n) * (experience_years > 5)
+    order, picked = _sample_without_replacement(rng, n, len(cert_categories), num_certs)
+    cert_positions = cert_offsets[order] + (rng.random(order.shape) * cert_sizes[order]).astype(int)
+    cert_vocabulary = [cert for cat in cert_categories for cert in CERTIFICATIONS[cat]]
+    certs = _rows_to_lists(cert_vocabulary, [(cert_positions, picked)])
+    
+    # Project experience (UBS specific)
+    project_keys = list(PROJECT_TYPES.keys())
+    project_exp = _rows_to_lists(project_keys, [
+        _sample_without_replacement(rng, n, len(project_keys), rng.integers(1, 3, size=n))
+    ])
+    
+    # Availability calculation: Swiss locations have higher immediate availability
+    available_now = rng.random(n) < np.where(swiss, 0.65, 0.45)
+    available_1_week = rng.random(n) < np.where(swiss, 0.80, 0.70)
+    available_1_month = swiss | (rng.random(n) < 0.90)
+    
+    # Visa status (for Swiss locations)
+    visa_status = np.where(
+        swiss,
+        _draw(rng, list(VISA_DISTRIBUTION.keys()), list(VISA_DISTRIBUTION.values()), n),
+        "Not Applicable"
+    ).astype(object)
     
-    return pd.DataFrame(associates)
+    # Day rate calculation: offshore flat discount, onshore adjusted for experience and certifications
+    base_rate = day_rates[role_idx]
+    exp_multiplier = 1 + (experience_years - min_exp) * 0.02
+    cert_multiplier = 1 + num_certs * 0.05
+    day_rate = np.where(
+        swiss,
+        (base_rate * exp_multiplier * cert_multiplier).astype(int),
+        (base_rate * OFFSHORE_RATE_FACTOR).astype(int)
+    )
+    
+    # Previous client experience
+    max_clients = np.minimum(4, experience_years // 2)
+    num_clients = np.where(
+        experience_years > 3,
+        1 + (rng.random(n) * np.maximum(max_clients - 1, 1)).astype(int),
+        0
+    )
+    order, picked = _sample_without_replacement(rng, n, len(CLIENT_POOL), num_clients)
+    prev_clients = _rows_to_lists(CLIENT_POOL, [(order, picked)])
+    
+    # CS Integration specific experience
+    cs_clients = [CLIENT_POOL.index("UBS"), CLIENT_POOL.index("Credit Suisse")]
+    worked_for_cs = (picked & np.isin(order, cs_clients)).any(axis=1)
+    cs_integration_exp = worked_for_cs & (rng.random(n) < 0.7)
+    
+    # Utilization rate
+    utilization_current = np.where(
+        available_now, 0, _draw(rng, [100, 80, 60, 40], [0.5, 0.3, 0.15, 0.05], n).astype(int)
+    )
+    
+    return apply_schema(pd.DataFrame({
+        "Associate_ID": [f"COG{i:06d}" for i in range(1, n + 1)],
+        "Location": location,
+        "Role": role,
+        "Role_Category": role_category,
+        "Experience_Years": experience_years,
+        "Primary_Skills": primary_skills,
+        "Banking_Domains": banking_domains,
+        "Language_Skills": language_skills,
+        "Certifications": certs,
+        "Project_Experience": project_exp,
+        "Available_Now": available_now,
+        "Available_1_Week": available_1_week,
+        "Available_1_Month": available_1_month,
+        "Visa_Status": visa_status,
+        "Day_Rate_CHF": day_rate,
+        "Previous_Clients": prev_clients,
+        "CS_Integration_Experience": cs_integration_exp,
+        "Utilization_Current": utilization_current,
+        "Last_Updated": datetime.now() - pd.to_timedelta(rng.integers(0, 30, size=n), unit="D")
+    }), ASSOCIATE_SCHEMA)
 
 # 10. SIMPLIFIED DATASET FOR STREAMLIT
-def create_streamlit_dataset():
-    """Create a simplified dataset optimized for Streamlit"""
+# Display labels of the simplified dataset, keyed by their PROJECT_TYPES / ROLES_HIERARCHY entries
+PROJECT_TYPE_LABELS = {
+    "CS_Integration": "CS Integration",
+    "Digital_Transformation": "Digital Banking",
+    "Core_Banking_Modernization": "Core Banking",
+    "Regulatory_Compliance": "Regulatory Compliance",
+    "Cloud_Migration": "Cloud Migration",
+    "API_Modernization": "API Modernization",
+    "Cybersecurity_Enhancement": "Cybersecurity",
+    "Data_Analytics_Platform": "Data Analytics"
+}
+
+ROLE_LABELS = {
+    "Solution_Architect": "Solution Architect",
+    "Technical_Lead": "Technical Lead",
+    "Senior_Software_Engineer": "Senior Engineer",
+    "Software_Engineer": "Engineer",
+    "DevOps_Engineer": "DevOps Engineer",
+    "Test_Engineer": "Test Engineer",
+    "Business_Analyst": "Business Analyst",
+    "Scrum_Master": "Scrum Master"
+}
+
+DATASET_SKILLS = ["Java", "Python", "Avaloq", "Temenos", "AWS", "DevOps", "Testing", "Security",
+                  "Data Analytics", "Mobile", "FINMA Compliance", "German Language"]
+
+def create_streamlit_dataset(seed=None):
+    """Create a simplified dataset optimized for Streamlit.
+
+    `seed` is an int or numpy Generator; the same seed yields the same frame.
+    Label columns come back as categoricals (see talent_schema).
+    """
+    from talent_schema import DATASET_SCHEMA, apply_schema
+    
+    rng = make_rng(seed)
     
     # Generate realistic data but in simplified format for the current app structure
     simple_data = []
     
-    locations = ["Zurich", "Geneva", "Basel", "Pune", "Bangalore", "Chennai"]
-    project_types = ["CS Integration", "Digital Banking", "Core Banking", "Regulatory Compliance", 
-                     "Cloud Migration", "API Modernization", "Cybersecurity", "Data Analytics"]
-    skills = ["Java", "Python", "Avaloq", "Temenos", "AWS", "DevOps", "Testing", "Security", 
-              "Data Analytics", "Mobile", "FINMA Compliance", "German Language"]
-    roles = ["Solution Architect", "Technical Lead", "Senior Engineer", "Engineer", 
-             "DevOps Engineer", "Test Engineer", "Business Analyst", "Scrum Master"]
+    locations = list(LOCATIONS.keys())
+    project_types = list(PROJECT_TYPE_LABELS.values())
+    skills = DATASET_SKILLS
+    roles = list(ROLE_LABELS.values())
     
     # Generate 100 realistic records
     for i in range(100):
-        location = np.random.choice(locations, p=[0.25, 0.08, 0.05, 0.35, 0.17, 0.10])
-        project_type = np.random.choice(project_types)
-        skill = np.random.choice(skills)
-        role = np.random.choice(roles)
+        location = rng.choice(locations, p=[0.25, 0.08, 0.05, 0.35, 0.17, 0.10])
+        project_type = rng.choice(project_types)
+        skill = rng.choice(skills)
+        role = rng.choice(roles)
         
         # Realistic counts based on role and location
         if "Architect" in role:
-            base_count = np.random.randint(8, 15)
+            base_count = rng.integers(8, 15)
         elif "Lead" in role:
-            base_count = np.random.randint(12, 25)
+            base_count = rng.integers(12, 25)
         elif "Senior" in role:
-            base_count = np.random.randint(25, 45)
+            base_count = rng.integers(25, 45)
         else:
-            base_count = np.random.randint(35, 75)
+            base_count = rng.integers(35, 75)
         
         # Adjust for location
         if location in ["Pune", "Bangalore", "Chennai"]:
@@ -565,9 +639,9 @@ def create_streamlit_dataset():
             count = base_count
         
         # Availability calculations
-        available_now = int(count * np.random.uniform(0.4, 0.7))
-        available_1_month = int(count * np.random.uniform(0.7, 0.9))
-        experience_years = np.random.randint(3, 12)
+        available_now = int(count * rng.uniform(0.4, 0.7))
+        available_1_month = int(count * rng.uniform(0.7, 0.9))
+        experience_years = rng.integers(3, 12)
         
         simple_data.append({
             'Project_Type': project_type,
@@ -580,56 +654,61 @@ def create_streamlit_dataset():
             'Experience_Years': experience_years
         })
     
-    return pd.DataFrame(simple_data)
+    return apply_schema(pd.DataFrame(simple_data), DATASET_SCHEMA)
 
 # 11. ENHANCED NLP QUERY RESPONSES
-def enhanced_nlp_response(query, df):
-    """Enhanced NLP response function with Swiss banking context"""
-    query_lower = query.lower()
+# Curated answers for single-entity queries; placeholders are cube measures
+NLP_ANSWERS = {
+    ("Project_Type", "CS Integration"): "🏦 CS Integration Readiness: {Count} specialists across all locations ({Available_Now} available immediately). Cognizant has deployed 450+ associates on similar integration projects with 94% success rate.",
+    ("Project_Type", "Regulatory Compliance"): "⚖️ Regulatory Compliance Experts: {Count} specialists with FINMA certification and Basel III expertise. All team members undergo quarterly Swiss banking law updates.",
+    ("Location", "Zurich"): "🇩🇪 German-Speaking Talent in Zurich: {Count} associates ({Available_Now} available now). 89% have business-level German proficiency for direct client interaction.",
+    ("Skill", "Avaloq"): "🏛️ Avaloq Specialists: {Count} certified professionals across Switzerland and India. Average 6.5 years Avaloq experience with UBS-specific configuration expertise.",
+    ("Project_Type", "Cloud Migration"): "☁️ Cloud Migration Excellence: {Count} AWS certified professionals. 67 specialists with AWS Switzerland region expertise and financial services compliance."
+}
+
+def _describe_filters(filters):
+    """Readable scope for a filter dict, e.g. 'Avaloq for CS Integration in Zurich'"""
+    talent = " / ".join(filters.get("Skill", []) + filters.get("Role", [])) or "Talent"
+    if "Project_Type" in filters:
+        talent += f" for {' / '.join(filters['Project_Type'])}"
+    if "Location" in filters:
+        talent += f" in {' / '.join(filters['Location'])}"
+    return talent
+
+def enhanced_nlp_response(query, df, cube=None):
+    """Enhanced NLP response function with Swiss banking context.
+
+    Every entity in the query is extracted in one pass (see intent_matcher),
+    so multi-entity queries such as "Avaloq in Zurich" resolve to a combined
+    filter. Pass a prebuilt TalentCube for `df` to answer from its
+    materialized roll-ups; otherwise one is built for this call.
+    """
+    from intent_matcher import match_intents
+    from talent_cube import TalentCube
+    cube = cube if cube is not None else TalentCube(df)
+    intents = match_intents(query)
+    filters = {kind: values for kind, values in intents.items() if kind in cube.dimensions}
     
-    # CS Integration specific queries
-    if any(term in query_lower for term in ['cs', 'credit suisse', 'integration', 'merger']):
-        cs_data = df[df['Project_Type'] == 'CS Integration']
-        total = cs_data['Count'].sum()
-        available = cs_data['Available_Now'].sum()
-        return f"🏦 CS Integration Readiness: {total} specialists across all locations ({available} available immediately). Cognizant has deployed 450+ associates on similar integration projects with 94% success rate."
+    # Talent queries: one curated entity, or a combined filter
+    if filters:
+        totals = cube.totals(**filters)
+        entities = [(kind, value) for kind, values in filters.items() for value in values]
+        if len(entities) == 1 and entities[0] in NLP_ANSWERS:
+            return NLP_ANSWERS[entities[0]].format(**totals)
+        return f"🔎 {_describe_filters(filters)}: {totals['Count']} specialists ({totals['Available_Now']} available immediately, {totals['Available_1_Month']} within a month)."
     
     # UBS specific queries
-    if 'ubs' in query_lower:
-        total_ubs_ready = df['Count'].sum()
-        zurich_ready = df[df['Location'] == 'Zurich']['Available_Now'].sum()
+    if "UBS" in intents.get("Client", []):
+        total_ubs_ready = cube.get('Count')
+        zurich_ready = cube.get('Available_Now', Location='Zurich')
         return f"🎯 UBS Project Readiness: {total_ubs_ready} specialists in our talent pool. {zurich_ready} immediately available in Zurich with Swiss banking domain expertise and FINMA compliance training."
     
-    # FINMA/Compliance queries
-    if any(term in query_lower for term in ['finma', 'compliance', 'regulatory', 'basel']):
-        compliance_data = df[df['Project_Type'] == 'Regulatory Compliance']
-        total = compliance_data['Count'].sum()
-        return f"⚖️ Regulatory Compliance Experts: {total} specialists with FINMA certification and Basel III expertise. All team members undergo quarterly Swiss banking law updates."
-    
-    # German language queries
-    if any(term in query_lower for term in ['german', 'deutsch', 'zurich']):
-        zurich_data = df[df['Location'] == 'Zurich']
-        total = zurich_data['Count'].sum()
-        available = zurich_data['Available_Now'].sum()
-        return f"🇩🇪 German-Speaking Talent in Zurich: {total} associates ({available} available now). 89% have business-level German proficiency for direct client interaction."
-    
-    # Technology specific queries
-    if 'avaloq' in query_lower:
-        avaloq_data = df[df['Skill'] == 'Avaloq']
-        total = avaloq_data['Count'].sum()
-        return f"🏛️ Avaloq Specialists: {total} certified professionals across Switzerland and India. Average 6.5 years Avaloq experience with UBS-specific configuration expertise."
-    
-    if any(term in query_lower for term in ['cloud', 'aws', 'migration']):
-        cloud_data = df[df['Project_Type'] == 'Cloud Migration']
-        total = cloud_data['Count'].sum()
-        return f"☁️ Cloud Migration Excellence: {total} AWS certified professionals. 67 specialists with AWS Switzerland region expertise and financial services compliance."
-    
     # Cost/budget queries
-    if any(term in query_lower for term in ['cost', 'budget', 'rate', 'price']):
+    if "Topic" in intents:
         return f"💰 Cost Optimization: Our hybrid delivery model (70% Zurich, 30% Offshore) offers 28% cost savings vs. pure onsite. Average blended rate: CHF 980/day vs. market rate CHF 1,350/day."
     
     # Default intelligent response
-    return f"💡 Based on our Swiss banking talent pool: {df['Available_Now'].sum()} associates available immediately across {df['Location'].nunique()} locations. Try queries like 'Avaloq developers in Zurich' or 'FINMA compliance experts'."
+    return f"💡 Based on our Swiss banking talent pool: {cube.get('Available_Now')} associates available immediately across {len(cube.values('Location'))} locations. Try queries like 'Avaloq developers in Zurich' or 'FINMA compliance experts'."
 
 # Export functions for the main app
 __all__ = [
@@ -638,6 +717,10 @@ __all__ = [
     'PROJECT_TYPES',
     'TEAM_TEMPLATES',
     'COST_MODELS',
+    'LOCATIONS',
+    'DEFAULT_SEED',
+    'make_rng',
+    'generate_associates_data',
     'create_streamlit_dataset',
     'enhanced_nlp_response'
 ] 
\ No newline at end of file
@@ -0,0 +1,124 @@
+# Compiled intent matcher for natural language talent queries
+# One declarative term table is compiled into a single trie-shaped regex, so a
+# query is scanned once and every entity (skill, location, role, project type,
+# client, topic) is extracted regardless of how many intents are registered
+
+import re
+
+from enhanced_data_structure import (
+    LOCATIONS,
+    CLIENT_POOL,
+    PROJECT_TYPE_LABELS,
+    ROLE_LABELS,
+    DATASET_SKILLS
+)
+
+# Terms shorter than this never take a plural "s" ("css" is not "cs")
+PLURAL_MIN_LENGTH = 4
+
+# Trigger words for the curated NLP answers that point at an entity other
+# than their literal meaning. These override the vocabulary entries below
+# (e.g. "aws" means a cloud migration project, "german" means the Zurich
+# German-speaking pool); structured filters use build_vocabulary_table.
+INTENT_SYNONYMS = {
+    ("Project_Type", "CS Integration"): ["cs", "credit suisse", "integration", "merger"],
+    ("Project_Type", "Regulatory Compliance"): ["finma", "finma compliance", "compliance", "regulatory", "basel iii"],
+    ("Project_Type", "Cloud Migration"): ["cloud", "aws", "migration"],
+    ("Location", "Zurich"): ["german", "deutsch", "zürich"],
+    ("Skill", "Data Analytics"): ["data science", "data scientist", "analytics"],
+    ("Skill", "Testing"): ["qa", "tester"],
+    ("Role", "Solution Architect"): ["architect"],
+    ("Topic", "Cost"): ["cost", "budget", "rate", "price", "pricing"]
+}
+
+def build_vocabulary_table():
+    """Map each lower-cased literal name (client, project type, role, skill,
+    location) to its (kind, value) entity.
+
+    "Data Analytics" is both a skill and a project type: the bare name is
+    the skill, "data analytics project" the project type.
+    """
+    vocabularies = [
+        ("Client", CLIENT_POOL),
+        ("Project_Type", PROJECT_TYPE_LABELS.values()),
+        ("Role", ROLE_LABELS.values()),
+        ("Skill", DATASET_SKILLS),
+        ("Location", LOCATIONS.keys())
+    ]
+    table = {}
+    for kind, values in vocabularies:
+        for value in values:
+            table[value.casefold()] = (kind, value)
+    for value in PROJECT_TYPE_LABELS.values():
+        table[f"{value} project".casefold()] = ("Project_Type", value)
+    return table
+
+def build_intent_table(synonyms=None):
+    """Literal vocabulary plus trigger words (INTENT_SYNONYMS by default), which win on conflicts"""
+    table = build_vocabulary_table()
+    for entity, terms in (INTENT_SYNONYMS if synonyms is None else synonyms).items():
+        for term in terms:
+            table[term.casefold()] = entity
+    return table
+
+INTENT_TABLE = build_intent_table()
+
+def _trie_pattern(terms):
+    """Alternation regex with shared prefixes factored out.
+
+    Each position of the query branches on at most one character per trie
+    level, so matching cost does not grow with the number of terms. Greedy
+    optional tails make the longest term win ("zurich insurance" over "zurich").
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node):
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{group})?" if "" in node else group
+
+    return render(trie)
+
+class IntentMatcher:
+    """Single-pass entity extraction over a term -> (kind, value) table"""
+
+    def __init__(self, table=None):
+        self.table = dict(table or INTENT_TABLE)
+        # Whole words only; longer terms take an optional plural "s" ("developers", "rates")
+        longer = [term for term in self.table if len(term) >= PLURAL_MIN_LENGTH]
+        short = [term for term in self.table if len(term) < PLURAL_MIN_LENGTH]
+        alternatives = [f"({_trie_pattern(longer)})s?" if longer else "", f"({_trie_pattern(short)})" if short else ""]
+        self.pattern = re.compile(r"\b(?:" + "|".join(alternative for alternative in alternatives if alternative) + r")\b",
+                                  re.IGNORECASE)
+
+    def finditer(self, query):
+        """Yield (kind, value, start, end, term) for every entity mention, left to right"""
+        for match in self.pattern.finditer(query):
+            term = match.group(0).casefold()
+            if term not in self.table:
+                term = next(group for group in match.groups() if group).casefold()
+            entity = self.table.get(term)
+            if entity:
+                yield entity[0], entity[1], match.start(), match.end(), term
+
+    def match(self, query):
+        """Entities in `query` grouped by kind, e.g. {"Skill": ["Avaloq"], "Location": ["Zurich"]}"""
+        entities = {}
+        for kind, value, _, _, _ in self.finditer(query):
+            values = entities.setdefault(kind, [])
+            if value not in values:
+                values.append(value)
+        return entities
+
+DEFAULT_MATCHER = IntentMatcher()
+
+def match_intents(query):
+    """Entities in `query` using the default intent table"""
+    return DEFAULT_MATCHER.match(query)
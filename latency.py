@@ -0,0 +1,75 @@
+# Latency policy and interaction timing
+# Demo delays are opt-in (zero by default) and real compute time is recorded
+# per interaction, so p50/p95 reflect actual hot spots rather than spinners
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+# Multiplier applied to the demo delays (1 restores the original theatrical waits)
+SIMULATED_LATENCY_SCALE = float(os.environ.get("TALENT_SIMULATED_LATENCY", "0"))
+
+# Interactions slower than this are counted as over budget
+LATENCY_BUDGET_MS = float(os.environ.get("TALENT_LATENCY_BUDGET_MS", "200"))
+
+# Show the timing table in the sidebar
+SHOW_TIMINGS = os.environ.get("TALENT_SHOW_TIMINGS", "") not in ("", "0")
+
+def simulate_latency(seconds, scale=None):
+    """Sleep for `seconds` scaled by the latency policy (no-op by default)"""
+    scale = SIMULATED_LATENCY_SCALE if scale is None else scale
+    if seconds > 0 and scale > 0:
+        time.sleep(seconds * scale)
+
+class LatencyRecorder:
+    """Rolling window of compute timings per interaction name (thread-safe)"""
+
+    def __init__(self, window=500, budget_ms=None):
+        self.window = window
+        self.budget_ms = LATENCY_BUDGET_MS if budget_ms is None else budget_ms
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """Add one timing sample for `name`"""
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(seconds * 1000)
+
+    @contextmanager
+    def measure(self, name):
+        """Time the enclosed block as one `name` sample"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def summary(self):
+        """Calls, p50/p95/max (ms) and over-budget count per interaction, slowest p95 first"""
+        with self._lock:
+            samples = {name: np.array(values) for name, values in self._samples.items()}
+        rows = [
+            {
+                "Interaction": name,
+                "Calls": len(values),
+                "p50 (ms)": round(float(np.percentile(values, 50)), 1),
+                "p95 (ms)": round(float(np.percentile(values, 95)), 1),
+                "Max (ms)": round(float(values.max()), 1),
+                "Over Budget": int((values > self.budget_ms).sum())
+            }
+            for name, values in samples.items()
+        ]
+        columns = ["Interaction", "Calls", "p50 (ms)", "p95 (ms)", "Max (ms)", "Over Budget"]
+        return pd.DataFrame(rows, columns=columns).sort_values("p95 (ms)", ascending=False, ignore_index=True)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+# Process-wide recorder shared by every session
+LATENCY = LatencyRecorder()
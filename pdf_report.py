@@ -0,0 +1,269 @@
+# PDF talent reports
+# The detail section is emitted as fixed-size page tables generated on demand,
+# so building a 50k row report keeps only a few tables alive at a time
+
+from datetime import datetime
+from io import BytesIO
+from itertools import chain, islice
+
+import pandas as pd
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+
+# Detail table layout: (header, column, suffix appended to every value)
+DETAIL_COLUMNS = [
+    ("Project", "Project_Type", ""),
+    ("Location", "Location", ""),
+    ("Skill", "Skill", ""),
+    ("Role", "Role", ""),
+    ("Total", "Count", ""),
+    ("Available Now", "Available_Now", ""),
+    ("1 Month", "Available_1_Month", ""),
+    ("Avg Exp", "Experience_Years", "y")
+]
+
+# Rows converted to strings per vectorized batch
+DETAIL_BATCH_ROWS = 1400
+
+# Frame padding SimpleDocTemplate adds above and below the page body
+FRAME_PADDING = 12
+
+def build_report_theme(primary='#0072C6', muted='#666666', stripe='#f8f9fa', grid='#e0e0e0'):
+    """Build every style a report uses: page template, paragraph and table styles"""
+    styles = getSampleStyleSheet()
+    return {
+        "page": dict(pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18),
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=28,
+            textColor=colors.HexColor(primary),
+            spaceAfter=30,
+            alignment=1,
+            fontName='Helvetica-Bold'
+        ),
+        "subtitle": ParagraphStyle(
+            'Subtitle',
+            parent=styles['Normal'],
+            fontSize=14,
+            textColor=colors.HexColor(muted),
+            spaceAfter=30,
+            alignment=1
+        ),
+        "heading": styles['Heading2'],
+        "footer": ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.HexColor(muted),
+            alignment=1
+        ),
+        "summary_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(primary)),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 14),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(stripe)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(grid)),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 11),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(stripe)])
+        ]),
+        "params_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(muted)),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(grid))
+        ]),
+        "detail_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(primary)),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(grid)),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(stripe)])
+        ])
+    }
+
+# Themes are built once at import and shared (read-only) by every report and session
+REPORT_THEMES = {"cognizant": build_report_theme()}
+DEFAULT_REPORT_THEME = "cognizant"
+
+def register_report_theme(name, **palette):
+    """Prebuild and register a theme, e.g. register_report_theme("ubs", primary="#E60000")"""
+    REPORT_THEMES[name] = build_report_theme(**palette)
+    return REPORT_THEMES[name]
+
+class FlowableStream(list):
+    """List of flowables that pulls from an iterator as ReportLab consumes it.
+
+    BaseDocTemplate.build takes flowables off the front of its list, so only
+    `lookahead` items are materialized at once and each page table is
+    released as soon as it has been drawn.
+    """
+
+    def __init__(self, flowables, lookahead=4):
+        super().__init__()
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+        self._exhausted = False
+        self._fill()
+
+    def _fill(self):
+        if self._exhausted or list.__len__(self) >= self._lookahead:
+            return
+        pulled = list(islice(self._source, self._lookahead - list.__len__(self)))
+        self._exhausted = not pulled
+        self.extend(pulled)
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+def detail_column_widths(data, available_width):
+    """Column widths for the detail tables, measured once per report.
+
+    Each column is as wide as its header or widest distinct value, scaled
+    down proportionally when the total exceeds the frame width.
+    """
+    widths = []
+    for header, column, suffix in DETAIL_COLUMNS:
+        values = pd.unique(data[column].astype(str)) if len(data) else []
+        widest = max((stringWidth(value + suffix, 'Helvetica', 9) for value in values), default=0)
+        widths.append(max(widest, stringWidth(header, 'Helvetica-Bold', 11)) + 12)
+    scale = min(1.0, available_width / sum(widths))
+    return [width * scale for width in widths]
+
+def detail_rows(data, batch_rows=DETAIL_BATCH_ROWS):
+    """Yield detail rows as tuples of strings, converted column-wise per batch"""
+    for start in range(0, len(data), batch_rows):
+        batch = data.iloc[start:start + batch_rows]
+        columns = [batch[column].astype(str) + suffix for _, column, suffix in DETAIL_COLUMNS]
+        yield from zip(*(column.tolist() for column in columns))
+
+def detail_rows_per_page(col_widths, style, frame_height):
+    """Detail rows that fit one page frame under the header row.
+
+    Header and row heights are measured from a two-row sample table laid
+    out with the report's column widths and style.
+    """
+    sample = Table([[header for header, _, _ in DETAIL_COLUMNS], ["0"] * len(DETAIL_COLUMNS)],
+                   colWidths=col_widths)
+    sample.setStyle(style)
+    sample.wrap(sum(col_widths), frame_height)
+    header_height, row_height = sample._rowHeights
+    return max(1, int((frame_height - FRAME_PADDING - header_height) // row_height))
+
+def detail_tables(data, col_widths, style, rows_per_table, first_rows=None):
+    """Yield one styled Table per `rows_per_table` rows (`first_rows` for the first).
+
+    The header row repeats on every page a table spans, so a table that
+    does not fit the rest of its page still labels its continuation.
+    """
+    header = [header for header, _, _ in DETAIL_COLUMNS]
+    rows = detail_rows(data)
+    size = first_rows or rows_per_table
+    while True:
+        chunk = list(islice(rows, size))
+        size = rows_per_table
+        if not chunk:
+            return
+        table = Table([header] + chunk, colWidths=col_widths, repeatRows=1)
+        table.setStyle(style)
+        yield table
+
+# PDF Export Function with enhanced styling
+def generate_pdf_report(data, query_params, output=None, include_details=True,
+                        rows_per_table=None, theme=DEFAULT_REPORT_THEME):
+    """Render the talent report for `data`.
+
+    `output` is a path or binary file-like object; by default a BytesIO is
+    returned. With include_details=False only the summary page is built.
+    `rows_per_table` defaults to the detail rows that fill one page.
+    `theme` names a prebuilt entry of REPORT_THEMES.
+    """
+    theme = REPORT_THEMES[theme]
+    buffer = BytesIO() if output is None else output
+    doc = SimpleDocTemplate(buffer, **theme["page"])
+    elements = []
+
+    # Title
+    elements.append(Paragraph("COGNIZANT TALENT REPORT", theme["title"]))
+    elements.append(Paragraph("Executive Summary for UBS Engagement", theme["subtitle"]))
+    elements.append(Spacer(1, 30))
+
+    # Executive Summary Box
+    total = data['Count'].sum()
+    available_now = data['Available_Now'].sum()
+    summary_data = [
+        ['EXECUTIVE SUMMARY', ''],
+        ['Total Associates Found:', f"{total}"],
+        ['Immediate Availability:', f"{available_now} ({round(available_now/total*100) if total else 0}%)"],
+        ['Average Experience:', f"{data['Experience_Years'].mean():.1f} years" if len(data) else "n/a"],
+        ['Deployment Readiness:', 'HIGH - Teams ready within 24-48 hours']
+    ]
+
+    summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
+    summary_table.setStyle(theme["summary_table"])
+    elements.append(summary_table)
+    elements.append(Spacer(1, 30))
+
+    # Query Parameters
+    elements.append(Paragraph("<b>SEARCH CRITERIA</b>", theme["heading"]))
+    param_data = [
+        ['Parameter', 'Value'],
+        ['Date:', datetime.now().strftime('%Y-%m-%d %H:%M')],
+        ['Project Type:', query_params.get('project_type', 'All')],
+        ['Skill:', query_params.get('skill', 'All')],
+        ['Location:', query_params.get('location', 'All')],
+        ['Role:', query_params.get('role', 'All')]
+    ]
+
+    param_table = Table(param_data, colWidths=[2*inch, 4*inch])
+    param_table.setStyle(theme["params_table"])
+    elements.append(param_table)
+    elements.append(Spacer(1, 30))
+
+    # Detailed Results on their own pages, generated page table by page table during the build
+    details = []
+    if include_details:
+        heading = Paragraph("<b>DETAILED TALENT BREAKDOWN</b>", theme["heading"])
+        elements.extend([PageBreak(), heading])
+        if not data.empty:
+            col_widths = detail_column_widths(data, doc.width)
+            first_rows = None
+            if rows_per_table is None:
+                rows_per_table = detail_rows_per_page(col_widths, theme["detail_table"], doc.height)
+                heading_height = heading.wrap(doc.width, doc.height)[1] + heading.getSpaceAfter()
+                first_rows = detail_rows_per_page(col_widths, theme["detail_table"], doc.height - heading_height)
+            details = detail_tables(data, col_widths, theme["detail_table"], rows_per_table, first_rows)
+
+    # Footer
+    footer = [
+        Spacer(1, 50),
+        Paragraph("© 2025 Cognizant Technology Solutions. Confidential and Proprietary.", theme["footer"])
+    ]
+
+    doc.build(FlowableStream(chain(elements, details, footer)))
+    if output is None:
+        buffer.seek(0)
+    return buffer
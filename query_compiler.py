@@ -0,0 +1,162 @@
+# Natural language -> structured talent filter
+# Queries compile into a TalentFilter (cached by normalized text) that runs
+# against the TalentIndex: categorical filters intersect inverted indexes,
+# experience is a vectorized mask and availability picks the measure column
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from intent_matcher import IntentMatcher, build_intent_table, build_vocabulary_table
+
+# Filter synonyms point at dataset categories only (unlike the NLP answer
+# triggers, "german" is the German Language skill and "aws" the AWS skill);
+# they apply to a dimension only when no exact category name matched it
+FILTER_SYNONYMS = {
+    ("Skill", "German Language"): ["german", "german speaking", "deutsch"],
+    ("Skill", "FINMA Compliance"): ["finma"],
+    ("Skill", "Data Analytics"): ["data science", "data scientist", "analytics"],
+    ("Skill", "Testing"): ["qa", "tester"],
+    ("Skill", "Temenos"): ["t24", "temenos t24"],
+    ("Project_Type", "CS Integration"): ["cs", "credit suisse"],
+    ("Project_Type", "Regulatory Compliance"): ["regulatory", "basel iii"],
+    ("Location", "Zurich"): ["zürich"],
+    ("Role", "Solution Architect"): ["architect"]
+}
+FILTER_DIMENSIONS = ("Skill", "Location", "Role", "Project_Type")
+
+EXACT_TERMS = frozenset(build_vocabulary_table())
+FILTER_MATCHER = IntentMatcher(build_intent_table(FILTER_SYNONYMS))
+
+# Availability horizon (days) -> dataset column that covers it; longer
+# horizons are clamped to the widest column and reported in the result note
+AVAILABILITY_COLUMNS = [(0, "Available_Now"), (31, "Available_1_Month")]
+
+NUMBER_WORDS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6}
+UNIT_DAYS = {"day": 1, "week": 7, "month": 30}
+
+# "5+ years experience", "at least 8 yrs" (but not "a 2 year project")
+EXPERIENCE_PATTERN = re.compile(
+    r"(\d+)\s*\+?\s*(?:years?|yrs?)\b(?!\s+(?:project|engagement|contract|program))"
+)
+# "within 2 weeks", "in a month", "next week"
+HORIZON_PATTERN = re.compile(
+    r"\b(?:within|in|next)\s+(?:(\d+|a|an|one|two|three|four|five|six)\s+)?(day|week|month)s?\b"
+)
+IMMEDIATE_PATTERN = re.compile(r"\b(?:now|immediate(?:ly)?|asap|right away|available)\b")
+
+class TalentFilter(namedtuple("TalentFilter", [
+    "skills", "locations", "roles", "project_types", "min_experience", "availability_days"
+], defaults=((), (), (), (), None, None))):
+    """Structured talent query; empty tuples / None mean "no constraint" """
+
+    __slots__ = ()
+
+    def index_filters(self):
+        """Keyword filters for TalentIndex.lookup"""
+        return {
+            "Skill": list(self.skills) or None,
+            "Location": list(self.locations) or None,
+            "Role": list(self.roles) or None,
+            "Project_Type": list(self.project_types) or None
+        }
+
+    def availability_column(self):
+        """Measure column counting talent available within the horizon"""
+        if self.availability_days is None:
+            return "Count"
+        for days, column in AVAILABILITY_COLUMNS:
+            if self.availability_days <= days:
+                return column
+        return AVAILABILITY_COLUMNS[-1][1]
+
+    def availability_note(self):
+        """Explanation when the horizon exceeds the widest tracked availability, else None"""
+        widest = AVAILABILITY_COLUMNS[-1][0]
+        if self.availability_days is None or self.availability_days <= widest:
+            return None
+        return (f"Availability is tracked up to {widest} days; showing talent available within "
+                f"{widest} days for the requested {self.availability_days}")
+
+    def describe(self):
+        """Readable summary, e.g. 'Avaloq · Zurich · 5+ years · available now'"""
+        parts = [" / ".join(values) for values in (self.skills, self.roles, self.project_types, self.locations) if values]
+        if self.min_experience:
+            parts.append(f"{self.min_experience}+ years")
+        if self.availability_days == 0:
+            parts.append("available now")
+        elif self.availability_days is not None:
+            parts.append(f"available within {self.availability_days} days")
+        return " · ".join(parts) or "all talent"
+
+QueryResult = namedtuple("QueryResult", ["filter", "rows", "total", "available", "measure", "note"], defaults=(None,))
+
+def normalize_query(query):
+    """Case-folded, whitespace-collapsed query text (the cache key)"""
+    return " ".join(query.casefold().split())
+
+def _filter_entities(text):
+    """Category values per filter dimension; exact names beat synonyms per dimension"""
+    exact, synonyms = {}, {}
+    for kind, value, _, _, term in FILTER_MATCHER.finditer(text):
+        if kind in FILTER_DIMENSIONS:
+            values = (exact if term in EXACT_TERMS else synonyms).setdefault(kind, [])
+            if value not in values:
+                values.append(value)
+    return {kind: tuple(exact.get(kind) or synonyms.get(kind, ())) for kind in FILTER_DIMENSIONS}
+
+def _availability_days(text):
+    """Availability horizon in days, or None when the query does not mention one"""
+    match = HORIZON_PATTERN.search(text)
+    if match:
+        amount = match.group(1) or "1"
+        amount = int(amount) if amount.isdigit() else NUMBER_WORDS[amount]
+        return amount * UNIT_DAYS[match.group(2)]
+    if IMMEDIATE_PATTERN.search(text):
+        return 0
+    return None
+
+@lru_cache(maxsize=1024)
+def _compile_normalized(text):
+    entities = _filter_entities(text)
+    experience = [int(years) for years in EXPERIENCE_PATTERN.findall(text)]
+    return TalentFilter(
+        skills=entities["Skill"],
+        locations=entities["Location"],
+        roles=entities["Role"],
+        project_types=entities["Project_Type"],
+        min_experience=max(experience) if experience else None,
+        availability_days=_availability_days(text)
+    )
+
+def compile_query(query):
+    """Parse a natural language query into a TalentFilter (cached by normalized text)"""
+    return _compile_normalized(normalize_query(query))
+
+def execute_query(talent_filter, index):
+    """Run a TalentFilter against a TalentIndex.
+
+    Returns matching rows ordered by available headcount, the total headcount
+    and the headcount available within the filter's horizon (clamped to the
+    widest tracked horizon, with a note, when the query asks for longer).
+    """
+    row_ids = index.lookup(**talent_filter.index_filters())
+    if talent_filter.min_experience:
+        row_ids = row_ids[index.column("Experience_Years")[row_ids] >= talent_filter.min_experience]
+    measure = talent_filter.availability_column()
+    available = index.column(measure)[row_ids]
+    order = np.argsort(-available, kind="stable")
+    return QueryResult(
+        filter=talent_filter,
+        rows=index.rows(row_ids[order]),
+        total=int(index.column("Count")[row_ids].sum()),
+        available=int(available.sum()),
+        measure=measure,
+        note=talent_filter.availability_note()
+    )
+
+def run_query(query, index):
+    """compile_query + execute_query"""
+    return execute_query(compile_query(query), index)
@@ -11,4 +11,7 @@ echo "\
 headless = true\n\
 enableCORS=false\n\
 port = $PORT\n\
-" > ~/.streamlit/config.toml 
\ No newline at end of file
+" > ~/.streamlit/config.toml 
+
+# Pre-render static assets (QR code PNGs) so the app serves them from disk
+python static_assets.py
@@ -0,0 +1,130 @@
+# Bitset encoding for the multi-valued associate columns
+# Every taxonomy entry gets a fixed bit position; each associate's set becomes a
+# fixed-width row of uint64 words, so "has skill X and certification Y" queries
+# run as vectorized bitwise ops over the whole pool instead of row loops
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from enhanced_data_structure import (
+    SKILLS_TAXONOMY,
+    CERTIFICATIONS,
+    PROJECT_TYPES,
+    BANKING_DOMAINS,
+    CLIENT_POOL
+)
+
+WORD_BITS = 64
+
+# Column -> ordered vocabulary; an entry's index is its bit position
+BITSET_VOCABULARIES = {
+    "Primary_Skills": list(dict.fromkeys(
+        skill for area in SKILLS_TAXONOMY.values() for group in area.values() for skill in group
+    )),
+    "Certifications": [cert for certs in CERTIFICATIONS.values() for cert in certs],
+    "Banking_Domains": list(BANKING_DOMAINS),
+    "Project_Experience": list(PROJECT_TYPES.keys()),
+    "Previous_Clients": list(CLIENT_POOL)
+}
+
+def bitset_words(vocabulary):
+    """Number of uint64 words needed for one row of `vocabulary`"""
+    return max(1, -(-len(vocabulary) // WORD_BITS))
+
+def _positions(values, vocabulary):
+    """Return (row ids, bit positions) for a column of lists or an Arrow list column.
+
+    Items outside `vocabulary` get position -1.
+    """
+    if isinstance(getattr(values, "dtype", None), pd.ArrowDtype):
+        lists = pa.array(values)
+        lengths = pc.fill_null(pc.list_value_length(lists), 0).to_numpy()
+        items = pc.list_flatten(lists)
+        positions = pc.fill_null(pc.index_in(items, value_set=pa.array(vocabulary)), -1).to_numpy()
+    else:
+        values = list(values)
+        lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        items = list(itertools.chain.from_iterable(values))
+        lookup = {item: position for position, item in enumerate(vocabulary)}
+        positions = np.fromiter((lookup.get(item, -1) for item in items), dtype=np.int64, count=len(items))
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    return rows, positions, items
+
+def encode_bitsets(values, vocabulary):
+    """Encode a column of lists as an (n, words) uint64 bitmask matrix.
+
+    Items outside `vocabulary` raise ValueError, so a drifting taxonomy
+    cannot silently drop set members.
+    """
+    rows, positions, items = _positions(values, vocabulary)
+    if (positions < 0).any():
+        unknown = sorted({str(items[i]) for i in np.flatnonzero(positions < 0).tolist()})
+        raise ValueError(f"Items outside the bitset vocabulary: {unknown}")
+    bits = np.zeros((len(values), bitset_words(vocabulary)), dtype=np.uint64)
+    shifts = (positions % WORD_BITS).astype(np.uint64)
+    np.bitwise_or.at(bits, (rows, positions // WORD_BITS), np.left_shift(np.uint64(1), shifts))
+    return bits
+
+def encode_items(items, vocabulary):
+    """Encode a single query set as one (words,) uint64 mask"""
+    return encode_bitsets([list(items)], vocabulary)[0]
+
+def decode_bitset(row_bits, vocabulary):
+    """Turn one row of words back into its vocabulary entries"""
+    positions = np.flatnonzero(np.unpackbits(row_bits.astype("<u8").view(np.uint8), bitorder="little"))
+    return [vocabulary[position] for position in positions]
+
+class TalentBitsets:
+    """Bitset view of an associate frame's multi-valued columns.
+
+    Build once per dataset; every query then evaluates over all associates
+    with a handful of vectorized AND/compare operations. Words are stored
+    word-major, (words, n), so each query word scans one contiguous array
+    and words without query bits are skipped.
+    """
+
+    def __init__(self, df, vocabularies=None):
+        vocabularies = vocabularies or BITSET_VOCABULARIES
+        self.vocabularies = {column: vocab for column, vocab in vocabularies.items() if column in df.columns}
+        self.bits = {
+            column: np.ascontiguousarray(encode_bitsets(df[column], vocab).T)
+            for column, vocab in self.vocabularies.items()
+        }
+        self.size = len(df)
+
+    def has_all(self, column, items):
+        """Boolean mask of rows whose `column` set contains every item"""
+        mask = encode_items(items, self.vocabularies[column])
+        result = np.ones(self.size, dtype=bool)
+        for word in np.flatnonzero(mask):
+            result &= (self.bits[column][word] & mask[word]) == mask[word]
+        return result
+
+    def has_any(self, column, items):
+        """Boolean mask of rows whose `column` set contains at least one item"""
+        mask = encode_items(items, self.vocabularies[column])
+        result = np.zeros(self.size, dtype=bool)
+        for word in np.flatnonzero(mask):
+            result |= (self.bits[column][word] & mask[word]) != 0
+        return result
+
+    def match(self, all_of=None, any_of=None):
+        """Combine has_all / has_any over several columns.
+
+        `all_of` and `any_of` map column names to item lists, e.g.
+        match(all_of={"Primary_Skills": ["Java"], "Certifications": ["PMP"]}).
+        """
+        result = np.ones(self.size, dtype=bool)
+        for column, items in (all_of or {}).items():
+            result &= self.has_all(column, items)
+        for column, items in (any_of or {}).items():
+            result &= self.has_any(column, items)
+        return result
+
+    def decode(self, column, row):
+        """Entries of `column` for one row position"""
+        return decode_bitset(self.bits[column][:, row], self.vocabularies[column])
@@ -0,0 +1,214 @@
+// JavaScript backup fix for dynamic elements
+
+// Force dropdown text to be visible
+function fixDropdownVisibility() {
+    // Find all selectbox inputs
+    const selectInputs = document.querySelectorAll('[data-baseweb="select"] input');
+    selectInputs.forEach(input => {
+        input.style.color = 'black';
+        input.style.webkitTextFillColor = 'black';
+        input.style.backgroundColor = '#f8f9fa';
+    });
+
+    // Find all value containers
+    const valueContainers = document.querySelectorAll('[data-baseweb="select"] [class*="valueContainer"]');
+    valueContainers.forEach(container => {
+        container.style.color = 'black';
+        container.style.webkitTextFillColor = 'black';
+        container.style.backgroundColor = '#f8f9fa';
+    });
+
+    // Find any element that might contain the selected value
+    const selectDivs = document.querySelectorAll('.stSelectbox [data-baseweb="select"] > div > div');
+    selectDivs.forEach(div => {
+        if (div.textContent && !div.querySelector('input')) {
+            div.style.color = 'black';
+            div.style.webkitTextFillColor = 'black';
+            div.style.backgroundColor = '#f8f9fa';
+        }
+    });
+
+    // Enhanced fix for all dropdown elements
+    const allDropdownElements = document.querySelectorAll('.stSelectbox [data-baseweb="select"] *');
+    allDropdownElements.forEach(element => {
+        if (element.textContent && element.textContent.trim() !== '') {
+            element.style.color = 'black';
+            element.style.webkitTextFillColor = 'black';
+            element.style.backgroundColor = '#f8f9fa';
+        }
+    });
+
+    // Fix for radio buttons in sidebar
+    const radioLabels = document.querySelectorAll('.stSidebar .stRadio label');
+    radioLabels.forEach(label => {
+        label.style.color = 'black';
+    });
+
+    // Fix for multiselect elements
+    const multiSelectElements = document.querySelectorAll('.stMultiSelect [data-baseweb="select"] *');
+    multiSelectElements.forEach(element => {
+        if (element.textContent && element.textContent.trim() !== '') {
+            element.style.color = 'black';
+            element.style.webkitTextFillColor = 'black';
+            element.style.backgroundColor = '#f8f9fa';
+        }
+    });
+}
+
+// Run the fix initially
+setTimeout(fixDropdownVisibility, 100);
+
+// Run the fix whenever the DOM changes
+const observer = new MutationObserver(fixDropdownVisibility);
+observer.observe(document.body, { 
+    childList: true, 
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['style', 'class']
+});
+
+// Also run on click events
+document.addEventListener('click', () => {
+    setTimeout(fixDropdownVisibility, 50);
+});
+
+// Run on focus events
+document.addEventListener('focusin', () => {
+    setTimeout(fixDropdownVisibility, 25);
+});
+
+// Run periodically to catch any missed elements
+setInterval(fixDropdownVisibility, 2000);
+
+// Fix sidebar navigation visibility
+function fixSidebarNavigation() {
+    // Target all possible sidebar selectors
+    const sidebarSelectors = [
+        '.css-1d391kg',
+        '[data-testid="stSidebar"]',
+        '[data-testid="stSidebarNav"]',
+        '.stSidebar'
+    ];
+
+    sidebarSelectors.forEach(selector => {
+        const sidebarElements = document.querySelectorAll(selector + ' *');
+        sidebarElements.forEach(element => {
+            if (element.textContent && element.textContent.trim() !== '') {
+                element.style.color = 'white';
+                element.style.backgroundColor = 'transparent';
+                element.style.webkitTextFillColor = 'white';
+            }
+        });
+    });
+
+    // Fix all text elements in sidebar
+    const textElements = document.querySelectorAll('[data-testid="stSidebar"] *, [data-testid="stSidebarNav"] *, .css-1d391kg *, .stSidebar *');
+    textElements.forEach(element => {
+        if (element.textContent && element.textContent.trim() !== '') {
+            element.style.color = 'white';
+            element.style.backgroundColor = 'transparent';
+            element.style.webkitTextFillColor = 'white';
+        }
+    });
+
+    // Fix sidebar navigation links
+    const sidebarLinks = document.querySelectorAll('[data-testid="stSidebar"] a, [data-testid="stSidebarNav"] a, .css-1d391kg a, .stSidebar a');
+    sidebarLinks.forEach(link => {
+        link.style.color = 'white';
+        link.style.backgroundColor = 'transparent';
+        link.style.webkitTextFillColor = 'white';
+    });
+
+    // Fix sidebar icons
+    const sidebarIcons = document.querySelectorAll('[data-testid="stSidebar"] svg, [data-testid="stSidebarNav"] svg, .css-1d391kg svg, .stSidebar svg');
+    sidebarIcons.forEach(icon => {
+        icon.style.color = 'white';
+        icon.style.fill = 'white';
+    });
+
+    // Force override any black text
+    const blackTextElements = document.querySelectorAll('[style*="color: black"], [style*="color: rgb(0, 0, 0)"], [style*="color: #000000"]');
+    blackTextElements.forEach(element => {
+        element.style.color = 'white';
+        element.style.webkitTextFillColor = 'white';
+    });
+
+    // Override any inline styles that might be causing issues
+    const allSidebarElements = document.querySelectorAll('[data-testid="stSidebar"] *, [data-testid="stSidebarNav"] *, .css-1d391kg *, .stSidebar *');
+    allSidebarElements.forEach(element => {
+        if (element.textContent && element.textContent.trim() !== '') {
+            element.style.setProperty('color', 'white', 'important');
+            element.style.setProperty('webkit-text-fill-color', 'white', 'important');
+            element.style.setProperty('background-color', 'transparent', 'important');
+        }
+    });
+}
+
+// Run sidebar fix initially
+setTimeout(fixSidebarNavigation, 50);
+
+// Run sidebar fix more frequently
+setInterval(fixSidebarNavigation, 500);
+
+// Also run on any DOM changes
+const sidebarObserver = new MutationObserver(fixSidebarNavigation);
+sidebarObserver.observe(document.body, { 
+    childList: true, 
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['style', 'class']
+});
+
+// AGGRESSIVE SIDEBAR FIX - Force all sidebar elements to be white
+function forceSidebarWhite() {
+    // Find all elements in the sidebar
+    const sidebar = document.querySelector('section[data-testid="stSidebar"]');
+    const sidebarNav = document.querySelector('nav[data-testid="stSidebarNav"]');
+
+    if (sidebar) {
+        // Force sidebar background
+        sidebar.style.backgroundColor = '#262730';
+        sidebar.style.color = 'white';
+
+        // Force all child elements to be white
+        const allElements = sidebar.querySelectorAll('*');
+        allElements.forEach(element => {
+            if (element.textContent && element.textContent.trim() !== '') {
+                element.style.color = 'white';
+                element.style.backgroundColor = 'transparent';
+                element.style.webkitTextFillColor = 'white';
+            }
+        });
+    }
+
+    if (sidebarNav) {
+        // Force navigation background
+        sidebarNav.style.backgroundColor = '#262730';
+        sidebarNav.style.color = 'white';
+
+        // Force all navigation elements to be white
+        const navElements = sidebarNav.querySelectorAll('*');
+        navElements.forEach(element => {
+            if (element.textContent && element.textContent.trim() !== '') {
+                element.style.color = 'white';
+                element.style.backgroundColor = 'transparent';
+                element.style.webkitTextFillColor = 'white';
+            }
+        });
+    }
+
+    // Override any black text anywhere in the sidebar
+    const blackTextElements = document.querySelectorAll('section[data-testid="stSidebar"] [style*="color: black"], section[data-testid="stSidebar"] [style*="color: rgb(0, 0, 0)"], nav[data-testid="stSidebarNav"] [style*="color: black"], nav[data-testid="stSidebarNav"] [style*="color: rgb(0, 0, 0)"]');
+    blackTextElements.forEach(element => {
+        element.style.color = 'white';
+        element.style.webkitTextFillColor = 'white';
+    });
+}
+
+// Run aggressive fix
+setTimeout(forceSidebarWhite, 100);
+setInterval(forceSidebarWhite, 1000);
+
+// Also run on page load and DOM changes
+document.addEventListener('DOMContentLoaded', forceSidebarWhite);
+window.addEventListener('load', forceSidebarWhite);
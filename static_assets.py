@@ -0,0 +1,108 @@
+# Cached static assets (QR codes, images, HTML/CSS blobs)
+# Assets are built or read once per process and then served from a bounded
+# in-memory cache; QR codes can be pre-rendered into static/ at build time so
+# the app never has to run the QR encoder
+#
+# Usage: python static_assets.py [--url URL ...]
+
+import argparse
+import hashlib
+import re
+from io import BytesIO
+from pathlib import Path
+
+from bounded_cache import BoundedCache
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+# Public Streamlit Cloud URL, encoded in the Introduction page QR code
+APP_URL = "https://talent-edge-crm-toolkit-eruzl4qtztizpskyggz3tv.streamlit.app"
+
+ASSET_CACHE = BoundedCache(max_entries=128, max_bytes=16 * 1024 * 1024)
+
+def cached_asset(key, builder):
+    """Bytes or text for `key`, calling `builder()` only the first time"""
+    return ASSET_CACHE.get_or_build(key, builder)
+
+def static_bytes(name):
+    """Contents of static/<name>, read from disk once"""
+    return cached_asset(("file", name), (STATIC_DIR / name).read_bytes)
+
+def static_text(name):
+    """Text of static/<name> (HTML, CSS, JS), read from disk once"""
+    return cached_asset(("text", name), lambda: (STATIC_DIR / name).read_text(encoding="utf-8"))
+
+def minify_css(css):
+    """Strip comments and collapse whitespace (descendant-selector spaces are kept)"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+def minify_js(js):
+    """Drop comment-only lines, indentation and blank lines (newlines are kept for ASI)"""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def theme_html(css_name="theme.css", js_name="theme.js"):
+    """Minified theme stylesheet and script as one HTML blob for st.markdown.
+
+    <script> starts on its own line so the markdown renderer treats it as a
+    separate raw HTML block.
+    """
+    def build():
+        css = minify_css(static_text(css_name))
+        js = minify_js(static_text(js_name))
+        return f"<style>{css}</style>\n<script>\n{js}\n</script>"
+    return cached_asset(("theme", css_name, js_name), build)
+
+def qr_filename(url):
+    """Prebuilt file name for the QR code of `url`"""
+    return f"qr_{hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]}.png"
+
+def render_qr_png(url, box_size=10, border=4):
+    """Encode `url` as a black-on-white QR code PNG"""
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    buffer = BytesIO()
+    qr.make_image(fill_color="black", back_color="white").save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def qr_png(url=APP_URL):
+    """QR code PNG bytes for `url`: the prebuilt file if present, else rendered once"""
+    def build():
+        prebuilt = STATIC_DIR / qr_filename(url)
+        return prebuilt.read_bytes() if prebuilt.exists() else render_qr_png(url)
+    return cached_asset(("qr", url), build)
+
+def prebuild_qr_codes(urls, directory=STATIC_DIR):
+    """Write the QR PNG for each URL into `directory` and return the paths"""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for url in urls:
+        path = directory / qr_filename(url)
+        path.write_bytes(render_qr_png(url))
+        paths.append(path)
+    return paths
+
+def main():
+    """Pre-render QR codes, e.g. python static_assets.py --url https://example.org"""
+    parser = argparse.ArgumentParser(description="Pre-render static assets into static/")
+    parser.add_argument("--url", action="append", help=f"URL to encode (default: {APP_URL})")
+    args = parser.parse_args()
+
+    for path in prebuild_qr_codes(args.url or [APP_URL]):
+        print(f"{path.relative_to(STATIC_DIR.parent)}: {path.stat().st_size:,} bytes")
+
+if __name__ == "__main__":
+    main()
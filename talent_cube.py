@@ -0,0 +1,151 @@
+# Materialized aggregate cube over the talent dataset
+# Count / Available_Now / Available_1_Month sums for every subset of
+# (Project_Type, Location, Skill, Role), so dashboard metrics, charts and
+# pivots become dictionary lookups instead of re-aggregating raw rows
+
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+
+from talent_index import ALL
+
+CUBE_DIMENSIONS = ("Project_Type", "Location", "Skill", "Role")
+CUBE_MEASURES = ("Count", "Available_Now", "Available_1_Month")
+
+def _subsets(dimensions):
+    """Every subset of `dimensions` (in their original order), from () to all"""
+    return [subset for size in range(len(dimensions) + 1) for subset in combinations(dimensions, size)]
+
+def _value_order(values):
+    """Display order of a dimension: category order for categoricals, else sorted"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return list(values.cat.categories)
+    return sorted(values.dropna().unique().tolist())
+
+class TalentCube:
+    """Roll-ups of the measure columns for all 2^4 dimension subsets.
+
+    Each cuboid maps a key tuple (values of its dimensions, in CUBE_DIMENSIONS
+    order) to a vector of measure sums plus a trailing row count. Lookups are
+    O(1) per cell; `update` applies added/removed rows as deltas instead of
+    rebuilding.
+    """
+
+    def __init__(self, df, dimensions=None, measures=None):
+        self.dimensions = tuple(dimensions or CUBE_DIMENSIONS)
+        self.measures = tuple(measures or CUBE_MEASURES)
+        self.orders = {dimension: _value_order(df[dimension]) for dimension in self.dimensions}
+        self.cuboids = {subset: {} for subset in _subsets(self.dimensions)}
+        self.revision = 0
+        self._views = {}
+        self._apply(df, 1)
+
+    def _apply(self, df, sign):
+        """Add (sign=1) or subtract (sign=-1) the rows of `df` in every cuboid"""
+        if df is None or df.empty:
+            return
+        for dimension in self.dimensions:
+            known = set(self.orders[dimension])
+            self.orders[dimension].extend(
+                value for value in _value_order(df[dimension]) if value not in known
+            )
+
+        # One pass over the rows; every roll-up is derived from the base cuboid
+        base = df.groupby(list(self.dimensions), observed=True)[list(self.measures)].sum()
+        base["_rows"] = df.groupby(list(self.dimensions), observed=True).size()
+        for subset, cuboid in self.cuboids.items():
+            if subset:
+                rolled = base.groupby(level=list(subset), observed=True).sum()
+                keys = [key if isinstance(key, tuple) else (key,) for key in rolled.index.tolist()]
+                rows = rolled.to_numpy()
+            else:
+                keys, rows = [()], base.to_numpy().sum(axis=0, keepdims=True)
+            for key, row in zip(keys, rows):
+                cell = cuboid.get(key)
+                cell = sign * row if cell is None else cell + sign * row
+                if cell[-1] < 0:
+                    raise ValueError(f"Removed rows that are not in the cube: {dict(zip(subset, key))}")
+                if cell[-1] == 0:
+                    cuboid.pop(key, None)
+                else:
+                    cuboid[key] = cell
+
+    def update(self, added=None, removed=None):
+        """Incrementally refresh after rows were added to and/or removed from the dataset"""
+        self._apply(removed, -1)
+        self._apply(added, 1)
+        self.revision += 1
+        self._views.clear()
+
+    def _cell(self, filters):
+        """Measure vector for a filter dict; list values are summed over"""
+        active = {
+            dimension: value for dimension, value in filters.items()
+            if value is not None and not (isinstance(value, str) and value == ALL)
+        }
+        unknown = set(active) - set(self.dimensions)
+        if unknown:
+            raise KeyError(f"Not a cube dimension: {sorted(unknown)}")
+        subset = tuple(dimension for dimension in self.dimensions if dimension in active)
+        choices = [
+            active[dimension] if isinstance(active[dimension], (list, tuple, set)) else [active[dimension]]
+            for dimension in subset
+        ]
+        cuboid = self.cuboids[subset]
+        total = np.zeros(len(self.measures) + 1, dtype=np.int64)
+        for key in product(*choices):
+            cell = cuboid.get(key)
+            if cell is not None:
+                total = total + cell
+        return total
+
+    def get(self, measure="Count", **filters):
+        """Sum of `measure` over the rows matching `dimension=value` filters"""
+        return int(self._cell(filters)[self.measures.index(measure)])
+
+    def totals(self, **filters):
+        """All measure sums for the filters, as a dict"""
+        cell = self._cell(filters)
+        return {measure: int(value) for measure, value in zip(self.measures, cell)}
+
+    def values(self, dimension):
+        """Values of `dimension` present in the dataset, in display order"""
+        cuboid = self.cuboids[(dimension,)]
+        return [value for value in self.orders[dimension] if (value,) in cuboid]
+
+    def frame(self, dimensions):
+        """Roll-up over `dimensions` as a frame, like df.groupby(dimensions)[measures].sum()"""
+        subset = tuple(dimension for dimension in self.dimensions if dimension in dimensions)
+        view_key = ("frame", subset)
+        if view_key not in self._views:
+            positions = [{value: i for i, value in enumerate(self.orders[d])} for d in subset]
+            keys = sorted(self.cuboids[subset], key=lambda key: [p[v] for p, v in zip(positions, key)])
+            values = np.array([self.cuboids[subset][key][:-1] for key in keys], dtype=np.int64)
+            values = values.reshape(len(keys), len(self.measures))
+            frame = pd.DataFrame(keys, columns=list(subset)) if subset else pd.DataFrame(index=[0])
+            for i, measure in enumerate(self.measures):
+                frame[measure] = values[:, i]
+            self._views[view_key] = frame
+        return self._views[view_key]
+
+    def pivot(self, index, columns, measure="Count"):
+        """Like df.pivot_table(values=measure, index=index, columns=columns, aggfunc='sum', fill_value=0)"""
+        view_key = ("pivot", index, columns, measure)
+        if view_key not in self._views:
+            rows, cols = self.values(index), self.values(columns)
+            row_pos = {value: i for i, value in enumerate(rows)}
+            col_pos = {value: i for i, value in enumerate(cols)}
+            subset = tuple(dimension for dimension in self.dimensions if dimension in (index, columns))
+            flip = subset[0] != index
+            column = self.measures.index(measure)
+            matrix = np.zeros((len(rows), len(cols)), dtype=np.int64)
+            for key, cell in self.cuboids[subset].items():
+                row_value, col_value = key[::-1] if flip else key
+                matrix[row_pos[row_value], col_pos[col_value]] = cell[column]
+            self._views[view_key] = pd.DataFrame(
+                matrix,
+                index=pd.Index(rows, name=index),
+                columns=pd.Index(cols, name=columns)
+            )
+        return self._views[view_key]
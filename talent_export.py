@@ -0,0 +1,142 @@
+# Streaming CSV / XLSX export of talent frames
+# Frames are written in fixed-size row chunks (openpyxl write-only mode for
+# XLSX), so memory stays flat whether exporting 50 query results or a 1M
+# associate pool
+#
+# Usage: python talent_export.py --associates 1000000 --format xlsx --out associates.xlsx
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from openpyxl import Workbook
+
+from enhanced_data_structure import DEFAULT_SEED, generate_associates_data
+from talent_snapshot import load_or_build
+
+EXPORT_CHUNK_ROWS = 10_000
+
+# Excel's sheet limit minus the header row; larger exports continue on a new sheet
+XLSX_MAX_ROWS = 1_048_575
+
+LIST_SEPARATOR = "; "
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx")
+}
+
+def _flatten_column(values):
+    """Render list and dict cells as text; other columns are returned unchanged"""
+    dtype = values.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        arrow_type = dtype.pyarrow_dtype
+        if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+            joined = pc.binary_join(pa.array(values), LIST_SEPARATOR)
+            return pd.Series(joined.to_pylist(), index=values.index, dtype=object)
+        if pa.types.is_map(arrow_type):
+            maps = pa.array(values)
+            if isinstance(maps, pa.ChunkedArray):
+                maps = maps.combine_chunks()
+            pairs = pc.binary_join_element_wise(maps.keys.cast(pa.string()), maps.items.cast(pa.string()), ": ")
+            # Offsets index the unsliced keys/items, so rebuild the lists from them as-is
+            joined = pc.binary_join(pa.ListArray.from_arrays(maps.offsets, pairs), LIST_SEPARATOR)
+            joined = pc.if_else(maps.is_null(), pa.scalar(None, pa.string()), joined)
+            return pd.Series(joined.to_pylist(), index=values.index, dtype=object)
+        return values
+    if dtype == object:
+        return values.map(lambda cell: LIST_SEPARATOR.join(map(str, cell)) if isinstance(cell, (list, tuple))
+                          else LIST_SEPARATOR.join(f"{k}: {v}" for k, v in cell.items()) if isinstance(cell, dict)
+                          else cell)
+    return values
+
+def export_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield flattened row chunks of `df` (only one chunk is converted at a time)"""
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield pd.DataFrame({column: _flatten_column(chunk[column]) for column in chunk.columns})
+
+def write_csv(df, output, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Append `df` to a CSV path or text stream chunk by chunk"""
+    handle = open(output, "w", newline="", encoding="utf-8") if isinstance(output, (str, Path)) else output
+    try:
+        df.head(0).to_csv(handle, index=False)
+        for chunk in export_chunks(df, chunk_rows):
+            chunk.to_csv(handle, header=False, index=False)
+    finally:
+        if handle is not output:
+            handle.close()
+    return output
+
+def _chunk_rows(chunk):
+    """Rows of a flattened chunk as tuples of Python scalars, NA as empty cells"""
+    columns = [chunk[column].astype(object).where(chunk[column].notna(), None).tolist()
+               for column in chunk.columns]
+    return zip(*columns)
+
+def write_xlsx(df, output, chunk_rows=EXPORT_CHUNK_ROWS, sheet_name="Talent"):
+    """Write `df` to an XLSX path or binary stream with openpyxl's write-only workbook.
+
+    Rows are streamed to the sheet as they are appended, so the workbook
+    never holds the frame as cell objects.
+    """
+    workbook = Workbook(write_only=True)
+    header = [str(column) for column in df.columns]
+    sheet, sheet_rows, sheet_count = None, XLSX_MAX_ROWS, 0
+    for chunk in export_chunks(df, chunk_rows):
+        for row in _chunk_rows(chunk):
+            if sheet_rows == XLSX_MAX_ROWS:
+                sheet_count += 1
+                sheet = workbook.create_sheet(sheet_name if sheet_count == 1 else f"{sheet_name} {sheet_count}")
+                sheet.append(header)
+                sheet_rows = 0
+            sheet.append(row)
+            sheet_rows += 1
+    if sheet is None:
+        workbook.create_sheet(sheet_name).append(header)
+    workbook.save(output)
+    return output
+
+WRITERS = {"csv": write_csv, "xlsx": write_xlsx}
+
+def export_file(df, fmt, directory=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Write `df` as `fmt` to a new temporary file and return its path"""
+    _, suffix = EXPORT_FORMATS[fmt]
+    handle, path = tempfile.mkstemp(suffix=suffix, prefix="talent_export_", dir=directory)
+    os.close(handle)
+    WRITERS[fmt](df, path, chunk_rows=chunk_rows)
+    return Path(path)
+
+def export_bytes(df, fmt, chunk_rows=EXPORT_CHUNK_ROWS):
+    """File contents of `df` as `fmt`, for download buttons (built via a temp file)"""
+    path = export_file(df, fmt, chunk_rows=chunk_rows)
+    try:
+        return path.read_bytes()
+    finally:
+        path.unlink()
+
+def main():
+    """Export an associate pool, e.g. python talent_export.py --associates 1000000 --format xlsx"""
+    parser = argparse.ArgumentParser(description="Stream an associate pool to CSV or XLSX")
+    parser.add_argument("--associates", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--out", help="Output file (default: associates.<format>)")
+    parser.add_argument("--chunk-rows", type=int, default=EXPORT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    df = load_or_build("associates", generate_associates_data, seed=args.seed, num_associates=args.associates)
+    out = Path(args.out or f"associates{EXPORT_FORMATS[args.format][1]}")
+    start = time.perf_counter()
+    WRITERS[args.format](df, out, chunk_rows=args.chunk_rows)
+    elapsed = time.perf_counter() - start
+    print(f"{out}: {len(df):,} rows, {out.stat().st_size / 1e6:.1f} MB in {elapsed:.1f}s "
+          f"({len(df) / elapsed:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    main()
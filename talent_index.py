@@ -0,0 +1,88 @@
+# Inverted indexes over the talent dataset
+# Built once per dataset version; multi-filter queries intersect sorted row-id
+# arrays instead of copying the frame and applying one boolean mask per filter
+
+import numpy as np
+import pandas as pd
+
+INDEX_DIMENSIONS = ["Project_Type", "Skill", "Role", "Location"]
+
+# Selectbox wildcard used throughout the app; treated like "no filter"
+ALL = "All"
+
+class TalentIndex:
+    """Per-dimension inverted indexes (value -> ascending row positions)"""
+
+    def __init__(self, df, dimensions=None):
+        self.frame = df
+        self.dimensions = list(dimensions or INDEX_DIMENSIONS)
+        self.postings = {dimension: self._build_postings(df[dimension]) for dimension in self.dimensions}
+        self._columns = {}
+
+    @staticmethod
+    def _build_postings(values):
+        """Group row positions by value with one stable argsort"""
+        codes, uniques = pd.factorize(values, sort=True)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        return {
+            value: order[start:end]
+            for value, start, end in zip(uniques.tolist(), bounds[:-1].tolist(), bounds[1:].tolist())
+        }
+
+    def __len__(self):
+        return len(self.frame)
+
+    def values(self, dimension):
+        """Sorted values of `dimension` present in the dataset"""
+        return list(self.postings[dimension].keys())
+
+    def posting(self, dimension, value):
+        """Row positions for one value, or the union for a list of values"""
+        postings = self.postings[dimension]
+        if isinstance(value, (list, tuple, set)):
+            parts = [postings[item] for item in value if item in postings]
+            return np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+        return postings.get(value, np.empty(0, dtype=np.intp))
+
+    def lookup(self, **filters):
+        """Row positions matching every `dimension=value` filter.
+
+        None and "All" mean no filter; a list of values matches any of them.
+        Postings are intersected smallest first, so the cost follows the
+        most selective filter rather than the dataset size.
+        """
+        active = [
+            self.posting(dimension, value)
+            for dimension, value in filters.items()
+            if value is not None and not (isinstance(value, str) and value == ALL)
+        ]
+        if not active:
+            return np.arange(len(self.frame))
+        active.sort(key=len)
+        row_ids = active[0]
+        for posting in active[1:]:
+            if not len(row_ids):
+                break
+            row_ids = np.intersect1d(row_ids, posting, assume_unique=True)
+        return row_ids
+
+    def rows(self, row_ids):
+        """The frame rows at `row_ids` (only the matched rows are copied)"""
+        return self.frame.take(row_ids)
+
+    def column(self, name):
+        """Cached NumPy view of a measure column"""
+        if name not in self._columns:
+            self._columns[name] = self.frame[name].to_numpy()
+        return self._columns[name]
+
+    def sum(self, column, row_ids=None, **filters):
+        """Sum of `column` over `row_ids` or over the rows matching `filters`"""
+        if row_ids is None:
+            row_ids = self.lookup(**filters)
+        return self.column(column)[row_ids].sum()
+
+    def query(self, **filters):
+        """Matching rows as a frame, like chained df[df[dim] == value] filters"""
+        return self.rows(self.lookup(**filters))
@@ -0,0 +1,55 @@
+# Typed schema for the talent frames
+# Label columns are pandas categoricals with fixed category sets, so filters
+# like df[df['Location'] == 'Zurich'] compare small integer codes instead of strings
+
+from pandas.api.types import CategoricalDtype
+
+from enhanced_data_structure import (
+    LOCATIONS,
+    PROJECT_TYPE_LABELS,
+    ROLE_LABELS,
+    DATASET_SKILLS,
+    ROLES_HIERARCHY,
+    VISA_DISTRIBUTION
+)
+
+# Fixed category sets
+LOCATION_CATEGORIES = list(LOCATIONS.keys())
+PROJECT_TYPE_CATEGORIES = list(PROJECT_TYPE_LABELS.values())
+SKILL_CATEGORIES = list(DATASET_SKILLS)
+ROLE_CATEGORIES = list(ROLE_LABELS.values())
+ASSOCIATE_ROLE_CATEGORIES = [role for roles in ROLES_HIERARCHY.values() for role in roles]
+ROLE_CATEGORY_CATEGORIES = list(ROLES_HIERARCHY.keys())
+VISA_STATUS_CATEGORIES = list(VISA_DISTRIBUTION.keys()) + ["Not Applicable"]
+
+# Schema of create_streamlit_dataset()
+DATASET_SCHEMA = {
+    "Project_Type": CategoricalDtype(PROJECT_TYPE_CATEGORIES),
+    "Location": CategoricalDtype(LOCATION_CATEGORIES),
+    "Skill": CategoricalDtype(SKILL_CATEGORIES),
+    "Role": CategoricalDtype(ROLE_CATEGORIES)
+}
+
+# Schema of generate_associates_data()
+ASSOCIATE_SCHEMA = {
+    "Location": CategoricalDtype(LOCATION_CATEGORIES),
+    "Role": CategoricalDtype(ASSOCIATE_ROLE_CATEGORIES),
+    "Role_Category": CategoricalDtype(ROLE_CATEGORY_CATEGORIES),
+    "Visa_Status": CategoricalDtype(VISA_STATUS_CATEGORIES)
+}
+
+def apply_schema(df, schema):
+    """Return `df` with the schema columns cast to their categorical dtypes.
+
+    Columns missing from `df` are skipped. A value outside its fixed category
+    set raises ValueError instead of silently becoming NaN.
+    """
+    dtypes = {column: dtype for column, dtype in schema.items() if column in df.columns}
+    for column, dtype in dtypes.items():
+        values = df[column]
+        if values.dtype == dtype:
+            continue
+        unknown = set(values.dropna().unique()) - set(dtype.categories)
+        if unknown:
+            raise ValueError(f"{column} has values outside the schema: {sorted(map(str, unknown))}")
+    return df.astype(dtypes)
@@ -0,0 +1,180 @@
+# Columnar on-disk snapshots of the talent frames
+# Arrow IPC files written uncompressed so they can be memory-mapped on startup
+
+import argparse
+import hashlib
+import inspect
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+import talent_schema
+from enhanced_data_structure import (
+    DEFAULT_SEED,
+    TOTAL_ASSOCIATES,
+    create_streamlit_dataset,
+    generate_associates_data
+)
+
+# Directory used by load_or_build; snapshots are disabled when unset
+SNAPSHOT_DIR = os.environ.get("TALENT_SNAPSHOT_DIR")
+
+SNAPSHOT_SUFFIX = ".arrow"
+SNAPSHOT_FORMAT = 1  # bump when the file layout written by save_snapshot changes
+
+# Arrow types that stay Arrow-backed (pd.ArrowDtype) instead of being materialized
+_NESTED_TYPES = (pa.types.is_list, pa.types.is_large_list, pa.types.is_map, pa.types.is_struct)
+
+def _arrow_column(series):
+    """Convert one frame column to an Arrow array.
+
+    Dict valued columns (Language_Skills) become map<string, string> so the
+    key order survives the round trip; everything else uses Arrow inference.
+    """
+    if series.dtype == object:
+        sample = series.dropna()
+        if len(sample) and isinstance(sample.iloc[0], dict):
+            return pa.array([list(value.items()) for value in series],
+                            type=pa.map_(pa.string(), pa.string()))
+    return pa.Array.from_pandas(series)
+
+def frame_to_table(df, metadata=None):
+    """Build an Arrow table from a talent frame, keeping list and dict columns"""
+    table = pa.table({column: _arrow_column(df[column]) for column in df.columns})
+    if metadata:
+        table = table.replace_schema_metadata({str(k): str(v) for k, v in metadata.items()})
+    return table
+
+def save_snapshot(df, path, metadata=None):
+    """Write `df` to `path` as an uncompressed Arrow IPC file.
+
+    The file is written next to its destination and renamed into place, so
+    concurrent workers never memory-map a half written snapshot.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = frame_to_table(df, metadata)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+def _nested_as_arrow(arrow_type):
+    """types_mapper keeping nested columns zero-copy as pd.ArrowDtype"""
+    if any(check(arrow_type) for check in _NESTED_TYPES):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+def _materialize_nested(df, table):
+    """Replace Arrow-backed list/map columns with Python lists and dicts"""
+    for column, arrow_type in zip(table.column_names, table.schema.types):
+        if not any(check(arrow_type) for check in _NESTED_TYPES):
+            continue
+        values = table.column(column).to_pylist()
+        if pa.types.is_map(arrow_type):
+            values = [dict(value) if value is not None else None for value in values]
+        df[column] = pd.Series(values, index=df.index, dtype=object)
+    return df
+
+def read_snapshot_table(path, memory_map=True):
+    """Read a snapshot as an Arrow table, zero-copy from a memory map by default"""
+    source = pa.memory_map(str(path), "r") if memory_map else pa.OSFile(str(path), "rb")
+    return pa.ipc.open_file(source).read_all()
+
+def load_snapshot(path, memory_map=True, materialize=False):
+    """Load a snapshot written by save_snapshot.
+
+    With the defaults the file is memory-mapped and list/dict columns stay
+    Arrow-backed (`pd.ArrowDtype`), so even a 1M associate pool loads in
+    milliseconds. Pass `materialize=True` to get the Python list and dict
+    cells that `generate_associates_data` produces.
+    """
+    table = read_snapshot_table(path, memory_map=memory_map)
+    df = table.to_pandas(types_mapper=_nested_as_arrow)
+    if materialize:
+        df = _materialize_nested(df, table)
+    return df
+
+def snapshot_metadata(path):
+    """Return the key/value metadata stored with a snapshot"""
+    with pa.memory_map(str(path), "r") as source:
+        schema = pa.ipc.open_file(source).schema
+    return {k.decode(): v.decode() for k, v in (schema.metadata or {}).items()}
+
+@lru_cache(maxsize=None)
+def builder_fingerprint(builder):
+    """Short hash of SNAPSHOT_FORMAT and the source of the builder's module and talent_schema.
+
+    Editing the generator, its category sets or the file layout changes the
+    fingerprint, so snapshots written by older code are rebuilt.
+    """
+    digest = hashlib.sha256(f"format{SNAPSHOT_FORMAT}".encode())
+    for module in (inspect.getmodule(builder), talent_schema):
+        try:
+            digest.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            digest.update(getattr(builder, "__qualname__", repr(builder)).encode())
+    return digest.hexdigest()[:12]
+
+def snapshot_path(directory, name, seed, schema=None, **params):
+    """Deterministic file name for a (name, seed, params) snapshot of builder fingerprint `schema`"""
+    parts = [name, f"seed{seed}"] + [f"{key}{value}" for key, value in sorted(params.items())]
+    if schema:
+        parts.append(f"schema{schema}")
+    return Path(directory) / ("-".join(parts) + SNAPSHOT_SUFFIX)
+
+def snapshot_metadata_for(name, builder, seed, **params):
+    """Metadata stored with a snapshot: identity, SNAPSHOT_FORMAT and builder fingerprint"""
+    return {"name": name, "seed": seed, "format": SNAPSHOT_FORMAT, "schema": builder_fingerprint(builder), **params}
+
+def load_or_build(name, builder, seed=DEFAULT_SEED, directory=None, materialize=False, **params):
+    """Load the `name` snapshot for `seed`, building and saving it on first use.
+
+    `builder(seed=seed, **params)` produces the frame. Without a snapshot
+    directory (argument or TALENT_SNAPSHOT_DIR) the frame is simply built.
+    A file is reused only when its stored format and builder fingerprint
+    match the running code; otherwise it is rebuilt and overwritten.
+    """
+    directory = directory or SNAPSHOT_DIR
+    if not directory:
+        return builder(seed=seed, **params)
+    metadata = snapshot_metadata_for(name, builder, seed, **params)
+    path = snapshot_path(directory, name, seed, schema=metadata["schema"], **params)
+    stored = snapshot_metadata(path) if path.exists() else {}
+    if stored.get("format") != str(SNAPSHOT_FORMAT) or stored.get("schema") != metadata["schema"]:
+        save_snapshot(builder(seed=seed, **params), path, metadata=metadata)
+    return load_snapshot(path, materialize=materialize)
+
+def main():
+    """Pre-build snapshots, e.g. during deployment: python talent_snapshot.py --associates 1000000"""
+    parser = argparse.ArgumentParser(description="Build talent pool snapshots")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR or "snapshots", help="Snapshot directory")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--associates", type=int, default=TOTAL_ASSOCIATES)
+    args = parser.parse_args()
+
+    builds = [
+        ("streamlit_dataset", create_streamlit_dataset, {}),
+        ("associates", generate_associates_data, {"num_associates": args.associates})
+    ]
+    for name, builder, params in builds:
+        start = time.perf_counter()
+        df = builder(seed=args.seed, **params)
+        built = time.perf_counter() - start
+        metadata = snapshot_metadata_for(name, builder, args.seed, **params)
+        path = save_snapshot(df, snapshot_path(args.dir, name, args.seed, schema=metadata["schema"], **params),
+                             metadata=metadata)
+        start = time.perf_counter()
+        loaded = load_snapshot(path)
+        load_ms = (time.perf_counter() - start) * 1000
+        print(f"{path}: {len(loaded):,} rows, {path.stat().st_size / 1e6:.1f} MB, "
+              f"build {built:.2f}s, mmap load {load_ms:.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# Team assembly engine
+# Staffs a TEAM_TEMPLATES role composition with concrete associates from the
+# generate_associates_data pool at minimum Day_Rate_CHF cost. Candidates are
+# pruned through per-role indexes kept sorted by day rate, the cheapest
+# eligible associates are taken per role, and a swap search then meets the
+# delivery model's onshore share at the smallest cost increase
+#
+# Usage: python team_optimizer.py [--associates N] [--template KEY]
+
+import argparse
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from cost_model import DELIVERY_ONSHORE_SHARE, WORKING_DAYS_PER_YEAR
+from enhanced_data_structure import DEFAULT_SEED, SWISS_LOCATIONS, TEAM_TEMPLATES, generate_associates_data
+
+# Availability horizon -> pool column that must be True
+AVAILABILITY_HORIZONS = {
+    "Now": "Available_Now",
+    "1 Week": "Available_1_Week",
+    "1 Month": "Available_1_Month"
+}
+
+# Expertise level -> minimum years of experience
+EXPERIENCE_LEVELS = {
+    "Junior": 0,
+    "Mid-level": 3,
+    "Senior": 8,
+    "Mixed": 0
+}
+
+MEMBER_COLUMNS = ["Associate_ID", "Role", "Location", "Experience_Years", "Day_Rate_CHF", "Available_Now", "Primary_Skills"]
+
+TeamSolution = namedtuple("TeamSolution", ["members", "monthly_cost", "feasible", "issues", "solve_ms"])
+
+def scale_composition(composition, team_size):
+    """Role counts of `composition` rescaled to `team_size` (largest remainder; zero-count roles dropped)"""
+    total = sum(composition.values())
+    quotas = {role: count * team_size / total for role, count in composition.items()}
+    counts = {role: int(quota) for role, quota in quotas.items()}
+    by_remainder = sorted(quotas, key=lambda role: quotas[role] - counts[role], reverse=True)
+    for role in by_remainder[:team_size - sum(counts.values())]:
+        counts[role] += 1
+    return {role: count for role, count in counts.items() if count > 0}
+
+class TeamPool:
+    """Per-role candidate indexes over an associate pool.
+
+    Associates are ordered by (Role, Day_Rate_CHF) once, so each role's
+    candidates are a contiguous, cheapest-first slice; filters only mask that
+    slice. Build once per dataset version and share.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        roles = pd.Categorical(pool["Role"])
+        rates = pool["Day_Rate_CHF"].to_numpy()
+        self.order = np.lexsort((rates, roles.codes))
+        role_codes = roles.codes[self.order]
+        bounds = np.searchsorted(role_codes, np.arange(len(roles.categories) + 1))
+        self.slices = {role: (bounds[code], bounds[code + 1]) for code, role in enumerate(roles.categories)}
+
+        locations = pd.Categorical(pool["Location"])
+        self.locations = list(locations.categories)
+        self.location_codes = locations.codes[self.order]
+        self.rates = rates[self.order]
+        self.experience = pool["Experience_Years"].to_numpy()[self.order]
+        self.onshore = np.isin(locations.codes, [self.locations.index(location) for location in SWISS_LOCATIONS
+                                                 if location in self.locations])[self.order]
+        self.available = {column: pool[column].to_numpy(dtype=bool)[self.order] for column in AVAILABILITY_HORIZONS.values()}
+
+    def candidates(self, role, horizon="1 Month", locations=None, min_experience=0):
+        """Sorted-order positions of the eligible associates of `role`, cheapest first"""
+        start, end = self.slices.get(role, (0, 0))
+        mask = self.available[AVAILABILITY_HORIZONS[horizon]][start:end].copy()
+        if min_experience:
+            mask &= self.experience[start:end] >= min_experience
+        if locations:
+            wanted = [self.locations.index(location) for location in locations if location in self.locations]
+            mask &= np.isin(self.location_codes[start:end], wanted)
+        return start + np.flatnonzero(mask)
+
+    def members(self, positions):
+        """Pool rows for sorted-order positions"""
+        return self.pool.iloc[self.order[positions]][MEMBER_COLUMNS].reset_index(drop=True)
+
+def _onshore_swaps(pool, picks, need):
+    """Cheapest `need` swaps of a chosen offshore member for an unchosen onshore one.
+
+    Within a role the j-th swap costs (j-th cheapest unchosen onshore) minus
+    (j-th dearest chosen offshore), which never decreases with j, so taking
+    the globally cheapest swaps is the minimum-cost way to add `need`
+    onshore members.
+    """
+    deltas, owners = [], []
+    for role, (candidates, taken) in picks.items():
+        chosen, spare = candidates[:taken], candidates[taken:]
+        offshore = chosen[~pool.onshore[chosen]][::-1]
+        onshore = spare[pool.onshore[spare]]
+        swaps = min(len(offshore), len(onshore))
+        deltas.append(pool.rates[onshore[:swaps]] - pool.rates[offshore[:swaps]])
+        owners.append(np.full(swaps, role, dtype=object))
+    deltas = np.concatenate(deltas) if deltas else np.empty(0)
+    owners = np.concatenate(owners) if owners else np.empty(0, dtype=object)
+    if need < len(deltas):
+        cheapest = np.argpartition(deltas, need)[:need]
+        owners = owners[cheapest]
+    return pd.Series(owners, dtype=object).value_counts().to_dict()
+
+def assemble_team(pool, composition, budget=None, horizon="1 Month", locations=None,
+                  min_experience=0, delivery_model=None):
+    """Minimum day-rate team for `composition` (role -> count) from a TeamPool.
+
+    Every member is available within `horizon`, in one of `locations` (any
+    when empty) and has at least `min_experience` years. The delivery model
+    sets a minimum onshore share. `budget` is a monthly CHF cap; constraints
+    that cannot be met are reported in `issues` and the closest team is
+    still returned.
+    """
+    start = time.perf_counter()
+    issues = []
+    picks = {}
+    for role, count in composition.items():
+        candidates = pool.candidates(role, horizon, locations, min_experience)
+        if len(candidates) < count:
+            issues.append(f"{role.replace('_', ' ')}: {len(candidates)} of {count} eligible")
+        picks[role] = (candidates, min(count, len(candidates)))
+
+    # Greedy picks are the cheapest per role; swap in onshore members to meet the share
+    chosen = {role: candidates[:taken] for role, (candidates, taken) in picks.items()}
+    team_size = sum(len(positions) for positions in chosen.values())
+    share = DELIVERY_ONSHORE_SHARE.get(delivery_model, 0.0)
+    need = math.ceil(share * team_size - 1e-9) - sum(int(pool.onshore[positions].sum()) for positions in chosen.values())
+    if need > 0:
+        swaps = _onshore_swaps(pool, picks, need)
+        if sum(swaps.values()) < need:
+            issues.append(f"Onshore share: {need - sum(swaps.values())} more Swiss-based associates needed")
+        for role, swapped in swaps.items():
+            candidates, taken = picks[role]
+            chosen_role = candidates[:taken]
+            offshore = chosen_role[~pool.onshore[chosen_role]]
+            spare = candidates[taken:]
+            keep = np.setdiff1d(chosen_role, offshore[len(offshore) - swapped:])
+            chosen[role] = np.concatenate([keep, spare[pool.onshore[spare]][:swapped]])
+
+    positions = np.concatenate([np.sort(chosen[role]) for role in composition]) if chosen else np.empty(0, dtype=int)
+    monthly_cost = float(pool.rates[positions].sum()) * WORKING_DAYS_PER_YEAR / 12
+    if budget is not None and monthly_cost > budget:
+        issues.append(f"Budget: CHF {monthly_cost:,.0f}/month exceeds CHF {budget:,.0f}")
+    solve_ms = (time.perf_counter() - start) * 1000
+    return TeamSolution(pool.members(positions), monthly_cost, not issues, issues, solve_ms)
+
+def main():
+    """Assemble every template from a generated pool and print solve times"""
+    parser = argparse.ArgumentParser(description="Staff TEAM_TEMPLATES from a generated associate pool")
+    parser.add_argument("--associates", type=int, default=100_000, help="pool size")
+    parser.add_argument("--template", choices=list(TEAM_TEMPLATES), help="only this template")
+    args = parser.parse_args()
+
+    associates = generate_associates_data(args.associates, seed=DEFAULT_SEED)
+    start = time.perf_counter()
+    pool = TeamPool(associates)
+    print(f"Indexed {len(associates):,} associates in {(time.perf_counter() - start) * 1000:.1f}ms")
+    for key in [args.template] if args.template else TEAM_TEMPLATES:
+        template = TEAM_TEMPLATES[key]
+        for model in DELIVERY_ONSHORE_SHARE:
+            solution = assemble_team(pool, template["composition"], template["estimated_monthly_cost_chf"],
+                                     horizon="Now", delivery_model=model)
+            status = "ok" if solution.feasible else "; ".join(solution.issues)
+            print(f"{template['name']:<32} {model:<14} CHF {solution.monthly_cost:>10,.0f}/month "
+                  f"{solution.solve_ms:6.2f}ms  {status}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+# Default job list of the nightly report batch
+#
+# Usage: python -m pytest -q tests
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from batch_reports import staffed_pairs
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset
+
+def test_default_jobs_skip_empty_slices():
+    df = create_streamlit_dataset(DEFAULT_SEED)
+    pairs = staffed_pairs(df)
+    assert pairs
+    for project_type, location in pairs:
+        assert ((df["Project_Type"] == project_type) & (df["Location"] == location)).any()
+    assert len(pairs) == len(df[["Project_Type", "Location"]].drop_duplicates())
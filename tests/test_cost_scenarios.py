@@ -0,0 +1,20 @@
+# Delivery cost scenario sweep against the COST_MODELS data
+#
+# Usage: python -m pytest -q tests
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cost_scenarios import scenario_cost, scenario_grid
+from enhanced_data_structure import COST_MODELS
+
+@pytest.mark.parametrize("model", list(COST_MODELS["delivery_models"]))
+def test_blend_matches_cost_index(model):
+    grid = scenario_grid()
+    monthly, _ = scenario_cost(grid, model, 10, 12)
+    onsite, _ = scenario_cost(grid, "Onsite_Only", 10, 12)
+    assert monthly / onsite == pytest.approx(COST_MODELS["delivery_models"][model]["cost_index"])
@@ -0,0 +1,40 @@
+# Detail table pagination in pdf_report.generate_pdf_report
+#
+# Usage: python -m pytest -q tests
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+from reportlab.platypus import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset
+from pdf_report import DETAIL_COLUMNS, generate_pdf_report
+
+def _detail_draws(monkeypatch, **kwargs):
+    """(page, rows drawn) for every detail table fragment of a 500-row report"""
+    draws = []
+    draw_on = Table.drawOn
+
+    def recording_draw_on(self, canvas, x, y, _sW=0):
+        if self._cellvalues[0][0] == DETAIL_COLUMNS[0][0]:
+            draws.append((canvas.getPageNumber(), len(self._cellvalues)))
+        return draw_on(self, canvas, x, y, _sW)
+
+    monkeypatch.setattr(Table, "drawOn", recording_draw_on)
+    data = pd.concat([create_streamlit_dataset(DEFAULT_SEED)] * 5, ignore_index=True)
+    generate_pdf_report(data, {}, **kwargs)
+    return draws
+
+def test_default_tables_fill_whole_pages(monkeypatch):
+    draws = _detail_draws(monkeypatch)
+    pages = [page for page, _ in draws]
+    assert len(pages) == len(set(pages))
+    assert sum(rows - 1 for _, rows in draws) == 500
+
+def test_split_tables_repeat_the_header(monkeypatch):
+    draws = _detail_draws(monkeypatch, rows_per_table=60)
+    assert len(draws) > 500 // 60 + 1
+    assert sum(rows - 1 for _, rows in draws) == 500
@@ -0,0 +1,59 @@
+# Natural language -> TalentFilter compilation
+# Pins queries whose literal dataset categories must win over the trigger
+# words used by the curated NLP answers
+#
+# Usage: python -m pytest -q tests
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from enhanced_data_structure import DEFAULT_SEED, create_streamlit_dataset
+from intent_matcher import match_intents
+from query_compiler import compile_query, execute_query
+from talent_index import TalentIndex
+
+@pytest.mark.parametrize("query, expected", [
+    ("AWS engineers in Zurich", {"skills": ("AWS",), "roles": ("Engineer",), "locations": ("Zurich",), "project_types": ()}),
+    ("FINMA compliance experts", {"skills": ("FINMA Compliance",), "project_types": ()}),
+    ("German speaking developers", {"skills": ("German Language",), "locations": ()}),
+    ("data analytics project experts", {"skills": (), "project_types": ("Data Analytics",)}),
+    ("data analytics experts", {"skills": ("Data Analytics",), "project_types": ()}),
+    ("API integration developers", {"project_types": ()}),
+    ("css developer", {"project_types": ()}),
+    ("Java developers in Basel", {"skills": ("Java",), "locations": ("Basel",), "project_types": ()}),
+    ("Basel III reporting team", {"locations": (), "project_types": ("Regulatory Compliance",)}),
+    ("CS Integration architects", {"roles": ("Solution Architect",), "project_types": ("CS Integration",)}),
+])
+def test_exact_categories_win_over_synonyms(query, expected):
+    talent_filter = compile_query(query)
+    for field, values in expected.items():
+        assert getattr(talent_filter, field) == values
+
+def test_experience_and_availability():
+    talent_filter = compile_query("Avaloq in Zurich with 5+ years available now")
+    assert talent_filter.skills == ("Avaloq",)
+    assert talent_filter.min_experience == 5
+    assert talent_filter.availability_days == 0
+
+def test_short_terms_take_no_plural():
+    assert "Project_Type" not in match_intents("css developer")
+    assert match_intents("CS developers")["Project_Type"] == ["CS Integration"]
+
+def test_nlp_triggers_unchanged():
+    assert match_intents("German speaking developers") == {"Location": ["Zurich"]}
+    assert match_intents("Basel office") == {"Location": ["Basel"]}
+
+def test_horizon_beyond_tracked_availability_is_clamped():
+    talent_filter = compile_query("Java developers available in 3 months")
+    assert talent_filter.availability_days == 90
+    assert talent_filter.availability_column() == "Available_1_Month"
+
+    result = execute_query(talent_filter, TalentIndex(create_streamlit_dataset(DEFAULT_SEED)))
+    assert result.measure == "Available_1_Month"
+    assert result.available < result.total
+    assert "90" in result.note
+    assert compile_query("Java developers available in 2 weeks").availability_note() is None
@@ -0,0 +1,45 @@
+# Snapshot reuse and invalidation in talent_snapshot.load_or_build
+#
+# Usage: python -m pytest -q tests
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from talent_snapshot import (
+    SNAPSHOT_FORMAT, builder_fingerprint, load_or_build, save_snapshot, snapshot_metadata, snapshot_path
+)
+
+BUILDS = []
+
+def small_frame(seed=0, rows=3):
+    BUILDS.append(seed)
+    return pd.DataFrame({"Count": range(seed, seed + rows)})
+
+def test_snapshot_is_reused(tmp_path):
+    BUILDS.clear()
+    first = load_or_build("small", small_frame, seed=1, directory=tmp_path, rows=3)
+    second = load_or_build("small", small_frame, seed=1, directory=tmp_path, rows=3)
+    assert BUILDS == [1]
+    assert second["Count"].tolist() == first["Count"].tolist() == [1, 2, 3]
+
+def test_path_and_metadata_carry_builder_fingerprint(tmp_path):
+    load_or_build("small", small_frame, seed=1, directory=tmp_path, rows=3)
+    schema = builder_fingerprint(small_frame)
+    path = snapshot_path(tmp_path, "small", 1, schema=schema, rows=3)
+    assert schema in path.name
+    metadata = snapshot_metadata(path)
+    assert metadata["schema"] == schema
+    assert metadata["format"] == str(SNAPSHOT_FORMAT)
+
+def test_stale_snapshot_is_rebuilt(tmp_path):
+    BUILDS.clear()
+    path = snapshot_path(tmp_path, "small", 1, schema=builder_fingerprint(small_frame), rows=3)
+    save_snapshot(pd.DataFrame({"Count": [99]}), path, metadata={"name": "small", "seed": 1, "format": 0})
+    df = load_or_build("small", small_frame, seed=1, directory=tmp_path, rows=3)
+    assert BUILDS == [1]
+    assert df["Count"].tolist() == [1, 2, 3]
+    assert snapshot_metadata(path)["format"] == str(SNAPSHOT_FORMAT)